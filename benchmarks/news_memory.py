@@ -0,0 +1,77 @@
+"""Measure the memory cost of holding many news items.
+
+Compares the previous dict-backed NewsItem layout with the slotted, interned
+NewsItem and the tuple-backed NewsBatch. Run with:
+
+    python -m benchmarks.news_memory [count]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from f1_news.models import NewsBatch, NewsItem
+
+SOURCES = ["Autosport", "Motorsport.com", "The Race", "RaceFans", "PlanetF1"]
+
+
+@dataclass
+class LegacyNewsItem:
+    """The NewsItem layout before slots, interning and tuple tags."""
+    title: str
+    content: str
+    url: str
+    source: str
+    author: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    tags: Optional[list] = None
+    _text: Optional[str] = None
+    _folded_title: Optional[str] = None
+    _folded_text: Optional[str] = None
+
+    def __post_init__(self):
+        if self.tags is None:
+            self.tags = []
+
+
+def fields(count):
+    """Yield item fields the way a feed parser produces them, one fresh string per entry."""
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield dict(
+            title=f"Headline number {i}",
+            content=f"<p>Article body {i}</p>",
+            url=f"https://example.com/news/{i}",
+            # Each parsed entry carries its own copy of the feed name
+            source="".join(SOURCES[i % len(SOURCES)]),
+            timestamp=start + timedelta(minutes=i),
+        )
+
+
+def measure(build, count):
+    """Return the bytes per item still held once ``build`` has consumed the feed."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(fields(count))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cases = [
+        ("dataclass (before)", lambda rows: [LegacyNewsItem(**row) for row in rows]),
+        ("slotted NewsItem", lambda rows: [NewsItem(**row) for row in rows]),
+        ("NewsBatch", lambda rows: NewsBatch(NewsItem(**row) for row in rows)),
+    ]
+    print(f"{count} items, retained bytes per item")
+    for name, build in cases:
+        print(f"  {name:<20} {measure(build, count):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Time and peak memory of each processing stage on synthetic, offline inputs.
+
+Stages cover feed parsing, filtering, keyword extraction, rendering and the
+OpenF1 results aggregation. Run with:
+
+    python -m benchmarks.suite [--entries N] [--drivers N] [--laps N]
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json [--threshold 1.25]
+
+``--compare`` exits with status 1 when a stage is slower, or peaks higher,
+than the baseline by more than the threshold factor. Timings only compare
+meaningfully on the same machine.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from f1_news.filters import NewsFilter
+from f1_news.formatters import (JSONFormatter, MarkdownFormatter, NDJSONFormatter, PlainFormatter,
+                                extract_keywords)
+from f1_news.keywords import KeywordExtractor
+from f1_news.laps import LapTable
+from f1_news.sources import RaceResultSource, RSSSource
+from f1_news.synthetic import FakeOpenF1, FixedFeedCache, openf1_session, rss_feed
+
+
+def keywords_batch(news_items):
+    """Fit one extractor on the batch and extract for every item, as JSON output does."""
+    extractor = KeywordExtractor(news_items)
+    return [extractor.extract(item) for item in news_items]
+
+
+def build_stages(entries: int, drivers: int, laps: int) -> List[Tuple[str, Callable[[], object]]]:
+    """(name, zero-argument callable) for every stage, inputs generated up front."""
+    feeds = {key: rss_feed(entries // 5, seed) for seed, key in enumerate(RSSSource().rss_feeds)}
+    rss = RSSSource(feed_cache=FixedFeedCache(feeds))
+    news_items = list(rss.iter_news())
+    payloads = openf1_session(drivers, laps)
+    results_source = RaceResultSource(FakeOpenF1(payloads))
+
+    def render(formatter):
+        return lambda: formatter.format_news(news_items, file=io.StringIO())
+
+    return [
+        ("parse_rss", lambda: list(rss.iter_news())),
+        ("filter_team", lambda: list(NewsFilter().filter_stream(news_items, team="ferrari"))),
+        ("filter_all", lambda: list(NewsFilter().filter_stream(news_items, team="mclaren", driver="norris",
+                                                               keyword="upgrade"))),
+        ("extract_keywords", lambda: [extract_keywords(item.text) for item in news_items]),
+        ("keywords_batch", lambda: keywords_batch(news_items)),
+        ("render_json", render(JSONFormatter())),
+        ("render_ndjson", render(NDJSONFormatter())),
+        ("render_plain", render(PlainFormatter())),
+        ("render_markdown", render(MarkdownFormatter())),
+        ("lap_table", lambda: LapTable.from_laps(payloads['laps']).stints()),
+        ("fetch_latest_results", lambda: results_source.fetch_latest_results('race')),
+    ]
+
+
+def measure(stage: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Best wall time over ``repeat`` runs, then peak traced memory from one more run."""
+    timings = []
+    # Progress messages from the sources would otherwise interleave with the report
+    with contextlib.redirect_stderr(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            stage()
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        stage()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Describe every stage that regressed past ``threshold`` times its baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if previous[metric] and current[metric] > previous[metric] * threshold:
+                regressions.append(f"{name}: {metric} {previous[metric]:.6g} -> {current[metric]:.6g} "
+                                   f"({current[metric] / previous[metric]:.2f}x)")
+    return regressions
+
+
+def run(entries: int = 1000, drivers: int = 20, laps: int = 70, repeat: int = 5,
+        only: List[str] = ()) -> Dict[str, dict]:
+    """Measure every stage (or those named in ``only``) and return metrics by stage name."""
+    results = {}
+    for name, stage in build_stages(entries, drivers, laps):
+        if not only or name in only:
+            results[name] = measure(stage, repeat)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000, help="news entries across all synthetic feeds")
+    parser.add_argument("--drivers", type=int, default=20, help="drivers in the synthetic session")
+    parser.add_argument("--laps", type=int, default=70, help="laps per driver in the synthetic session")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage (best is reported)")
+    parser.add_argument("--stage", action="append", default=[], help="only run this stage (repeatable)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="flag regressions against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown factor counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.entries, args.drivers, args.laps, args.repeat, args.stage)
+    print(f"{args.entries} entries, {args.drivers} drivers x {args.laps} laps")
+    print(f"  {'stage':<22} {'time (ms)':>10} {'peak (KiB)':>11}")
+    for name, metrics in results.items():
+        print(f"  {name:<22} {metrics['seconds'] * 1000:10.2f} {metrics['peak_bytes'] / 1024:11.1f}")
+
+    params = {"entries": args.entries, "drivers": args.drivers, "laps": args.laps}
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"params": params, "stages": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["params"] != params:
+            print(f"Warning: baseline was measured with {baseline['params']}", file=sys.stderr)
+        regressions = compare(results, baseline["stages"], args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import heapq
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Protocol
+
+from .models import NewsItem
+from .sources import RSSSource, RedditSource, TwitterSource
+from .tracing import span
+
+# Seconds a source may take to deliver its first item before the merge goes on without it
+DEFAULT_TIMEOUT = 30.0
+
+# Sources used when the config does not mention them
+DEFAULT_ENABLED = ('rss',)
+
+_END = object()
+
+
+class NewsSource(Protocol):
+    """What the aggregator needs from a source of news."""
+
+    def iter_news(self, seen=None, since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Yield items newest first, skipping links in ``seen`` and items published before ``since``."""
+
+
+@dataclass
+class SourceBudget:
+    timeout: float = DEFAULT_TIMEOUT
+    # Most items taken from the source, or None for all of them
+    max_items: Optional[int] = None
+
+
+def _twitter(config, http=None) -> TwitterSource:
+    settings = config.twitter_config
+    return TwitterSource(settings.get('bearer_token', ''), http=http,
+                         **{key: settings[key] for key in ('query', 'max_results') if key in settings})
+
+
+def _reddit(config, http=None) -> RedditSource:
+    settings = config.reddit_config
+    return RedditSource(http=http, **{key: settings[key] for key in ('subreddit', 'user_agent', 'limit')
+                                      if key in settings})
+
+
+# Factories building each source from the Config and an optional shared HTTP session
+SOURCES: Dict[str, Callable[..., NewsSource]] = {
+    'rss': lambda config, http=None: RSSSource(http),
+    'twitter': _twitter,
+    'reddit': _reddit,
+}
+
+
+def register_source(name: str, factory: Callable[..., NewsSource]):
+    """Make a source available to enable in the config as ``sources.<name>.enabled``."""
+    SOURCES[name] = factory
+
+
+def enabled_sources(config) -> List[str]:
+    """Names of the registered sources the config enables, in registration order."""
+    return [name for name in SOURCES
+            if (config.get(f'sources.{name}') or {}).get('enabled', name in DEFAULT_ENABLED)]
+
+
+class Aggregator:
+    """Merge the newest-first streams of several news sources into one.
+
+    Every source starts on its own thread and has ``timeout`` seconds (its
+    budget) to deliver a first item, which is when its network fetch is
+    done; a source that fails or runs out of time is left out with a
+    warning. The streams are then merged lazily with a k-way heap merge, so
+    items are only built as the consumer pulls them, and a source stops
+    after ``max_items``.
+    """
+
+    def __init__(self, sources: Dict[str, NewsSource], budgets: Optional[Dict[str, SourceBudget]] = None):
+        self.sources = sources
+        self.budgets = budgets or {}
+
+    @classmethod
+    def from_config(cls, config, http=None, **prebuilt: NewsSource) -> 'Aggregator':
+        """Every source the config enables, each built by its factory unless passed by name in ``prebuilt``."""
+        sources = {}
+        budgets = {}
+        for name in enabled_sources(config):
+            settings = config.get(f'sources.{name}') or {}
+            sources[name] = prebuilt[name] if name in prebuilt else SOURCES[name](config, http)
+            budgets[name] = SourceBudget(settings.get('timeout', DEFAULT_TIMEOUT), settings.get('max_items'))
+        return cls(sources, budgets)
+
+    def fetch_news(self, limit: int = 10) -> List[NewsItem]:
+        return list(islice(self.iter_news(), limit))
+
+    def iter_news(self, seen=None, since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Start every source now and return their merged stream, newest first."""
+        start = time.monotonic()
+        streams = []
+        for name, source in self.sources.items():
+            budget = self.budgets.get(name) or SourceBudget()
+            heads = queue.Queue(1)
+            threading.Thread(target=self._open, args=(name, source, budget, seen, since, heads),
+                             name=f"f1-news-{name}", daemon=True).start()
+            streams.append(self._stream(name, heads, start + budget.timeout, budget.timeout))
+        if len(streams) == 1:
+            # Nothing to merge with
+            return streams[0]
+        return heapq.merge(*streams, key=lambda item: item.timestamp or datetime.min, reverse=True)
+
+    @staticmethod
+    def _open(name: str, source: NewsSource, budget: SourceBudget, seen, since, heads: queue.Queue):
+        """Open a source's stream and read its first item, the part that waits on the network."""
+        try:
+            with span('open_source', 'news', source=name):
+                stream = source.iter_news(seen=seen, since=since)
+                if budget.max_items is not None:
+                    stream = islice(stream, budget.max_items)
+                heads.put((stream, next(stream, _END), None))
+        except Exception as e:
+            heads.put((None, _END, e))
+
+    @staticmethod
+    def _stream(name: str, heads: queue.Queue, deadline: float, timeout: float) -> Iterator[NewsItem]:
+        try:
+            stream, first, error = heads.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            print(f"Warning: news source {name} delivered nothing within its {timeout:g}s budget", file=sys.stderr)
+            return
+        if error is not None:
+            print(f"Warning: news source {name} failed: {error}", file=sys.stderr)
+            return
+        if first is _END:
+            return
+        yield first
+        try:
+            yield from stream
+        except Exception as e:
+            print(f"Warning: news source {name} failed: {e}", file=sys.stderr)
@@ -0,0 +1,214 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .htmltext import html_to_text
+from .models import NewsItem
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    -- The content as plain text, which is what gets indexed
+    text TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL,
+    author TEXT,
+    timestamp TEXT,
+    tags TEXT NOT NULL,
+    -- Publication time as a UTC epoch, or the time first archived when the feed gave none
+    published REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, text, content='articles', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, text) VALUES (new.id, new.title, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, text) VALUES ('delete', old.id, old.title, old.text);
+END;
+"""
+
+# Archives written before the text column indexed raw HTML; their index is rebuilt from plain text
+MIGRATE_TO_TEXT = """
+ALTER TABLE articles ADD COLUMN text TEXT NOT NULL DEFAULT '';
+DROP TRIGGER IF EXISTS articles_ai;
+DROP TRIGGER IF EXISTS articles_ad;
+DROP TABLE IF EXISTS articles_fts;
+"""
+
+
+def default_archive_path() -> Path:
+    """Archive database: $F1_NEWS_ARCHIVE or ~/.f1-news/archive.db."""
+    return Path(os.environ.get('F1_NEWS_ARCHIVE') or Path.home() / '.f1-news' / 'archive.db')
+
+
+def epoch(moment: datetime) -> float:
+    """Seconds since the epoch, reading naive datetimes (as feeds give them) as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def match_expression(query: str) -> str:
+    """An FTS5 query matching every term, with each term quoted so punctuation is not syntax.
+
+    A trailing ``*`` on a term is kept as a prefix match.
+    """
+    terms = []
+    for term in query.split():
+        prefix = term.endswith('*')
+        term = term.rstrip('*').replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ('*' if prefix else ''))
+    return " ".join(terms)
+
+
+class NewsArchive:
+    """Every news item ever fetched, in SQLite with a full-text index.
+
+    Items are keyed by URL, so archiving the same feed twice adds nothing.
+    Searches page by keyset on (published, id): each page hands back a
+    cursor for the next, so deep pages cost the same as the first.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or default_archive_path())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared with the daemon's refresh thread, so access is serialized by a lock instead
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(articles)")}
+            migrate = columns and 'text' not in columns
+            if migrate:
+                self._db.executescript(MIGRATE_TO_TEXT)
+                rows = self._db.execute("SELECT id, content FROM articles").fetchall()
+                self._db.executemany("UPDATE articles SET text = ? WHERE id = ?",
+                                     [(html_to_text(content), row_id) for row_id, content in rows])
+            self._db.executescript(SCHEMA)
+            if migrate:
+                self._db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+    def add(self, items: Iterable[NewsItem]) -> int:
+        """Archive news items, skipping URLs already present; return how many were new."""
+        now = time.time()
+        rows = [
+            (item.url, item.title, item.content or '', item.text, item.source, item.author,
+             item.timestamp.isoformat() if item.timestamp else None, json.dumps(list(item.tags)),
+             epoch(item.timestamp) if item.timestamp else now)
+            for item in items
+        ]
+        with self._lock, self._db:
+            # rowcount sums the rows each insert added, leaving out ignored duplicates and the FTS trigger
+            return self._db.executemany(
+                "INSERT OR IGNORE INTO articles "
+                "(url, title, content, text, source, author, timestamp, tags, published) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows).rowcount
+
+    def search(self, query: Optional[str] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, limit: int = 20,
+               cursor: Optional[str] = None) -> Tuple[List[NewsItem], Optional[str]]:
+        """Newest-first articles matching ``query`` published in [since, until).
+
+        Returns one page and the cursor for the next page, or None on the last.
+        """
+        conditions, params = [], []
+        if query and match_expression(query):
+            conditions.append("articles.id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(match_expression(query))
+        if since:
+            conditions.append("published >= ?")
+            params.append(epoch(since))
+        if until:
+            conditions.append("published < ?")
+            params.append(epoch(until))
+        if cursor:
+            published, row_id = cursor.split(':')
+            conditions.append("(published, id) < (?, ?)")
+            params.extend([float(published), int(row_id)])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, published, title, content, url, source, author, timestamp, tags FROM articles "
+                f"{where} ORDER BY published DESC, id DESC LIMIT ?", params + [limit + 1]).fetchall()
+
+        next_cursor = f"{rows[limit - 1][1]!r}:{rows[limit - 1][0]}" if len(rows) > limit else None
+        return [self._row_to_item(row) for row in rows[:limit]], next_cursor
+
+    @staticmethod
+    def _row_to_item(row) -> NewsItem:
+        _, _, title, content, url, source, author, timestamp, tags = row
+        return NewsItem(title=title, content=content, url=url, source=source, author=author,
+                        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+                        tags=json.loads(tags))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def on_refresh(self, kind, session_type, previous, current):
+        """NewsService listener archiving each news snapshot."""
+        if kind == 'news':
+            self.add(current)
+
+    def close(self):
+        self._db.close()
+
+
+class ArchiveWriter:
+    """Archive a lazy news stream without making its consumer wait.
+
+    ``tap`` passes items straight through and ``finish`` archives them once
+    output is done, so the stream stays lazy. Sources that parse more than
+    the pipeline pulls, such as whole RSS feeds, hand it over with
+    ``collect``. The daemon and HTTP server archive every refresh.
+    """
+
+    def __init__(self, archive: NewsArchive):
+        self.archive = archive
+        self._seen: List[NewsItem] = []
+        self._lock = threading.Lock()
+
+    def tap(self, news_items: Iterable[NewsItem]) -> Iterator[NewsItem]:
+        for item in news_items:
+            with self._lock:
+                self._seen.append(item)
+            yield item
+
+    def collect(self, news_items: Iterable[NewsItem]):
+        """Archive items whether or not the pipeline ever pulls them."""
+        with self._lock:
+            self._seen.extend(news_items)
+
+    def finish(self) -> int:
+        """Archive the items seen so far; return how many were new."""
+        with self._lock:
+            news_items, self._seen = self._seen, []
+        try:
+            return self.archive.add(news_items)
+        except Exception as e:
+            print(f"Warning: could not archive news: {e}", file=sys.stderr)
+            return 0
+
+
+def open_archive() -> Optional[NewsArchive]:
+    """The news archive, or None when F1_NEWS_NO_ARCHIVE is set or it cannot be opened."""
+    if os.environ.get('F1_NEWS_NO_ARCHIVE'):
+        return None
+    try:
+        return NewsArchive()
+    except sqlite3.Error as e:
+        print(f"Warning: news archive unavailable: {e}", file=sys.stderr)
+        return None
@@ -2,6 +2,7 @@ import json
 import time
 from pathlib import Path
 from typing import Any, Optional
+from .metrics import CACHE_LOOKUPS
 
 
 class Cache:
@@ -18,8 +19,11 @@ class Cache:
     def get(self, key: str, max_age: int = 300) -> Optional[Any]:
         """Get value from cache if not expired."""
         cache_file = self._get_cache_file(key)
+        # Counted per kind of entry: feed_*, openf1_*, prefetch_state...
+        cache_name = key.split('_', 1)[0]
         
         if not cache_file.exists():
+            CACHE_LOOKUPS.inc(cache=cache_name, result='miss')
             return None
         
         try:
@@ -29,14 +33,17 @@ class Cache:
             # Check if cache is expired
             if time.time() - cache_data['timestamp'] > max_age:
                 cache_file.unlink()  # Delete expired cache
+                CACHE_LOOKUPS.inc(cache=cache_name, result='expired')
                 return None
             
+            CACHE_LOOKUPS.inc(cache=cache_name, result='hit')
             return cache_data['data']
             
         except (json.JSONDecodeError, KeyError, OSError):
             # Invalid cache file, remove it
             if cache_file.exists():
                 cache_file.unlink()
+            CACHE_LOOKUPS.inc(cache=cache_name, result='miss')
             return None
     
     def set(self, key: str, value: Any):
@@ -1,148 +1,463 @@
+import json
+import sys
 import click
-from rich.console import Console
-from rich.table import Table
+from itertools import chain
+from pathlib import Path
 from .sources import RSSSource, RaceResultSource
-from .models import NewsItem
+from .aggregator import SOURCES, Aggregator, enabled_sources
 from .filters import NewsFilter
-from .formatters import TerminalFormatter, JSONFormatter, MarkdownFormatter, ResultFormatter
+from .config import Config
+from .service import DEFAULT_MAX_AGE, rank_news
+from .prefetch import FeedCache
+from .seen import SeenSet
+from .memprofile import checkpoint, checkpoint_after
+from .tracing import disable as disable_tracing, enable as enable_tracing, span, traced
+from .export import BINARY_FORMATS, COLUMNAR_FORMATS
+from .formatters import (TerminalFormatter, PlainFormatter, JSONFormatter, NDJSONFormatter,
+                         MarkdownFormatter, ResultFormatter, ResultJSONFormatter, PaceFormatter, NEWS_FIELDS,
+                         get_console)
 
-console = Console()
+# Subcommand modules are imported inside their commands so --help and fetch skip sqlite3, http.server and socketserver
 
 
-def fetch_news_logic(output_format, limit, team, driver, keyword):
-    """Core logic for fetching F1 news."""
-    rss = RSSSource()
+class _LazyConsole:
+    """Stand-in for a Rich console that only imports Rich when first printed to."""
     
-    console.print("[bold blue]Fetching F1 news from all sources...[/bold blue]")
-    news_items = []
-    fetch_limit = limit * 3 if any([team, driver, keyword]) else limit
-    news_items.extend(rss.fetch_news(limit=fetch_limit))
+    def __init__(self, stderr=False):
+        self._stderr = stderr
     
-    # Apply filters if specified
-    if any([team, driver, keyword]):
-        news_filter = NewsFilter()
-        
-        if team:
-            console.print(f"[dim]Filtering by team: {team}[/dim]")
-            news_items = news_filter.filter_by_team(news_items, team)
+    def __getattr__(self, name):
+        return getattr(get_console(self._stderr), name)
+
+
+console = _LazyConsole()
+# Progress and error messages go to stderr so stdout stays clean for piping
+err_console = _LazyConsole(stderr=True)
+
+
+def connect_daemon():
+    """A client for the running daemon, or None to work locally."""
+    from .daemon import connect
+    
+    return connect()
+
+
+def parse_fields(ctx, param, value):
+    """Validate a comma-separated --fields list."""
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in NEWS_FIELDS]
+    if unknown:
+        raise click.BadParameter(
+            f"unknown field(s) {', '.join(unknown)}; choose from {', '.join(NEWS_FIELDS)}")
+    return fields
+
+
+def check_output_options(output_format, output):
+    """Fail early when a columnar format cannot be written."""
+    if output_format in BINARY_FORMATS:
+        if output is None:
+            raise click.UsageError(f"--format {output_format} needs --output FILE")
+        from .export import require_pyarrow
         
-        if driver:
-            console.print(f"[dim]Filtering by driver: {driver}[/dim]")
-            news_items = news_filter.filter_by_driver(news_items, driver)
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            raise click.UsageError(str(e))
+
+
+def get_news_formatter(output_format, fields=None, plain=False, output=None):
+    """Return the formatter for an output format.
+    
+    Terminal output falls back to the plain renderer when requested or when
+    stdout is not a TTY, where Rich panels would only be wasted work.
+    """
+    if output_format == 'terminal':
+        if plain or not sys.stdout.isatty():
+            return PlainFormatter()
+        return TerminalFormatter()
+    elif output_format == 'json':
+        return JSONFormatter(fields=fields)
+    elif output_format == 'ndjson':
+        return NDJSONFormatter(fields=fields)
+    elif output_format in COLUMNAR_FORMATS:
+        from .export import ColumnarFormatter
         
-        if keyword:
-            console.print(f"[dim]Filtering by keyword: {keyword}[/dim]")
-            news_items = news_filter.filter_by_keyword(news_items, keyword)
+        return ColumnarFormatter(output_format, output, fields)
+    else:
+        return MarkdownFormatter()
+
+
+def forwarded_news(limit, team, driver, keyword, sort):
+    """News served by the running daemon, or None to fetch locally."""
+    client = connect_daemon()
+    if client is None:
+        return None
+    
+    from .daemon import DaemonError
+    
+    try:
+        with span('daemon_request', 'daemon'):
+            return client.news(limit, team, driver, keyword, sort)
+    except (OSError, DaemonError) as e:
+        err_console.print(f"[dim]Daemon unavailable ({e}), fetching directly[/dim]")
+        return None
+
+
+def stream_news(output_format, limit, team, driver, keyword, sort='time', fields=None, plain=False,
+                output=None, new_only=False, since=None):
+    """Run the fetch -> filter -> rank -> format pipeline over a lazy news stream.
+    
+    When a daemon is running the already-filtered items come from its warm
+    snapshot. Otherwise feed entries are only parsed and filtered until
+    ``limit`` matches have been handed to the formatter.
+    
+    With ``new_only`` entries delivered by an earlier run are skipped before
+    they are parsed, and every entry this run delivers is remembered once
+    the output has been written.
+    """
+    if team:
+        err_console.print(f"[dim]Filtering by team: {team}[/dim]")
+    if driver:
+        err_console.print(f"[dim]Filtering by driver: {driver}[/dim]")
+    if keyword:
+        err_console.print(f"[dim]Filtering by keyword: {keyword}[/dim]")
+    
+    archive_writer = None
+    seen = SeenSet() if new_only else None
+    # The daemon keeps no per-client state, so incremental runs read the feeds themselves
+    news_items = None if new_only or since else forwarded_news(limit, team, driver, keyword, sort)
+    if news_items is None:
+        from .archive import ArchiveWriter, open_archive
         
-        # Deduplicate results
-        news_items = news_filter.deduplicate(news_items)
+        # Every parsed feed entry goes into the archive, including ones --since, the filters or --limit leave out
+        archive = open_archive()
+        if archive is not None:
+            archive_writer = ArchiveWriter(archive)
+        sources = Aggregator.from_config(Config(), rss=RSSSource(feed_cache=FeedCache(), archive=archive_writer))
+        news_items = traced('read_feeds', sources.iter_news(seen=seen, since=since))
+        if archive_writer is not None:
+            # Other sources' items are archived as the pipeline pulls them
+            news_items = archive_writer.tap(news_items)
         
-        if not news_items:
-            console.print("[yellow]No news items found matching your filters.[/yellow]")
-            return
+        # Apply filters if specified
+        if any([team, driver, keyword]):
+            news_items = traced('filter', NewsFilter().filter_stream(news_items, team, driver, keyword))
+        news_items = traced('rank', rank_news(news_items, sort, limit, team, driver, keyword))
+        news_items = checkpoint_after('filter', news_items)
+        if seen is not None:
+            # Only what reaches the formatter counts as delivered; dropped or unranked entries stay new
+            news_items = seen.mark(news_items)
+    news_items = iter(news_items)
+    
+    try:
+        if any([team, driver, keyword, new_only, since]):
+            # Peek at the first match so an empty result can be reported up front
+            first_item = next(news_items, None)
+            if first_item is None:
+                if any([team, driver, keyword]):
+                    err_console.print("[yellow]No news items found matching your filters.[/yellow]")
+                else:
+                    err_console.print("[yellow]No new news items.[/yellow]")
+                if seen is not None:
+                    seen.save()
+                return
+            news_items = chain([first_item], news_items)
         
-        console.print(f"[green]Found {len(news_items)} matching news items[/green]")
+        # Format and display results
+        formatter = get_news_formatter(output_format, fields, plain, output)
+        with span('format', format=output_format):
+            formatter.format_news(news_items)
+        checkpoint('format')
+        if seen is not None:
+            seen.save()
+    finally:
+        if archive_writer is not None:
+            with span('archive'):
+                archive_writer.finish()
+            archive_writer.archive.close()
+
+
+def fetch_news_logic(output_format, limit, team, driver, keyword, sort='time', fields=None, plain=False,
+                     output=None, new_only=False, since=None):
+    """Core logic for fetching F1 news."""
+    check_output_options(output_format, output)
+    err_console.print("[bold blue]Fetching F1 news from all sources...[/bold blue]")
+    stream_news(output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since)
+
+
+def report_trace(tracer, timings, trace_file):
+    """Stop tracing, then print the per-stage timing table and/or write the Chrome trace."""
+    disable_tracing()
+    if trace_file:
+        tracer.write_chrome_trace(trace_file)
+        err_console.print(f"[dim]Trace written to {trace_file}[/dim]")
+    if not timings:
+        return
     
-    # Format and display results
-    if output_format == 'terminal':
-        formatter = TerminalFormatter()
-    elif output_format == 'json':
-        formatter = JSONFormatter()
-    else:
-        formatter = MarkdownFormatter()
+    from rich.table import Table
+    
+    table = Table(title=f"Timings ({tracer.elapsed() * 1000:.1f} ms wall)")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Self ms", justify="right", style="bold")
+    table.add_column("Longest ms", justify="right")
+    for stage in tracer.summary():
+        table.add_row(stage.name, str(stage.calls), f"{stage.total * 1000:.1f}",
+                      f"{stage.self_time * 1000:.1f}", f"{stage.longest * 1000:.1f}")
+    err_console.print(table)
+
+
+def report_memory(profiler):
+    """Stop tracing allocations, then print each stage's memory and top allocation sites."""
+    from rich.table import Table
+    
+    from .memprofile import disable
+    
+    disable()
+    
+    mib = 1024 * 1024
+    table = Table(title=f"Memory (peak {profiler.peak / mib:.1f} MiB)")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Current MiB", justify="right")
+    table.add_column("Peak MiB", justify="right", style="bold")
+    table.add_column("Growth MiB", justify="right")
+    for stage in profiler.stages:
+        table.add_row(stage.name, f"{stage.current / mib:.2f}", f"{stage.peak / mib:.2f}", f"{stage.growth / mib:+.2f}")
+    err_console.print(table)
+    for stage in profiler.stages:
+        if stage.top_sites:
+            err_console.print(f"[cyan]{stage.name}[/cyan] top allocation sites:")
+            for site in stage.top_sites:
+                err_console.print(f"  {site.size / 1024:10.1f} KiB {site.count:+7d} blocks  {site.location}",
+                                  markup=False, highlight=False)
+
+
+def write_metrics(metrics_file):
+    """Write this run's metrics, without failing the command if the file cannot be written."""
+    from .metrics import REGISTRY
+    
+    try:
+        REGISTRY.write_textfile(metrics_file)
+    except OSError as e:
+        err_console.print(f"[red]Error writing metrics to {metrics_file}: {e}[/red]")
+
+
+def start_metrics_server(metrics_port):
+    """Serve /metrics for a long-running command, if a port was given."""
+    if metrics_port is None:
+        return
     
-    formatter.format_news(news_items[:limit])
+    from .metrics import serve_metrics
+    
+    try:
+        serve_metrics(metrics_port)
+    except OSError as e:
+        raise click.UsageError(f"cannot serve metrics on port {metrics_port}: {e}")
+    err_console.print(f"[dim]Metrics at http://127.0.0.1:{metrics_port}/metrics[/dim]")
 
 
 @click.group(invoke_without_command=True)
-@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json', 'markdown']),
+@click.option('--format', 'output_format',
+              type=click.Choice(['terminal', 'json', 'ndjson', 'markdown'] + COLUMNAR_FORMATS),
               default='terminal', help='Output format')
 @click.option('--limit', default=10, help='Maximum number of news items to fetch')
 @click.option('--team', help='Filter by F1 team')
 @click.option('--driver', help='Filter by F1 driver')
 @click.option('--keyword', help='Filter by custom keyword')
+@click.option('--sort', type=click.Choice(['time', 'relevance']), default='time',
+              help='Order results by recency or by BM25 relevance to the filters')
+@click.option('--fields', callback=parse_fields,
+              help='Comma-separated fields to include in json/ndjson output (e.g. title,url,timestamp)')
+@click.option('--plain', is_flag=True, help='Plain-text terminal output (default when stdout is not a TTY)')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write csv/parquet/arrow output to this file')
+@click.option('--new-only', is_flag=True, help='Only entries not delivered by an earlier --new-only run')
+@click.option('--since', type=click.DateTime(), help='Only entries published at or after this time (UTC)')
+@click.option('--timings', is_flag=True, help='Print time spent in each stage (fetch, parse, filter, format...)')
+@click.option('--trace-file', type=click.Path(dir_okay=False),
+              help='Write a Chrome trace (chrome://tracing, Perfetto) of every stage to this file')
+@click.option('--memprofile', is_flag=True,
+              help='Trace allocations and print peak memory and top allocation sites for each stage')
+@click.option('--metrics-file', type=click.Path(dir_okay=False), envvar='F1_NEWS_METRICS_FILE',
+              help='Write OpenMetrics counters for this run to this file, e.g. for a textfile collector '
+                   '(default: $F1_NEWS_METRICS_FILE)')
 @click.version_option()
 @click.pass_context
-def main(ctx, output_format, limit, team, driver, keyword):
+def main(ctx, output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since,
+         timings, trace_file, memprofile, metrics_file):
     """F1 News CLI - Fetch the latest F1 news from social media."""
+    if timings or trace_file:
+        tracer = enable_tracing()
+        ctx.call_on_close(lambda: report_trace(tracer, timings, trace_file))
+    if memprofile:
+        from .memprofile import enable
+        
+        profiler = enable()
+        ctx.call_on_close(lambda: report_memory(profiler))
+    if metrics_file:
+        ctx.call_on_close(lambda: write_metrics(metrics_file))
+    
     if ctx.invoked_subcommand is None:
         # No subcommand provided, so run fetch by default
-        fetch_news_logic(output_format, limit, team, driver, keyword)
+        fetch_news_logic(output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since)
 
 
 @main.command()
-@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json', 'markdown']),
+@click.option('--format', 'output_format',
+              type=click.Choice(['terminal', 'json', 'ndjson', 'markdown'] + COLUMNAR_FORMATS),
               default='terminal', help='Output format')
 @click.option('--limit', default=10, help='Maximum number of news items to fetch')
 @click.option('--team', help='Filter by F1 team')
 @click.option('--driver', help='Filter by F1 driver')
 @click.option('--keyword', help='Filter by custom keyword')
-def fetch(output_format, limit, team, driver, keyword):
+@click.option('--sort', type=click.Choice(['time', 'relevance']), default='time',
+              help='Order results by recency or by BM25 relevance to the filters')
+@click.option('--fields', callback=parse_fields,
+              help='Comma-separated fields to include in json/ndjson output (e.g. title,url,timestamp)')
+@click.option('--plain', is_flag=True, help='Plain-text terminal output (default when stdout is not a TTY)')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write csv/parquet/arrow output to this file')
+@click.option('--new-only', is_flag=True, help='Only entries not delivered by an earlier --new-only run')
+@click.option('--since', type=click.DateTime(), help='Only entries published at or after this time (UTC)')
+def fetch(output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since):
     """Fetch the latest F1 news."""
-    fetch_news_logic(output_format, limit, team, driver, keyword)
+    fetch_news_logic(output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since)
 
 
 @main.command()
 @click.option('--team', help='Filter by F1 team')
 @click.option('--driver', help='Filter by F1 driver')
 @click.option('--keyword', help='Filter by custom keyword')
-@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json', 'markdown']),
+@click.option('--format', 'output_format',
+              type=click.Choice(['terminal', 'json', 'ndjson', 'markdown'] + COLUMNAR_FORMATS),
               default='terminal', help='Output format')
 @click.option('--limit', default=10, help='Maximum number of news items to fetch')
-def filter(team, driver, keyword, output_format, limit):
+@click.option('--sort', type=click.Choice(['time', 'relevance']), default='time',
+              help='Order results by recency or by BM25 relevance to the filters')
+@click.option('--fields', callback=parse_fields,
+              help='Comma-separated fields to include in json/ndjson output (e.g. title,url,timestamp)')
+@click.option('--plain', is_flag=True, help='Plain-text terminal output (default when stdout is not a TTY)')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write csv/parquet/arrow output to this file')
+@click.option('--new-only', is_flag=True, help='Only entries not delivered by an earlier --new-only run')
+@click.option('--since', type=click.DateTime(), help='Only entries published at or after this time (UTC)')
+def filter(team, driver, keyword, output_format, limit, sort, fields, plain, output, new_only, since):
     """Filter F1 news by team, driver, or keyword."""
     if not any([team, driver, keyword]):
-        console.print("[red]Error: Please specify at least one filter (--team, --driver, or --keyword)[/red]")
+        err_console.print("[red]Error: Please specify at least one filter (--team, --driver, or --keyword)[/red]")
         return
     
-    console.print("[bold blue]Fetching and filtering F1 news...[/bold blue]")
+    check_output_options(output_format, output)
+    err_console.print("[bold blue]Fetching and filtering F1 news...[/bold blue]")
+    stream_news(output_format, limit, team, driver, keyword, sort, fields, plain, output, new_only, since)
+
+
+@main.command()
+@click.argument('query', required=False)
+@click.option('--since', type=click.DateTime(), help='Only articles published at or after this time (UTC)')
+@click.option('--until', type=click.DateTime(), help='Only articles published before this time (UTC)')
+@click.option('--limit', default=20, help='Maximum number of articles per page')
+@click.option('--cursor', help='Continue from the cursor printed after the previous page')
+@click.option('--format', 'output_format',
+              type=click.Choice(['terminal', 'json', 'ndjson', 'markdown'] + COLUMNAR_FORMATS),
+              default='terminal', help='Output format')
+@click.option('--fields', callback=parse_fields,
+              help='Comma-separated fields to include in json/ndjson output (e.g. title,url,timestamp)')
+@click.option('--plain', is_flag=True, help='Plain-text terminal output (default when stdout is not a TTY)')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write csv/parquet/arrow output to this file')
+def search(query, since, until, limit, cursor, output_format, fields, plain, output):
+    """Full-text search over every article fetched so far, newest first."""
+    from .archive import open_archive
     
-    # Fetch news from RSS sources
-    rss = RSSSource()
-    news_items = rss.fetch_news(limit=limit * 3)  # Fetch more to account for filtering
+    check_output_options(output_format, output)
     
-    # Apply filters
-    news_filter = NewsFilter()
-    filtered_items = news_items
+    archive = open_archive()
+    if archive is None:
+        err_console.print("[red]Error: the news archive is unavailable[/red]")
+        return
+    try:
+        news_items, next_cursor = archive.search(query, since, until, limit, cursor)
+    except ValueError:
+        raise click.BadParameter(f"not a cursor printed by a previous search: {cursor}", param_hint='--cursor')
+    finally:
+        archive.close()
     
-    if team:
-        console.print(f"[dim]Filtering by team: {team}[/dim]")
-        filtered_items = news_filter.filter_by_team(filtered_items, team)
+    if not news_items:
+        err_console.print("[yellow]No archived articles match.[/yellow]")
+        return
+    get_news_formatter(output_format, fields, plain, output).format_news(news_items)
+    if next_cursor:
+        err_console.print(f"[dim]More results: --cursor {next_cursor}[/dim]")
+
+
+@main.command()
+@click.option('--by', 'group_by', type=click.Choice(['team', 'driver']),
+              help='Build one digest per team or per driver')
+@click.option('--queries', 'queries_file', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help='File with one filter query per line (name=... team=... driver=... keyword=...)')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'markdown']),
+              default='json', help='Output format')
+@click.option('--limit', default=10, help='Maximum number of news items per digest')
+@click.option('--output-dir', type=click.Path(file_okay=False, path_type=Path),
+              help='Write one file per digest into this directory')
+def digest(group_by, queries_file, output_format, limit, output_dir):
+    """Build per-team, per-driver or per-query digests from a single fetch."""
+    from .digest import DigestRouter, bucket_filename, load_queries, queries_by_driver, queries_by_team
+    from .keywords import KeywordExtractor
     
-    if driver:
-        console.print(f"[dim]Filtering by driver: {driver}[/dim]")
-        filtered_items = news_filter.filter_by_driver(filtered_items, driver)
+    if queries_file and group_by:
+        err_console.print("[red]Error: --by and --queries cannot be used together[/red]")
+        return
+    if queries_file:
+        try:
+            queries = load_queries(queries_file)
+        except ValueError as e:
+            err_console.print(f"[red]Error: {e}[/red]")
+            return
+    elif group_by == 'driver':
+        queries = queries_by_driver()
+    elif group_by == 'team':
+        queries = queries_by_team()
+    else:
+        err_console.print("[red]Error: Please specify --by team, --by driver or --queries FILE[/red]")
+        return
     
-    if keyword:
-        console.print(f"[dim]Filtering by keyword: {keyword}[/dim]")
-        filtered_items = news_filter.filter_by_keyword(filtered_items, keyword)
+    err_console.print(f"[bold blue]Building {len(queries)} digests from one fetch...[/bold blue]")
     
-    # Deduplicate results
-    filtered_items = news_filter.deduplicate(filtered_items)
+    router = DigestRouter(queries, limit=limit)
+    buckets = router.route(Aggregator.from_config(Config(), rss=RSSSource()).iter_news())
     
-    # Limit results
-    filtered_items = filtered_items[:limit]
+    # Keywords are scored once per item, however many buckets it landed in
+    extractor = KeywordExtractor({id(item): item for items in buckets.values() for item in items}.values())
     
-    if not filtered_items:
-        console.print("[yellow]No news items found matching your filters.[/yellow]")
-        return
+    def bucket_formatter(name):
+        if output_format == 'json':
+            return JSONFormatter(keyword_extractor=extractor)
+        return MarkdownFormatter(title=f"F1 News: {name}", keyword_extractor=extractor)
     
-    console.print(f"[green]Found {len(filtered_items)} matching news items[/green]")
+    extension = 'json' if output_format == 'json' else 'md'
     
-    # Format and display results
-    if output_format == 'terminal':
-        formatter = TerminalFormatter()
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, items in buckets.items():
+            path = output_dir / bucket_filename(name, extension)
+            with open(path, 'w') as f:
+                bucket_formatter(name).format_news(items, file=f)
+        err_console.print(f"[green]Wrote {len(buckets)} digests to {output_dir}[/green]")
     elif output_format == 'json':
         formatter = JSONFormatter()
+        print(json.dumps({name: [formatter.item_to_dict(item, extractor) for item in items]
+                          for name, items in buckets.items()}, indent=2))
     else:
-        formatter = MarkdownFormatter()
-    
-    formatter.format_news(filtered_items)
+        for name, items in buckets.items():
+            bucket_formatter(name).format_news(items)
 
 
 @main.command()
 def sources():
     """List available news sources."""
+    from rich.table import Table
+    
     rss = RSSSource()
     available_sources = rss.get_available_sources()
     
@@ -158,33 +473,238 @@ def sources():
         table.add_row(key, name, url)
     
     console.print(table)
+    
+    config = Config()
+    console.print(f"\n[bold]Enabled sources:[/bold] {', '.join(enabled_sources(config)) or 'none'} "
+                  f"[dim](of {', '.join(SOURCES)}; set sources.<name>.enabled in {config.config_file})[/dim]")
     console.print("\n[dim]Usage: f1-news fetch --sources formula1_headlines,autosport[/dim]")
 
 
 @main.command()
 @click.option('--session', type=click.Choice(['race', 'qualifying', 'practice']),
               default='race', help='Type of session to show results for')
-def result(session):
+@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json'] + COLUMNAR_FORMATS),
+              default='terminal', help='Output format')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write csv/parquet/arrow output to this file')
+def result(session, output_format, output):
     """Show the most recent F1 session results."""
+    check_output_options(output_format, output)
     
     try:
-        source = RaceResultSource()
-        formatter = ResultFormatter()
-        
-        if session == 'practice':
-            # Handle practice sessions
-            console.print("[bold blue]Fetching all practice session results...[/bold blue]")
-            results = source.fetch_latest_results(session_type='practice')
-        elif session == 'qualifying':
-            console.print("[bold blue]Fetching latest F1 qualifying results...[/bold blue]")
-            results = source.fetch_latest_results(session_type='qualifying')
+        if output_format == 'json':
+            formatter = ResultJSONFormatter()
+        elif output_format in COLUMNAR_FORMATS:
+            from .export import ColumnarFormatter
+            
+            formatter = ColumnarFormatter(output_format, output)
         else:
-            console.print("[bold blue]Fetching latest F1 race results...[/bold blue]")
-            results = source.fetch_latest_results(session_type='race')
-        formatter.format_results(results)
+            formatter = ResultFormatter()
+        
+        results = None
+        client = connect_daemon()
+        if client is not None:
+            from .daemon import DaemonError
+            
+            try:
+                with span('daemon_request', 'daemon'):
+                    results = client.results(session)
+            except (OSError, DaemonError) as e:
+                err_console.print(f"[dim]Daemon unavailable ({e}), fetching directly[/dim]")
+        
+        if results is None:
+            from .warming import ResponseCache
+            
+            source = RaceResultSource(cache=ResponseCache())
+            # Self time of this span is the aggregation; each OpenF1 request is a nested span
+            with span('fetch_results', 'openf1', session=session):
+                if session == 'practice':
+                    # Handle practice sessions
+                    err_console.print("[bold blue]Fetching all practice session results...[/bold blue]")
+                    results = source.fetch_latest_results(session_type='practice')
+                elif session == 'qualifying':
+                    err_console.print("[bold blue]Fetching latest F1 qualifying results...[/bold blue]")
+                    results = source.fetch_latest_results(session_type='qualifying')
+                else:
+                    err_console.print("[bold blue]Fetching latest F1 race results...[/bold blue]")
+                    results = source.fetch_latest_results(session_type='race')
+            checkpoint('build_results')
+        with span('format', format=output_format):
+            formatter.format_results(results)
+        checkpoint('format')
+
+    except Exception as e:
+        err_console.print(f"[red]Error fetching session results: {e}[/red]")
 
+
+@main.command()
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help='Socket path (default: $F1_NEWS_SOCKET or ~/.f1-news/daemon.sock)')
+@click.option('--refresh', type=float, help='Background refresh interval in seconds (default: cache_duration)')
+@click.option('--stop', is_flag=True, help='Stop the running daemon')
+@click.option('--metrics-port', type=int, help='Serve OpenMetrics at http://127.0.0.1:PORT/metrics while running')
+def daemon(socket_path, refresh, stop, metrics_port):
+    """Keep news and results warm in a background process that other commands forward to."""
+    from .daemon import DaemonClient, DaemonError, run_daemon
+    
+    if stop:
+        try:
+            DaemonClient(socket_path).shutdown()
+            err_console.print("[green]Daemon stopped[/green]")
+        except (OSError, DaemonError) as e:
+            err_console.print(f"[red]Error: no daemon running ({e})[/red]")
+        return
+    
+    max_age = Config().get('cache_duration', DEFAULT_MAX_AGE)
+    start_metrics_server(metrics_port)
+    run_daemon(socket_path, refresh or max_age, max_age)
+
+
+@main.command()
+@click.option('--host', default='127.0.0.1', help='Address to listen on')
+@click.option('--port', default=8080, help='Port to listen on')
+@click.option('--refresh', type=float, help='Upstream poll interval in seconds (default: cache_duration)')
+def serve(host, port, refresh):
+    """Serve news and results as a local HTTP JSON API with Server-Sent Events."""
+    from .server import run_server
+    
+    max_age = Config().get('cache_duration', DEFAULT_MAX_AGE)
+    run_server(host, port, refresh or max_age, max_age)
+
+
+@main.command()
+@click.option('--loop', is_flag=True, help='Keep running, polling each feed when it falls due')
+@click.option('--force', is_flag=True, help='Poll every feed now, even if not yet due')
+@click.option('--status', is_flag=True, help='Show each feed\'s learned interval and next poll')
+@click.option('--metrics-port', type=int, help='Serve OpenMetrics at http://127.0.0.1:PORT/metrics while running')
+def prefetch(loop, force, status, metrics_port):
+    """Poll feeds on their own adaptive schedules to keep the cache warm (run from cron or with --loop)."""
+    from .prefetch import PrefetchScheduler
+    
+    scheduler = PrefetchScheduler(RSSSource())
+    
+    if status:
+        from datetime import datetime
+        from rich.table import Table
+        
+        table = Table(title="Feed Prefetch Schedule")
+        table.add_column("Source Key", style="magenta")
+        table.add_column("Interval", style="cyan")
+        table.add_column("Last Change", style="yellow")
+        table.add_column("Next Poll", style="green")
+        for key, schedule in scheduler.schedules.items():
+            table.add_row(
+                key,
+                f"{schedule.interval / 60:.0f} min",
+                datetime.fromtimestamp(schedule.last_changed).strftime("%Y-%m-%d %H:%M") if schedule.last_changed else "-",
+                datetime.fromtimestamp(schedule.next_due).strftime("%Y-%m-%d %H:%M") if schedule.next_due else "now",
+            )
+        console.print(table)
+        return
+    
+    if loop:
+        start_metrics_server(metrics_port)
+        err_console.print("[bold blue]Prefetching feeds as they fall due (Ctrl+C to stop)...[/bold blue]")
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.save_state()
+        return
+    
+    changed = scheduler.run_once(force)
+    err_console.print(f"[green]Polled {len(changed)} feeds, {sum(changed.values())} changed[/green]")
+
+
+@main.command()
+@click.option('--loop', is_flag=True, help='Keep running, waking when each session ends')
+@click.option('--metrics-port', type=int, help='Serve OpenMetrics at http://127.0.0.1:PORT/metrics while running')
+def warm(loop, metrics_port):
+    """Cache each session's results, laps and drivers shortly after it ends (run from cron or with --loop)."""
+    from .warming import SessionWarmer
+    
+    warmer = SessionWarmer(RaceResultSource())
+    
+    if loop:
+        start_metrics_server(metrics_port)
+        err_console.print("[bold blue]Warming session data as sessions end (Ctrl+C to stop)...[/bold blue]")
+        try:
+            warmer.run_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+    
+    try:
+        warmed = warmer.run_once()
+    except Exception as e:
+        err_console.print(f"[red]Error reading the session calendar: {e}[/red]")
+        return
+    if not warmed:
+        err_console.print("[dim]No recently ended sessions to warm[/dim]")
+    for name, stable in warmed.items():
+        err_console.print(f"[green]{name}: {'final' if stable else 'cached, still changing'}[/green]")
+
+
+def load_session_laps(session):
+    """Fetch the latest session of a type with its lap table and drivers."""
+    from .warming import ResponseCache
+    
+    source = RaceResultSource(cache=ResponseCache())
+    latest_session = source.find_latest_session(session)
+    session_key = latest_session['session_key']
+    return source.session_name(latest_session), source.fetch_laps(session_key), source.fetch_drivers(session_key)
+
+
+@main.command()
+@click.option('--session', type=click.Choice(['race', 'qualifying', 'practice']),
+              default='race', help='Type of session to analyse')
+@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json']),
+              default='terminal', help='Output format')
+@click.option('--gap-every', default=10, help='Show the gap to the leader every N laps (0 to hide)')
+def pace(session, output_format, gap_every):
+    """Show per-driver median pace, degradation and gap evolution for the latest session."""
+    try:
+        err_console.print(f"[bold blue]Fetching latest F1 {session} laps...[/bold blue]")
+        session_name, laps, drivers = load_session_laps(session)
+        PaceFormatter(output_format).format_pace(session_name, laps, drivers, gap_every)
+        checkpoint('format')
+    except Exception as e:
+        err_console.print(f"[red]Error fetching lap data: {e}[/red]")
+
+
+@main.command()
+@click.option('--session', type=click.Choice(['race', 'qualifying', 'practice']),
+              default='race', help='Type of session to analyse')
+@click.option('--format', 'output_format', type=click.Choice(['terminal', 'json']),
+              default='terminal', help='Output format')
+def stints(session, output_format):
+    """Show each driver's stints with pace and degradation for the latest session."""
+    try:
+        err_console.print(f"[bold blue]Fetching latest F1 {session} laps...[/bold blue]")
+        session_name, laps, drivers = load_session_laps(session)
+        PaceFormatter(output_format).format_stints(session_name, laps, drivers)
+        checkpoint('format')
+    except Exception as e:
+        err_console.print(f"[red]Error fetching lap data: {e}[/red]")
+
+
+@main.command()
+@click.option('--session', type=click.Choice(['race', 'qualifying', 'practice']),
+              default='race', help='Type of session to export')
+@click.option('--format', 'output_format', type=click.Choice(COLUMNAR_FORMATS),
+              default='csv', help='Output format')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write output to this file (csv defaults to stdout)')
+def laps(session, output_format, output):
+    """Export every lap of the latest session, one row per lap."""
+    from .export import write_columns
+    
+    check_output_options(output_format, output)
+    
+    try:
+        err_console.print(f"[bold blue]Fetching latest F1 {session} laps...[/bold blue]")
+        _, lap_table, _ = load_session_laps(session)
+        write_columns(lap_table.columns(), output_format, output)
+        checkpoint('format')
     except Exception as e:
-        console.print(f"[red]Error fetching session results: {e}[/red]")
+        err_console.print(f"[red]Error fetching lap data: {e}[/red]")
 
 
 if __name__ == '__main__':
@@ -36,6 +36,12 @@ class Config:
                 'client_secret': os.getenv('REDDIT_CLIENT_SECRET', ''),
                 'user_agent': 'F1NewsCLI/0.1.0'
             },
+            # Sources merged into the news stream; timeout (seconds to first item) and max_items are optional
+            'sources': {
+                'rss': {'enabled': True},
+                'twitter': {'enabled': False},
+                'reddit': {'enabled': False}
+            },
             'rss_feeds': [
                 'https://www.formula1.com/en/latest/headlines.xml',
                 'https://www.autosport.com/rss/feed/f1'
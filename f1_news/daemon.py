@@ -0,0 +1,151 @@
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from .archive import open_archive
+from .models import NewsItem, RaceResults
+from .service import (NewsService, news_item_from_dict, news_item_to_dict, race_results_from_dict,
+                      race_results_to_dict)
+
+
+def default_socket_path() -> Path:
+    """Socket the daemon listens on: $F1_NEWS_SOCKET or ~/.f1-news/daemon.sock."""
+    return Path(os.environ.get('F1_NEWS_SOCKET') or Path.home() / '.f1-news' / 'daemon.sock')
+
+
+class DaemonError(Exception):
+    """The daemon answered a request with an error."""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON request line with one JSON response line."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            response = {"ok": True, "data": self.server.dispatch(request.get("command"), request.get("args") or {})}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server answering CLI requests from a warm NewsService."""
+
+    daemon_threads = True
+
+    def __init__(self, service: NewsService, socket_path: Optional[Path] = None):
+        self.service = service
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            try:
+                DaemonClient(self.socket_path, timeout=1.0).call("ping")
+            except (OSError, DaemonError):
+                # Left behind by a daemon that did not shut down cleanly
+                self.socket_path.unlink()
+            else:
+                raise OSError(f"A daemon is already listening on {self.socket_path}")
+        super().__init__(str(self.socket_path), _RequestHandler)
+
+    def dispatch(self, command: str, args: dict):
+        """Run a request against the service and return a JSON-serializable result."""
+        if command == "news":
+            return [news_item_to_dict(item) for item in self.service.news(**args)]
+        elif command == "results":
+            return race_results_to_dict(self.service.results(**args))
+        elif command == "ping":
+            return "pong"
+        elif command == "shutdown":
+            # shutdown() waits for serve_forever to return, so it cannot run on this handler's thread
+            self.service.stop()
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return "bye"
+        raise ValueError(f"Unknown command: {command}")
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def run_daemon(socket_path: Optional[Path] = None, refresh_interval: Optional[float] = None,
+               max_age: Optional[float] = None):
+    """Run the daemon in the foreground until it is asked to shut down."""
+    service = NewsService(max_age=max_age) if max_age else NewsService()
+    archive = open_archive()
+    if archive is not None:
+        service.subscribe(archive.on_refresh)
+    service.start(refresh_interval)
+    server = DaemonServer(service, socket_path)
+    print(f"f1-news daemon listening on {server.socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+
+
+class DaemonClient:
+    """Forward requests to a running daemon over its Unix socket."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 30.0):
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+
+    def available(self) -> bool:
+        """Whether a daemon socket exists (the daemon may still have died without removing it)."""
+        return hasattr(socket, 'AF_UNIX') and self.socket_path.exists()
+
+    def call(self, command: str, **args):
+        """Send one request and return its result.
+
+        Raises OSError when the daemon cannot be reached and DaemonError when
+        it reports a failure.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(json.dumps({"command": command, "args": args}).encode() + b"\n")
+            with sock.makefile('rb') as response_file:
+                line = response_file.readline()
+        if not line:
+            raise DaemonError("Daemon closed the connection without answering")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise DaemonError(response["error"])
+        return response["data"]
+
+    def news(self, limit: int = 10, team: Optional[str] = None, driver: Optional[str] = None,
+             keyword: Optional[str] = None, sort: str = 'time') -> List[NewsItem]:
+        """News from the daemon's warm snapshot."""
+        data = self.call("news", limit=limit, team=team, driver=driver, keyword=keyword, sort=sort)
+        return [news_item_from_dict(item) for item in data]
+
+    def results(self, session_type: str = 'race') -> RaceResults:
+        """Latest results for a session type from the daemon's cache."""
+        return race_results_from_dict(self.call("results", session_type=session_type))
+
+    def shutdown(self):
+        """Ask the daemon to exit."""
+        self.call("shutdown")
+
+
+def connect() -> Optional[DaemonClient]:
+    """A client for the running daemon, or None when there is none or F1_NEWS_NO_DAEMON is set."""
+    if os.environ.get('F1_NEWS_NO_DAEMON'):
+        return None
+    client = DaemonClient()
+    return client if client.available() else None
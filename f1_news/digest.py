@@ -0,0 +1,192 @@
+import re
+import shlex
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Set
+
+from .models import NewsItem
+from .normalize import (DRIVER_ALIASES, TEAM_ALIASES, fold, resolve_driver, resolve_team)
+
+
+@dataclass
+class DigestQuery:
+    """A named combination of filters that defines one digest bucket."""
+    name: str
+    team: Optional[str] = None
+    driver: Optional[str] = None
+    keyword: Optional[str] = None
+
+
+def queries_by_team() -> List[DigestQuery]:
+    """One query per known team."""
+    return [DigestQuery(name=team, team=team) for team in TEAM_ALIASES]
+
+
+def queries_by_driver() -> List[DigestQuery]:
+    """One query per known driver."""
+    return [DigestQuery(name=driver, driver=driver) for driver in DRIVER_ALIASES]
+
+
+def load_queries(path: Path) -> List[DigestQuery]:
+    """Read digest queries from a file.
+
+    Each non-empty line that is not a ``#`` comment holds ``key=value``
+    pairs (``name``, ``team``, ``driver``, ``keyword``), quoted shell-style
+    where values contain spaces, e.g. ``name=rbr team="red bull" driver=checo``.
+    Names must be distinct, including after they are turned into file names.
+    """
+    queries = []
+    # Bucket file name -> line that claimed it
+    claimed = {}
+    with open(path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            fields = {}
+            for token in shlex.split(line):
+                key, sep, value = token.partition('=')
+                if not sep or key not in ('name', 'team', 'driver', 'keyword'):
+                    raise ValueError(f"{path}:{line_number}: invalid query field '{token}'")
+                fields[key] = value
+
+            if not any(fields.get(key) for key in ('team', 'driver', 'keyword')):
+                raise ValueError(f"{path}:{line_number}: query needs a team, driver or keyword")
+
+            name = fields.pop('name', None) or ' '.join(fields.values())
+            slug = bucket_filename(name, '')
+            if slug in claimed:
+                raise ValueError(f"{path}:{line_number}: query name '{name}' clashes with the query "
+                                 f"on line {claimed[slug]}")
+            claimed[slug] = line_number
+            queries.append(DigestQuery(name=name, **fields))
+    return queries
+
+
+def _names_pattern(aliases_by_name: Dict[str, List[str]]) -> Optional[Pattern]:
+    """Compile one alternation over every alias of every name."""
+    if not aliases_by_name:
+        return None
+    alternatives = []
+    for name, aliases in aliases_by_name.items():
+        if aliases:
+            alternatives.extend(r'\b' + re.escape(alias) + r'\b' for alias in aliases)
+        else:
+            # Unknown names keep plain substring matching
+            alternatives.append(re.escape(name))
+    # Longest first so that longer aliases win over their prefixes
+    alternatives.sort(key=len, reverse=True)
+    return re.compile('|'.join(alternatives))
+
+
+class DigestRouter:
+    """Route news items into every matching digest bucket in a single pass.
+
+    All team and driver names referenced by the queries are compiled into
+    one pattern each, so every item is scanned once per kind regardless of
+    how many queries there are. Queries are indexed by their team, else
+    their driver, so an item is only checked against the queries whose
+    names it mentions, plus those filtering on a keyword alone.
+    """
+
+    def __init__(self, queries: Iterable[DigestQuery], limit: int = 10):
+        self.queries = list(queries)
+        self.limit = limit
+        self.buckets: Dict[str, List[NewsItem]] = {query.name: [] for query in self.queries}
+        if len(self.buckets) != len(self.queries):
+            raise ValueError("digest query names must be unique")
+        # Buckets still below the limit, so checking whether all are full is O(1)
+        self._open = len(self.queries) if limit > 0 else 0
+
+        self._query_teams = [resolve_team(q.team) if q.team else None for q in self.queries]
+        self._query_drivers = [resolve_driver(q.driver) if q.driver else None for q in self.queries]
+        self._query_keywords = [fold(q.keyword) if q.keyword else None for q in self.queries]
+
+        self._team_lookup, self._team_pattern = self._compile(
+            {team for team in self._query_teams if team}, TEAM_ALIASES)
+        self._driver_lookup, self._driver_pattern = self._compile(
+            {driver for driver in self._query_drivers if driver}, DRIVER_ALIASES)
+
+        # Canonical team or driver -> indexes of the queries it can satisfy
+        self._by_team: Dict[str, List[int]] = {}
+        self._by_driver: Dict[str, List[int]] = {}
+        self._keyword_only: List[int] = []
+        for i, (team, driver) in enumerate(zip(self._query_teams, self._query_drivers)):
+            if team:
+                self._by_team.setdefault(team, []).append(i)
+            elif driver:
+                self._by_driver.setdefault(driver, []).append(i)
+            else:
+                self._keyword_only.append(i)
+
+    @staticmethod
+    def _compile(names: Set[str], alias_table: Dict[str, List[str]]):
+        """Build the alias -> canonical lookup and combined pattern for a set of names."""
+        aliases_by_name = {name: [fold(alias) for alias in alias_table.get(name, [])] for name in names}
+        lookup = {name: name for name in names}
+        for name, aliases in aliases_by_name.items():
+            for alias in aliases:
+                lookup[alias] = name
+        return lookup, _names_pattern(aliases_by_name)
+
+    @staticmethod
+    def _matched_names(pattern: Optional[Pattern], lookup: Dict[str, str], text: str) -> Set[str]:
+        """Canonical names mentioned in the text."""
+        if pattern is None:
+            return set()
+        return {lookup[match.group(0)] for match in pattern.finditer(text)}
+
+    @property
+    def full(self) -> bool:
+        """Whether every bucket already holds ``limit`` items."""
+        return self._open == 0
+
+    def add(self, item: NewsItem) -> List[str]:
+        """Add an item to every bucket it matches and return their names."""
+        text = item.folded_text
+        teams = self._matched_names(self._team_pattern, self._team_lookup, text)
+        drivers = self._matched_names(self._driver_pattern, self._driver_lookup, text)
+
+        candidates = list(self._keyword_only)
+        for team in teams:
+            candidates.extend(self._by_team.get(team, ()))
+        for driver in drivers:
+            candidates.extend(self._by_driver.get(driver, ()))
+
+        matched = []
+        # In query order, as a full scan would visit them
+        for i in sorted(candidates):
+            query = self.queries[i]
+            bucket = self.buckets[query.name]
+            if len(bucket) >= self.limit:
+                continue
+            if self._query_drivers[i] and self._query_drivers[i] not in drivers:
+                continue
+            if self._query_keywords[i] and self._query_keywords[i] not in text:
+                continue
+            bucket.append(item)
+            if len(bucket) == self.limit:
+                self._open -= 1
+            matched.append(query.name)
+        return matched
+
+    def route(self, news_items: Iterable[NewsItem]) -> Dict[str, List[NewsItem]]:
+        """Route a stream of news items, stopping early once every bucket is full."""
+        seen_titles = set()
+        for item in news_items:
+            title_key = item.folded_title.strip()
+            if title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+
+            self.add(item)
+            if self.full:
+                break
+        return self.buckets
+
+
+def bucket_filename(name: str, extension: str) -> str:
+    """File name for a bucket's document, e.g. 'red-bull.json'."""
+    slug = re.sub(r'[^a-z0-9]+', '-', fold(name)).strip('-') or 'bucket'
+    return f"{slug}.{extension}"
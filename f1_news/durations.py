@@ -0,0 +1,37 @@
+from typing import Optional
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as 'M:SS.sss', or 'H:MM:SS.sss' from one hour up."""
+    hours = int(seconds // 3600)
+    minutes = int(seconds % 3600 // 60)
+    secs = seconds % 60
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:06.3f}"
+    return f"{minutes}:{secs:06.3f}"
+
+
+def format_gap(seconds: float) -> str:
+    """Format a gap to the leader as '+S.sss', or '+M:SS.sss' from one minute up."""
+    if seconds >= 60:
+        return f"+{format_duration(seconds)}"
+    return f"+{seconds:.3f}"
+
+
+def parse_duration(text: str) -> Optional[float]:
+    """Parse 'H:MM:SS.sss', 'M:SS.sss' or 'S.sss' (optionally '+'-prefixed) into seconds.
+
+    Returns None for anything that is not a time, such as 'DNF' or 'P3'.
+    """
+    if not isinstance(text, str):
+        return None
+    text = text.strip().lstrip('+').rstrip('s')
+    if not text:
+        return None
+    try:
+        seconds = 0.0
+        for part in text.split(':'):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
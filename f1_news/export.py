@@ -0,0 +1,137 @@
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from .formatters import NEWS_FIELDS
+from .keywords import KeywordExtractor
+from .models import NewsItem, RaceResults
+
+COLUMNAR_FORMATS = ['csv', 'parquet', 'arrow']
+
+# Formats that produce binary files and therefore need --output
+BINARY_FORMATS = {'parquet', 'arrow'}
+
+
+def news_columns(news_items: Iterable[NewsItem], fields: Optional[List[str]] = None) -> Dict[str, list]:
+    """Convert news items to a column name -> values mapping."""
+    news_items = list(news_items)
+    fields = fields or list(NEWS_FIELDS)
+    extractor = KeywordExtractor(news_items) if "keywords" in fields else None
+
+    columns = {}
+    for name in fields:
+        if name == "timestamp":
+            # Keep real datetimes so Arrow gets a timestamp column
+            columns[name] = [item.timestamp for item in news_items]
+        else:
+            getter = NEWS_FIELDS[name]
+            columns[name] = [getter(item, extractor) for item in news_items]
+    return columns
+
+
+def result_columns(race_results: RaceResults) -> Dict[str, list]:
+    """Convert session results to a column name -> values mapping, one row per driver."""
+    results = race_results.results
+    rows = len(results)
+
+    def segment(index):
+        return [r.segment_times[index] if r.segment_times and len(r.segment_times) > index else None
+                for r in results]
+
+    return {
+        "race_name": [race_results.race_name] * rows,
+        "date": [race_results.date] * rows,
+        "circuit": [race_results.circuit] * rows,
+        "position": [r.position for r in results],
+        "driver": [r.driver for r in results],
+        "team": [r.team for r in results],
+        "points": [r.points for r in results],
+        "total_time": [r.total_time for r in results],
+        "gap": [r.gap for r in results],
+        "fastest_lap_time": [r.fastest_lap_time for r in results],
+        "q1_time": segment(0),
+        "q2_time": segment(1),
+        "q3_time": segment(2),
+        "status": [r.time if r.total_time is None and r.gap is None else None for r in results],
+    }
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ";".join(str(v) for v in value)
+    return value
+
+
+def write_csv(columns: Dict[str, list], file):
+    """Write columns as CSV with a header row."""
+    import csv
+
+    writer = csv.writer(file)
+    writer.writerow(columns.keys())
+    for row in zip(*columns.values()):
+        writer.writerow([_csv_value(value) for value in row])
+
+
+def require_pyarrow():
+    """Import pyarrow, which is only needed for Parquet and Arrow output."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for parquet/arrow output (pip install pyarrow)")
+    return pyarrow
+
+
+def write_parquet(columns: Dict[str, list], path: str):
+    """Write columns to a Parquet file."""
+    pa = require_pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(pa.table(columns), path)
+
+
+def write_arrow(columns: Dict[str, list], path: str):
+    """Write columns to an Arrow IPC file."""
+    pa = require_pyarrow()
+    table = pa.table(columns)
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def write_columns(columns: Dict[str, list], output_format: str, output=None):
+    """Write columns in a columnar format to ``output`` (stdout for CSV when omitted)."""
+    if output_format == 'csv':
+        if output is None:
+            write_csv(columns, sys.stdout)
+        else:
+            with open(output, 'w', newline='') as f:
+                write_csv(columns, f)
+    elif output_format in BINARY_FORMATS:
+        if output is None:
+            raise ValueError(f"{output_format} output needs --output FILE")
+        if output_format == 'parquet':
+            write_parquet(columns, output)
+        else:
+            write_arrow(columns, output)
+    else:
+        raise ValueError(f"Unknown columnar format: {output_format}")
+
+
+class ColumnarFormatter:
+    """Export news items or session results as CSV, Parquet or Arrow IPC."""
+
+    def __init__(self, output_format: str, output=None, fields: Optional[List[str]] = None):
+        self.output_format = output_format
+        self.output = output
+        self.fields = fields
+
+    def format_news(self, news_items: Iterable[NewsItem]):
+        """Write news items as one row per item."""
+        write_columns(news_columns(news_items, self.fields), self.output_format, self.output)
+
+    def format_results(self, race_results: RaceResults):
+        """Write session results as one row per driver."""
+        write_columns(result_columns(race_results), self.output_format, self.output)
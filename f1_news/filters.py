@@ -1,57 +1,57 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 from .models import NewsItem
+from .normalize import DRIVER_ALIASES, TEAM_ALIASES, fold, driver_pattern, team_pattern
 
 
 class NewsFilter:
     """Filter F1 news items based on various criteria."""
     
-    F1_TEAMS = [
-        'red bull', 'ferrari', 'mercedes', 'mclaren', 'aston martin',
-        'alpine', 'williams', 'alphatauri', 'alfa romeo', 'haas'
-    ]
+    F1_TEAMS = list(TEAM_ALIASES)
     
-    F1_DRIVERS = [
-        'verstappen', 'perez', 'leclerc', 'sainz', 'hamilton', 'russell',
-        'norris', 'piastri', 'alonso', 'stroll', 'gasly', 'ocon',
-        'albon', 'sargeant', 'tsunoda', 'ricciardo', 'bottas', 'zhou',
-        'magnussen', 'hulkenberg'
-    ]
+    F1_DRIVERS = list(DRIVER_ALIASES)
     
     def filter_by_team(self, news_items: List[NewsItem], team: str) -> List[NewsItem]:
-        """Filter news items by F1 team."""
-        team_lower = team.lower()
-        filtered_items = []
-        
-        for item in news_items:
-            if (team_lower in item.title.lower() or 
-                team_lower in item.content.lower()):
-                filtered_items.append(item)
-        
-        return filtered_items
+        """Filter news items by F1 team, matching any known alias of the team."""
+        pattern = team_pattern(team)
+        return [item for item in news_items if pattern.search(item.folded_text)]
     
     def filter_by_driver(self, news_items: List[NewsItem], driver: str) -> List[NewsItem]:
-        """Filter news items by F1 driver."""
-        driver_lower = driver.lower()
-        filtered_items = []
-        
-        for item in news_items:
-            if (driver_lower in item.title.lower() or 
-                driver_lower in item.content.lower()):
-                filtered_items.append(item)
-        
-        return filtered_items
+        """Filter news items by F1 driver, matching any known name or nickname."""
+        pattern = driver_pattern(driver)
+        return [item for item in news_items if pattern.search(item.folded_text)]
     
     def filter_by_keyword(self, news_items: List[NewsItem], keyword: str) -> List[NewsItem]:
         """Filter news items by custom keyword."""
-        keyword_lower = keyword.lower()
-        filtered_items = []
+        keyword_folded = fold(keyword)
+        return [item for item in news_items if keyword_folded in item.folded_text]
+    
+    def filter_stream(self, news_items: Iterable[NewsItem], team: Optional[str] = None,
+                      driver: Optional[str] = None, keyword: Optional[str] = None) -> Iterator[NewsItem]:
+        """Lazily yield unique news items matching every given filter.
         
+        Items are pulled from ``news_items`` only as the consumer asks for
+        more, so a consumer that stops after N matches never reads further.
+        """
+        patterns = []
+        if team:
+            patterns.append(team_pattern(team))
+        if driver:
+            patterns.append(driver_pattern(driver))
+        keyword_folded = fold(keyword) if keyword else None
+        
+        seen_titles = set()
         for item in news_items:
-            if (keyword_lower in item.title.lower() or 
-                keyword_lower in item.content.lower()):
-                filtered_items.append(item)
+            text = item.folded_text
+            if keyword_folded and keyword_folded not in text:
+                continue
+            if not all(pattern.search(text) for pattern in patterns):
+                continue
         
-        return filtered_items
+            title_key = item.folded_title.strip()
+            if title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+            yield item
     
     def deduplicate(self, news_items: List[NewsItem]) -> List[NewsItem]:
         """Remove duplicate news items based on title similarity."""
@@ -59,8 +59,8 @@ class NewsFilter:
         unique_items = []
         
         for item in news_items:
-            # Simple deduplication based on title
-            title_key = item.title.lower().strip()
+            # Simple deduplication based on the folded title
+            title_key = item.folded_title.strip()
             if title_key not in seen_titles:
                 seen_titles.add(title_key)
                 unique_items.append(item)
@@ -1,69 +1,75 @@
 import json
-import re
-from typing import List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from .models import NewsItem, RaceResults
+from typing import TYPE_CHECKING, Iterable, List, Optional
+from .models import NewsItem, RaceResult, RaceResults
+from .keywords import KeywordExtractor, StreamingKeywordExtractor
+from .durations import format_duration, format_gap
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from .laps import LapTable
+
+# Rich is imported when the first console is created, not at module import
+_consoles = {}
+
+
+def get_console(stderr: bool = False) -> 'Console':
+    """Shared Rich console for stdout (or stderr), created on first use."""
+    if stderr not in _consoles:
+        from rich.console import Console
+        _consoles[stderr] = Console(stderr=stderr)
+    return _consoles[stderr]
+
+
+def __getattr__(name):
+    # f1_news.formatters.console is the shared stdout console
+    if name == 'console':
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def preview_text(text: str, length: int = 400) -> str:
+    """Truncate text for display."""
+    return text[:length] + "..." if len(text) > length else text
 
 
 def extract_keywords(text: str, limit: int = 5) -> List[str]:
     """Extract keywords from text content."""
-    # F1-specific keywords
-    f1_keywords = {
-        'verstappen', 'hamilton', 'leclerc', 'russell', 'norris', 'piastri', 'sainz', 'perez',
-        'alonso', 'stroll', 'ocon', 'gasly', 'albon', 'sargeant', 'bottas', 'zhou',
-        'hulkenberg', 'magnussen', 'tsunoda', 'ricciardo',
-        'red bull', 'mercedes', 'ferrari', 'mclaren', 'aston martin', 'alpine', 'williams',
-        'haas', 'alphatauri', 'alfa romeo', 'racing', 'formula 1', 'f1', 'grand prix',
-        'qualifying', 'practice', 'sprint', 'championship', 'points', 'podium', 'pole position',
-        'fastest lap', 'drs', 'safety car', 'virtual safety car', 'pit stop', 'tyres', 'tires'
-    }
-    
-    # Clean and normalize text
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    words = text.split()
-    
-    # Find F1 keywords in text
-    found_keywords = []
-    for word in words:
-        if word in f1_keywords and word not in found_keywords:
-            found_keywords.append(word)
-            if len(found_keywords) >= limit:
-                break
-    
-    # If we don't have enough F1 keywords, add common important words
-    if len(found_keywords) < limit:
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'was', 'are', 'were', 'will', 'would', 'could', 'should'}
-        for word in words:
-            if (len(word) > 3 and word not in common_words and 
-                word not in found_keywords and word.isalpha()):
-                found_keywords.append(word)
-                if len(found_keywords) >= limit:
-                    break
-    
-    return found_keywords[:limit]
+    return KeywordExtractor().extract_text(text, limit)
 
 
 class TerminalFormatter:
     """Format news items for terminal display."""
     
-    def format_news(self, news_items: List[NewsItem]):
-        """Display news items in a rich terminal format with detailed panels."""
-        if not news_items:
-            console.print("[yellow]No news items found.[/yellow]")
-            return
+    def __init__(self, keyword_extractor: Optional[KeywordExtractor] = None):
+        self.keyword_extractor = keyword_extractor
+    
+    def format_news(self, news_items: Iterable[NewsItem]):
+        """Display news items in a rich terminal format with detailed panels.
+        
+        Each panel is printed as soon as its item arrives from the stream, so
+        the first item shows up without waiting for the rest. Unless an
+        extractor fitted on the batch is given, fallback keywords are scored
+        against the items shown so far.
+        """
+        from rich.markup import escape
+        from rich.panel import Panel
         
-        # Display header
-        console.print(f"\n[bold blue]📰 F1 News ({len(news_items)} items)[/bold blue]\n")
+        console = get_console()
+        extractor = self.keyword_extractor or StreamingKeywordExtractor()
+        count = 0
         
         # Show detailed view for each news item
         for i, item in enumerate(news_items, 1):
+            if i == 1:
+                # Display header
+                console.print("\n[bold blue]📰 F1 News[/bold blue]\n")
+            else:
+                # Add spacing between items
+                console.print("")
+            count = i
+            
             # Extract keywords for this item
-            keywords = extract_keywords(item.content + " " + item.title, 5)
+            keywords = extractor.extract(item, 5)
             
             # Format timestamp
             time_str = item.timestamp.strftime("%Y-%m-%d %H:%M") if item.timestamp else "Unknown time"
@@ -71,19 +77,15 @@ class TerminalFormatter:
             # Format source
             source_str = f" • {item.source}" if item.source else ""
             
-            # Clean content - remove HTML tags and truncate
-            clean_content = re.sub(r'<[^>]+>', '', item.content)
-            clean_content = re.sub(r'\s+', ' ', clean_content).strip()
-            
             # Show more content but still truncate if very long
-            content_preview = clean_content[:400] + "..." if len(clean_content) > 400 else clean_content
+            content_preview = preview_text(item.text)
             
             # Create the panel content
-            panel_content = f"[bold]{item.title}[/bold]\n"
-            panel_content += f"[dim]{time_str}{source_str}[/dim]\n"
+            panel_content = f"[bold]{escape(item.title)}[/bold]\n"
+            panel_content += f"[dim]{time_str}{escape(source_str)}[/dim]\n"
             if keywords:
                 panel_content += f"[cyan]Keywords: {', '.join(keywords)}[/cyan]\n"
-            panel_content += f"\n{content_preview}\n"
+            panel_content += f"\n{escape(content_preview)}\n"
             panel_content += f"\n[link={item.url}]🔗 Read full article[/link]"
             
             # Create panel with item number
@@ -95,32 +97,91 @@ class TerminalFormatter:
                 border_style="blue"
             )
             console.print(panel)
+        
+        if not count:
+            console.print("[yellow]No news items found.[/yellow]")
+        else:
+            console.print(f"\n[dim]{count} items[/dim]")
+
+
+class PlainFormatter:
+    """Format news items as plain text without Rich rendering, for pipes and large outputs."""
+    
+    def __init__(self, keyword_extractor: Optional[KeywordExtractor] = None):
+        self.keyword_extractor = keyword_extractor
+    
+    def format_news(self, news_items: Iterable[NewsItem], file=None):
+        """Write each news item as plain text as soon as it arrives."""
+        extractor = self.keyword_extractor or StreamingKeywordExtractor()
+        count = 0
+        
+        for i, item in enumerate(news_items, 1):
+            count = i
+            time_str = item.timestamp.strftime("%Y-%m-%d %H:%M") if item.timestamp else "Unknown time"
+            source_str = f" | {item.source}" if item.source else ""
+            keywords = extractor.extract(item, 5)
             
-            # Add spacing between items (except after the last one)
-            if i < len(news_items):
-                console.print("")
+            lines = [f"{i}. {item.title}", f"   {time_str}{source_str}"]
+            if keywords:
+                lines.append(f"   Keywords: {', '.join(keywords)}")
+            lines.append(f"   {preview_text(item.text)}")
+            lines.append(f"   {item.url}")
+            print("\n".join(lines) + "\n", file=file, flush=True)
+        
+        if not count:
+            print("No news items found.", file=file)
+
+
+# JSON field name -> value getter; keywords are only computed when requested
+NEWS_FIELDS = {
+    "title": lambda item, extractor: item.title,
+    "content": lambda item, extractor: item.text,
+    "url": lambda item, extractor: item.url,
+    "source": lambda item, extractor: item.source,
+    "author": lambda item, extractor: item.author,
+    "timestamp": lambda item, extractor: item.timestamp.isoformat() if item.timestamp else None,
+    "tags": lambda item, extractor: item.tags,
+    "keywords": lambda item, extractor: extractor.extract(item, 5),
+}
 
 
 class JSONFormatter:
     """Format news items as JSON."""
     
-    def format_news(self, news_items: List[NewsItem]):
-        """Output news items as JSON."""
-        json_data = []
-        for item in news_items:
-            keywords = extract_keywords(item.content + " " + item.title, 5)
-            json_data.append({
-                "title": item.title,
-                "content": item.content,
-                "url": item.url,
-                "source": item.source,
-                "author": item.author,
-                "timestamp": item.timestamp.isoformat() if item.timestamp else None,
-                "tags": item.tags,
-                "keywords": keywords
-            })
+    def __init__(self, keyword_extractor: Optional[KeywordExtractor] = None,
+                 fields: Optional[List[str]] = None):
+        self.keyword_extractor = keyword_extractor
+        self.fields = fields or list(NEWS_FIELDS)
+    
+    def item_to_dict(self, item: NewsItem, extractor: Optional[KeywordExtractor]) -> dict:
+        """Convert a news item to a JSON-serializable dict of the selected fields."""
+        return {name: NEWS_FIELDS[name](item, extractor) for name in self.fields}
+    
+    def format_news(self, news_items: Iterable[NewsItem], file=None):
+        """Output news items as JSON to stdout or the given file."""
+        news_items = list(news_items)
+        extractor = None
+        if "keywords" in self.fields:
+            extractor = self.keyword_extractor or KeywordExtractor(news_items)
+        json_data = [self.item_to_dict(item, extractor) for item in news_items]
+        print(json.dumps(json_data, indent=2), file=file)
+
+
+class NDJSONFormatter(JSONFormatter):
+    """Format news items as newline-delimited JSON, one compact object per item."""
+    
+    def format_news(self, news_items: Iterable[NewsItem], file=None):
+        """Write each news item as soon as it arrives from the stream.
         
-        print(json.dumps(json_data, indent=2))
+        Items are not collected first, so unless an extractor fitted on the
+        batch is given, fallback keywords are scored against the items
+        written so far.
+        """
+        extractor = None
+        if "keywords" in self.fields:
+            extractor = self.keyword_extractor or StreamingKeywordExtractor()
+        for item in news_items:
+            print(json.dumps(self.item_to_dict(item, extractor), separators=(',', ':')), file=file, flush=True)
 
 
 class ResultFormatter:
@@ -128,6 +189,9 @@ class ResultFormatter:
     
     def format_results(self, race_results: RaceResults):
         """Display session results in a rich terminal format."""
+        from rich.table import Table
+        
+        console = get_console()
         # Determine session type and emoji (Windows-safe)
         session_type = "Race"
         emoji = "[RACE]"
@@ -162,46 +226,19 @@ class ResultFormatter:
             table.add_column("Fastest Lap", style="red", width=12)
         
         if session_type == "Qualifying":
-            # For qualifying, find the fastest overall time and calculate gaps
-            fastest_overall_time = None
-            fastest_time_seconds = float('inf')
-            
-            # Find the fastest qualifying time (position 1)
-            if race_results.results:
-                pole_result = race_results.results[0]  # Position 1 should be fastest
-                if pole_result.fastest_lap:
-                    try:
-                        parts = pole_result.fastest_lap.split(':')
-                        if len(parts) == 2:
-                            minutes = int(parts[0])
-                            seconds = float(parts[1])
-                            fastest_time_seconds = minutes * 60 + seconds
-                            fastest_overall_time = pole_result.fastest_lap
-                    except:
-                        pass
+            # Gaps are measured to the pole time (position 1)
+            pole_time = race_results.results[0].fastest_lap_time if race_results.results else None
             
             for result in race_results.results:
                 # For qualifying, use fastest_lap as the qualifying time
-                best_time = result.fastest_lap if result.fastest_lap else "No time"
+                best_time = result.fastest_lap_display or "No time"
                 
                 # Calculate gap to pole position
                 gap_display = ""
                 if result.position == 1:
                     gap_display = "Pole"
-                elif result.fastest_lap and fastest_time_seconds != float('inf'):
-                    try:
-                        parts = result.fastest_lap.split(':')
-                        if len(parts) == 2:
-                            minutes = int(parts[0])
-                            seconds = float(parts[1])
-                            driver_time_seconds = minutes * 60 + seconds
-                            gap_seconds = driver_time_seconds - fastest_time_seconds
-                            if gap_seconds >= 1:
-                                gap_display = f"+{gap_seconds:.3f}s"
-                            else:
-                                gap_display = f"+{gap_seconds:.3f}s"
-                    except:
-                        gap_display = ""
+                elif result.fastest_lap_time is not None and pole_time is not None:
+                    gap_display = f"+{result.fastest_lap_time - pole_time:.3f}s"
                 
                 # Highlight pole position in purple
                 if result.position == 1 and best_time:
@@ -216,34 +253,20 @@ class ResultFormatter:
                 )
         else:
             # For race/practice sessions, find the overall fastest lap time
-            fastest_overall = None
-            fastest_time = float('inf')
-            for result in race_results.results:
-                if result.fastest_lap:  # If driver has a fastest lap time
-                    # Parse time string to compare (format: "M:SS.sss")
-                    try:
-                        parts = result.fastest_lap.split(':')
-                        if len(parts) == 2:
-                            minutes = int(parts[0])
-                            seconds = float(parts[1])
-                            total_seconds = minutes * 60 + seconds
-                            if total_seconds < fastest_time:
-                                fastest_time = total_seconds
-                                fastest_overall = result.fastest_lap
-                    except:
-                        pass
+            lap_times = [r.fastest_lap_time for r in race_results.results if r.fastest_lap_time is not None]
+            fastest_time = min(lap_times) if lap_times else None
             
             for result in race_results.results:
                 # Highlight the overall fastest lap in purple
-                fastest_lap_display = result.fastest_lap
-                if result.fastest_lap == fastest_overall:
-                    fastest_lap_display = f"[purple]{result.fastest_lap}[/purple]"
+                fastest_lap_display = result.fastest_lap_display
+                if fastest_time is not None and result.fastest_lap_time == fastest_time:
+                    fastest_lap_display = f"[purple]{fastest_lap_display}[/purple]"
                 
                 table.add_row(
                     str(result.position),
                     result.driver,
                     result.team,
-                    result.time,
+                    result.time_display,
                     str(result.points),
                     fastest_lap_display
                 )
@@ -267,22 +290,160 @@ class ResultFormatter:
             console.print(f"3rd: {top_three[2].driver} ({top_three[2].team})")
 
 
+class ResultJSONFormatter:
+    """Format session results as JSON, with times as seconds."""
+    
+    def result_to_dict(self, result: RaceResult) -> dict:
+        """Convert a single result to a JSON-serializable dict."""
+        return {
+            "position": result.position,
+            "driver": result.driver,
+            "team": result.team,
+            "points": result.points,
+            "total_time": result.total_time,
+            "gap": result.gap,
+            "fastest_lap_time": result.fastest_lap_time,
+            "segment_times": result.segment_times,
+            "status": result.time if result.total_time is None and result.gap is None else None,
+        }
+    
+    def format_results(self, race_results: RaceResults, file=None):
+        """Output session results as JSON."""
+        json_data = {
+            "race_name": race_results.race_name,
+            "date": race_results.date.isoformat(),
+            "circuit": race_results.circuit,
+            "results": [self.result_to_dict(result) for result in race_results.results],
+        }
+        print(json.dumps(json_data, indent=2), file=file)
+
+
+class PaceFormatter:
+    """Format per-driver pace, degradation and stint analytics from a lap table."""
+    
+    def __init__(self, output_format: str = 'terminal'):
+        self.output_format = output_format
+    
+    @staticmethod
+    def _driver_name(drivers: dict, driver_number: int) -> str:
+        info = drivers.get(driver_number)
+        return info['full_name'] if info else f"#{driver_number}"
+    
+    @staticmethod
+    def _team_name(drivers: dict, driver_number: int) -> str:
+        info = drivers.get(driver_number)
+        return info['team_name'] if info else ""
+    
+    def format_pace(self, session_name: str, laps: 'LapTable', drivers: dict, gap_every: int = 10):
+        """Display median pace, best lap, degradation and gap to the leader every ``gap_every`` laps."""
+        median = laps.median_pace()
+        fastest = laps.fastest_laps()
+        degradation = laps.degradation()
+        gaps = laps.gap_evolution()
+        checkpoints = list(range(gap_every, gaps.shape[1] + 1, gap_every)) if gap_every else []
+        
+        rows = []
+        for index, driver_number in enumerate(int(d) for d in laps.drivers):
+            rows.append({
+                "driver_number": driver_number,
+                "driver": self._driver_name(drivers, driver_number),
+                "team": self._team_name(drivers, driver_number),
+                "median_pace": median.get(driver_number),
+                "fastest_lap_time": fastest.get(driver_number),
+                "degradation": degradation.get(driver_number),
+                "gaps": {lap: _finite(gaps[index, lap - 1]) for lap in checkpoints},
+            })
+        # Quickest median pace first; drivers without racing laps last
+        rows.sort(key=lambda row: (row["median_pace"] is None, row["median_pace"] or 0))
+        
+        if self.output_format == 'json':
+            print(json.dumps({"session": session_name, "drivers": rows}, indent=2))
+            return
+        
+        from rich.table import Table
+        
+        table = Table(title=f"{session_name} Pace")
+        table.add_column("Driver", style="magenta", width=20)
+        table.add_column("Team", style="cyan", width=20)
+        table.add_column("Median", style="yellow")
+        table.add_column("Best", style="green")
+        table.add_column("Deg (s/lap)", style="red")
+        for lap in checkpoints:
+            table.add_column(f"L{lap}", style="dim")
+        
+        for row in rows:
+            table.add_row(
+                row["driver"],
+                row["team"],
+                format_duration(row["median_pace"]) if row["median_pace"] is not None else "",
+                format_duration(row["fastest_lap_time"]) if row["fastest_lap_time"] is not None else "",
+                f"{row['degradation']:+.3f}" if row["degradation"] is not None else "",
+                *(format_gap(gap) if gap else ("Leader" if gap == 0 else "") for gap in row["gaps"].values())
+            )
+        get_console().print(table)
+    
+    def format_stints(self, session_name: str, laps: 'LapTable', drivers: dict):
+        """Display each driver's stints with median pace and degradation slope."""
+        stints = laps.stints()
+        
+        if self.output_format == 'json':
+            data = [dict(vars(stint), driver=self._driver_name(drivers, stint.driver_number)) for stint in stints]
+            print(json.dumps({"session": session_name, "stints": data}, indent=2))
+            return
+        
+        from rich.table import Table
+        
+        table = Table(title=f"{session_name} Stints")
+        table.add_column("Driver", style="magenta", width=20)
+        table.add_column("Stint", style="bold white")
+        table.add_column("Laps", style="cyan")
+        table.add_column("Median", style="yellow")
+        table.add_column("Deg (s/lap)", style="red")
+        
+        for stint in stints:
+            table.add_row(
+                self._driver_name(drivers, stint.driver_number),
+                str(stint.stint),
+                f"{stint.first_lap}-{stint.last_lap} ({stint.laps})",
+                format_duration(stint.median_pace) if stint.median_pace is not None else "",
+                f"{stint.degradation:+.3f}" if stint.degradation is not None else ""
+            )
+        get_console().print(table)
+
+
+def _finite(value) -> Optional[float]:
+    """Convert a NumPy value to a float, or None when it is NaN."""
+    value = float(value)
+    return None if value != value else value
+
+
 class MarkdownFormatter:
     """Format news items as Markdown."""
     
-    def format_news(self, news_items: List[NewsItem]):
-        """Output news items as Markdown."""
-        if not news_items:
-            print("No news items found.")
-            return
-            
-        print("# F1 News\n")
+    def __init__(self, title: str = "F1 News", keyword_extractor: Optional[KeywordExtractor] = None):
+        self.title = title
+        self.keyword_extractor = keyword_extractor
+    
+    def format_news(self, news_items: Iterable[NewsItem], file=None):
+        """Output news items as Markdown, writing each item as soon as it arrives.
         
+        Items are not collected first, so unless an extractor fitted on the
+        batch is given, fallback keywords are scored against the items
+        written so far.
+        """
+        extractor = self.keyword_extractor or StreamingKeywordExtractor()
+        count = 0
         for i, item in enumerate(news_items, 1):
-            keywords = extract_keywords(item.content + " " + item.title, 5)
-            print(f"## {i}. [{item.title}]({item.url})")
-            print(f"**Keywords:** {', '.join(keywords) if keywords else 'N/A'}")
+            if i == 1:
+                print(f"# {self.title}\n", file=file)
+            count = i
+            keywords = extractor.extract(item, 5)
+            print(f"## {i}. [{item.title}]({item.url})", file=file)
+            print(f"**Keywords:** {', '.join(keywords) if keywords else 'N/A'}", file=file)
             if item.timestamp:
-                print(f"**Time:** {item.timestamp.strftime('%Y-%m-%d %H:%M')}")
-            print(f"\n{item.content}\n")
-            print("---\n")
\ No newline at end of file
+                print(f"**Time:** {item.timestamp.strftime('%Y-%m-%d %H:%M')}", file=file)
+            print(f"\n{item.text}\n", file=file)
+            print("---\n", file=file)
+        
+        if not count:
+            print("No news items found.", file=file)
@@ -0,0 +1,57 @@
+import re
+from html.parser import HTMLParser
+from typing import List
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Tags whose boundaries separate words even without surrounding whitespace
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'figcaption',
+    'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'ol', 'p',
+    'pre', 'section', 'table', 'td', 'th', 'tr', 'ul',
+})
+
+# Tags whose content is never visible text
+SKIPPED_TAGS = frozenset({'script', 'style', 'template', 'noscript'})
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the visible text of an HTML fragment."""
+
+    def __init__(self):
+        # convert_charrefs decodes entities such as &amp; and &#8217; in text
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(' ')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.parts.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append(' ')
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(content: str) -> str:
+    """Convert an HTML fragment to plain text with entities decoded and whitespace collapsed."""
+    if '<' not in content and '&' not in content:
+        # Already plain text, skip the parser
+        return WHITESPACE_PATTERN.sub(' ', content).strip()
+
+    extractor = _TextExtractor()
+    extractor.feed(content)
+    extractor.close()
+    return WHITESPACE_PATTERN.sub(' ', ''.join(extractor.parts)).strip()
@@ -0,0 +1,156 @@
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from .models import NewsItem
+from .normalize import fold
+
+# F1 vocabulary, matched as whole (possibly multi-word) phrases
+F1_KEYWORDS = [
+    'verstappen', 'hamilton', 'leclerc', 'russell', 'norris', 'piastri', 'sainz', 'perez',
+    'alonso', 'stroll', 'ocon', 'gasly', 'albon', 'sargeant', 'bottas', 'zhou',
+    'hulkenberg', 'magnussen', 'tsunoda', 'ricciardo', 'lawson', 'bearman', 'antonelli',
+    'colapinto', 'hadjar', 'bortoleto', 'doohan',
+    'red bull', 'mercedes', 'ferrari', 'mclaren', 'aston martin', 'alpine', 'williams',
+    'haas', 'alphatauri', 'alfa romeo', 'racing bulls', 'sauber',
+    'racing', 'formula 1', 'f1', 'grand prix', 'qualifying', 'practice', 'sprint',
+    'championship', 'points', 'podium', 'pole position', 'fastest lap', 'drs',
+    'safety car', 'virtual safety car', 'pit stop', 'tyres', 'tires',
+]
+
+STOPWORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an',
+    'is', 'was', 'are', 'were', 'will', 'would', 'could', 'should', 'this', 'that', 'these',
+    'those', 'from', 'have', 'has', 'had', 'been', 'being', 'their', 'they', 'them', 'there',
+    'than', 'then', 'into', 'over', 'after', 'before', 'about', 'which', 'what', 'when',
+    'where', 'while', 'also', 'just', 'more', 'most', 'some', 'such', 'only', 'very', 'said',
+    'says', 'year', 'first', 'last', 'time', 'team', 'driver', 'drivers', 'teams', 'race',
+    'weekend', 'season', 'here', 'your', 'read', 'full', 'article', 'does',
+})
+
+# Items whose analysis and keywords an extractor keeps; older ones are analyzed again when asked for
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _phrase_regex(phrase: str) -> str:
+    """Regex for a phrase whose words may be separated by spaces or punctuation."""
+    return r'\b' + r'[\W_]+'.join(re.escape(word) for word in phrase.split()) + r'\b'
+
+
+# Longest phrases first so 'virtual safety car' wins over 'safety car'
+PHRASE_PATTERN = re.compile('|'.join(_phrase_regex(p) for p in sorted(F1_KEYWORDS, key=len, reverse=True)))
+WORD_PATTERN = re.compile(r'[^\W\d_]{4,}')
+SEPARATOR_PATTERN = re.compile(r'[\W_]+')
+
+
+def _analyze(folded_text: str) -> Tuple[List[str], List[str]]:
+    """Split folded text into F1 vocabulary phrases and candidate fallback terms."""
+    phrases = []
+    for match in PHRASE_PATTERN.finditer(folded_text):
+        phrase = SEPARATOR_PATTERN.sub(' ', match.group(0))
+        if phrase not in phrases:
+            phrases.append(phrase)
+
+    # Words already covered by a vocabulary phrase are not fallback candidates
+    remainder = PHRASE_PATTERN.sub(' ', folded_text)
+    terms = [word for word in WORD_PATTERN.findall(remainder) if word not in STOPWORDS]
+    return phrases, terms
+
+
+class _Analysis:
+    __slots__ = ('item', 'phrases', 'terms', 'generation', 'keywords')
+
+    def __init__(self, item: NewsItem, phrases: List[str], terms: List[str]):
+        # The item is kept so its id cannot be reused while the entry is cached
+        self.item = item
+        self.phrases = phrases
+        self.terms = terms
+        # Statistics generation the memoized keywords (limit -> keywords) were scored with
+        self.generation = -1
+        self.keywords: Dict[int, List[str]] = {}
+
+
+class KeywordExtractor:
+    """Extract keywords for a batch of news items.
+
+    F1 vocabulary phrases are found with a single precompiled pattern; when
+    an item mentions fewer than ``limit`` of them, the remaining slots go to
+    the item's terms with the highest TF-IDF across the batch. Document
+    frequencies are computed in one pass over the batch and each item is
+    analyzed and scored at most once while it is among the ``cache_size``
+    most recently used items, so a long-lived extractor stays bounded.
+    """
+
+    def __init__(self, news_items: Iterable[NewsItem] = (), cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._doc_freqs: Counter = Counter()
+        self._doc_count = 0
+        # Bumped by fit, since scores depend on the batch statistics
+        self._generation = 0
+        self._analyses: 'OrderedDict[int, _Analysis]' = OrderedDict()
+        self.fit(news_items)
+
+    def fit(self, news_items: Iterable[NewsItem]):
+        """Add a batch of items to the document frequency statistics."""
+        for item in news_items:
+            self._doc_freqs.update(set(self._analyze_item(item).terms))
+            self._doc_count += 1
+        self._generation += 1
+
+    def _analyze_item(self, item: NewsItem) -> _Analysis:
+        key = id(item)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = self._analyses[key] = _Analysis(item, *_analyze(item.folded_text))
+            if len(self._analyses) > self.cache_size:
+                self._analyses.popitem(last=False)
+        else:
+            self._analyses.move_to_end(key)
+        return analysis
+
+    def _rank_terms(self, phrases: List[str], terms: List[str], limit: int) -> List[str]:
+        keywords = phrases[:limit]
+        if len(keywords) >= limit or not terms:
+            return keywords
+
+        term_counts = Counter(terms)
+        first_seen = {term: i for i, term in reversed(list(enumerate(terms)))}
+        total = self._doc_count + 1
+
+        def tf_idf(term):
+            idf = math.log(total / (1 + self._doc_freqs.get(term, 0))) + 1
+            return term_counts[term] * idf
+
+        ranked = sorted(term_counts, key=lambda term: (-tf_idf(term), first_seen[term]))
+        keywords.extend(ranked[:limit - len(keywords)])
+        return keywords
+
+    def extract(self, item: NewsItem, limit: int = 5) -> List[str]:
+        """Keywords for a news item, memoized per item."""
+        analysis = self._analyze_item(item)
+        if analysis.generation != self._generation:
+            analysis.keywords.clear()
+            analysis.generation = self._generation
+        if limit not in analysis.keywords:
+            analysis.keywords[limit] = self._rank_terms(analysis.phrases, analysis.terms, limit)
+        return analysis.keywords[limit]
+
+    def extract_text(self, text: str, limit: int = 5) -> List[str]:
+        """Keywords for free text, scored against the batch statistics."""
+        phrases, terms = _analyze(fold(text))
+        return self._rank_terms(phrases, terms, limit)
+
+
+class StreamingKeywordExtractor(KeywordExtractor):
+    """Keyword extractor for items formatted as they arrive.
+
+    Each item joins the document frequencies when its keywords are first
+    asked for, so fallback terms are scored by TF-IDF against the items
+    streamed so far instead of needing the whole batch up front.
+    """
+
+    def extract(self, item: NewsItem, limit: int = 5) -> List[str]:
+        if id(item) not in self._analyses:
+            self.fit((item,))
+        return super().extract(item, limit)
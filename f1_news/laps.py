@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class StintSummary:
+    """Pace summary for one driver's stint."""
+    driver_number: int
+    stint: int
+    first_lap: int
+    last_lap: int
+    laps: int
+    median_pace: Optional[float]
+    degradation: Optional[float]
+
+
+class LapTable:
+    """Columnar lap data for one session, built once from the OpenF1 laps payload.
+
+    Rows are sorted by driver then lap number, so each driver's laps are a
+    contiguous slice. Missing durations are stored as NaN.
+    """
+
+    def __init__(self, driver_number, lap_number, lap_duration, sector_1, sector_2, sector_3, pit_out):
+        order = np.lexsort((lap_number, driver_number))
+        self.driver_number = np.asarray(driver_number, dtype=np.int32)[order]
+        self.lap_number = np.asarray(lap_number, dtype=np.int32)[order]
+        self.lap_duration = np.asarray(lap_duration, dtype=np.float64)[order]
+        self.sector_1 = np.asarray(sector_1, dtype=np.float64)[order]
+        self.sector_2 = np.asarray(sector_2, dtype=np.float64)[order]
+        self.sector_3 = np.asarray(sector_3, dtype=np.float64)[order]
+        self.pit_out = np.asarray(pit_out, dtype=bool)[order]
+
+        # Group index of each row into self.drivers
+        self.drivers, self._group = np.unique(self.driver_number, return_inverse=True)
+        self._starts = np.searchsorted(self.driver_number, self.drivers)
+
+    @classmethod
+    def from_laps(cls, laps_data: List[dict]) -> 'LapTable':
+        """Build a table from OpenF1 ``/laps`` records.
+
+        Records without a lap number are numbered in payload order per driver.
+        """
+        columns = {name: [] for name in ('driver', 'lap', 'duration', 's1', 's2', 's3', 'pit')}
+        seen: Dict[int, int] = {}
+        for lap in laps_data:
+            driver_num = lap['driver_number']
+            seen[driver_num] = seen.get(driver_num, 0) + 1
+            columns['driver'].append(driver_num)
+            columns['lap'].append(lap.get('lap_number') or seen[driver_num])
+            columns['duration'].append(_seconds(lap.get('lap_duration')))
+            columns['s1'].append(_seconds(lap.get('duration_sector_1')))
+            columns['s2'].append(_seconds(lap.get('duration_sector_2')))
+            columns['s3'].append(_seconds(lap.get('duration_sector_3')))
+            columns['pit'].append(bool(lap.get('is_pit_out_lap')))
+        return cls(columns['driver'], columns['lap'], columns['duration'],
+                   columns['s1'], columns['s2'], columns['s3'], columns['pit'])
+
+    def __len__(self) -> int:
+        return len(self.driver_number)
+
+    def _per_driver(self, values: np.ndarray) -> Dict[int, float]:
+        return {int(driver): float(value) for driver, value in zip(self.drivers, values) if not np.isnan(value)}
+
+    def fastest_laps(self) -> Dict[int, float]:
+        """Each driver's fastest valid lap."""
+        if not len(self):
+            return {}
+        durations = np.where(self.lap_duration > 0, self.lap_duration, np.inf)
+        fastest = np.minimum.reduceat(durations, self._starts)
+        return self._per_driver(np.where(np.isinf(fastest), np.nan, fastest))
+
+    def total_times(self) -> Dict[int, float]:
+        """Each driver's summed lap times; drivers without any timed lap are left out."""
+        durations = np.nan_to_num(self.lap_duration)
+        totals = np.bincount(self._group, weights=durations, minlength=len(self.drivers))
+        return self._per_driver(np.where(totals > 0, totals, np.nan))
+
+    def _racing_laps(self) -> np.ndarray:
+        """Mask of laps that represent race pace: timed, not the opening lap or a pit-out lap."""
+        return ~np.isnan(self.lap_duration) & (self.lap_duration > 0) & ~self.pit_out & (self.lap_number > 1)
+
+    def median_pace(self) -> Dict[int, float]:
+        """Each driver's median lap time over racing laps."""
+        mask = self._racing_laps()
+        return self._per_driver(_group_medians(self._group[mask], self.lap_duration[mask], len(self.drivers)))
+
+    def stint_numbers(self) -> np.ndarray:
+        """Stint number of each row, starting at 1 and incremented at every pit-out lap.
+
+        A pit-out on a driver's first lap (pit lane start, qualifying out-lap)
+        does not open a second stint.
+        """
+        pits = np.cumsum(self.pit_out)
+        return pits - pits[self._starts][self._group] + 1
+
+    def stints(self) -> List[StintSummary]:
+        """Per-driver stints with their median pace and degradation slope (seconds per lap)."""
+        if not len(self):
+            return []
+        stint = self.stint_numbers()
+        stride = int(stint.max()) + 1
+        # One key per (driver, stint); rows are sorted by driver then lap, so keys never decrease
+        keys = self._group.astype(np.int64) * stride + stint
+        unique_keys, key_index = np.unique(keys, return_inverse=True)
+        count = len(unique_keys)
+        starts = np.searchsorted(key_index, np.arange(count))
+
+        first_lap = self.lap_number[starts]
+        last_lap = np.maximum.reduceat(self.lap_number, starts)
+        laps = np.bincount(key_index, minlength=count)
+
+        mask = self._racing_laps()
+        groups = key_index[mask]
+        durations = self.lap_duration[mask]
+        medians = _group_medians(groups, durations, count)
+        slopes = _group_slopes(groups, (self.lap_number - first_lap[key_index])[mask], durations, count)
+
+        return [
+            StintSummary(
+                driver_number=int(self.drivers[key // stride]),
+                stint=int(key % stride),
+                first_lap=int(first_lap[index]),
+                last_lap=int(last_lap[index]),
+                laps=int(laps[index]),
+                median_pace=None if np.isnan(medians[index]) else float(medians[index]),
+                degradation=None if np.isnan(slopes[index]) else float(slopes[index]),
+            )
+            for index, key in enumerate(unique_keys)
+        ]
+
+    def degradation(self) -> Dict[int, float]:
+        """Each driver's degradation slope, averaged over stints weighted by stint length."""
+        weighted: Dict[int, List[float]] = {}
+        for summary in self.stints():
+            if summary.degradation is not None:
+                total = weighted.setdefault(summary.driver_number, [0.0, 0.0])
+                total[0] += summary.degradation * summary.laps
+                total[1] += summary.laps
+        return {driver: total / laps for driver, (total, laps) in weighted.items() if laps}
+
+    def gap_evolution(self) -> np.ndarray:
+        """Gap to the leader at the end of every lap, as a drivers x laps array.
+
+        Row order follows ``self.drivers``. A driver's gap is NaN from the
+        first lap without a time onwards.
+        """
+        if not len(self):
+            return np.empty((0, 0))
+        lap_count = int(self.lap_number.max())
+        durations = np.full((len(self.drivers), lap_count), np.nan)
+        durations[self._group, self.lap_number - 1] = self.lap_duration
+        elapsed = np.cumsum(durations, axis=1)
+        leader = np.min(np.where(np.isnan(elapsed), np.inf, elapsed), axis=0)
+        leader[np.isinf(leader)] = np.nan
+        return elapsed - leader
+
+    def columns(self) -> Dict[str, list]:
+        """Column name -> values mapping for columnar export."""
+        def values(array):
+            return [None if np.isnan(value) else float(value) for value in array]
+
+        return {
+            "driver_number": self.driver_number.tolist(),
+            "lap_number": self.lap_number.tolist(),
+            "stint": self.stint_numbers().tolist(),
+            "lap_duration": values(self.lap_duration),
+            "sector_1": values(self.sector_1),
+            "sector_2": values(self.sector_2),
+            "sector_3": values(self.sector_3),
+            "pit_out": self.pit_out.tolist(),
+        }
+
+
+def _seconds(value) -> float:
+    return float(value) if value is not None else np.nan
+
+
+def _group_medians(groups: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+    """Median of values within each group; groups must be sorted. NaN for empty groups."""
+    medians = np.full(count, np.nan)
+    bounds = np.searchsorted(groups, np.arange(count + 1))
+    for index in np.flatnonzero(np.diff(bounds)):
+        medians[index] = np.median(values[bounds[index]:bounds[index + 1]])
+    return medians
+
+
+def _group_slopes(groups: np.ndarray, x: np.ndarray, y: np.ndarray, count: int) -> np.ndarray:
+    """Least-squares slope of y against x within each group; NaN with fewer than 3 points."""
+    n = np.bincount(groups, minlength=count).astype(np.float64)
+    sx = np.bincount(groups, weights=x, minlength=count)
+    sy = np.bincount(groups, weights=y, minlength=count)
+    sxx = np.bincount(groups, weights=x * x, minlength=count)
+    sxy = np.bincount(groups, weights=x * y, minlength=count)
+    with np.errstate(all='ignore'):
+        slopes = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    slopes[(n < 3) | ~np.isfinite(slopes)] = np.nan
+    return slopes
@@ -0,0 +1,134 @@
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import tracemalloc
+
+_profiler: Optional['MemoryProfiler'] = None
+
+
+class AllocationSite(NamedTuple):
+    location: str
+    # Bytes and blocks still allocated from this line, compared with the previous checkpoint
+    size: int
+    count: int
+
+
+class StageMemory(NamedTuple):
+    name: str
+    # Traced bytes when the stage ended
+    current: int
+    # Highest traced bytes between the previous checkpoint and this one
+    peak: int
+    # Change in traced bytes since the previous checkpoint
+    growth: int
+    top_sites: List[AllocationSite]
+
+
+def _location(frame) -> str:
+    # The package directory and file are enough to tell sites apart
+    return f"{'/'.join(Path(frame.filename).parts[-2:])}:{frame.lineno}"
+
+
+class MemoryProfiler:
+    """Traces allocations and snapshots them whenever a stage ends.
+
+    Stages of the lazy news pipeline overlap: parsing, filtering and
+    formatting interleave item by item. A stage's peak is therefore the
+    peak since the previous checkpoint, whichever stages ran in that time.
+    """
+
+    def __init__(self, top: int = 5):
+        # Imported here so that runs without --memprofile never load tracemalloc
+        import tracemalloc
+
+        self.top = top
+        self.stages: List[StageMemory] = []
+        self._lock = threading.Lock()
+        tracemalloc.start()
+        self._snapshot = self._take_snapshot()
+        self._current, self._traced_peak = tracemalloc.get_traced_memory()
+        self._reset_peak()
+
+    @staticmethod
+    def _reset_peak():
+        import tracemalloc
+
+        # reset_peak is new in Python 3.9; checkpoint works out stage peaks without it
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+    @staticmethod
+    def _take_snapshot() -> 'tracemalloc.Snapshot':
+        import tracemalloc
+
+        # Leave out what taking and comparing snapshots allocates, and the code of lazily imported modules
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ))
+
+    def checkpoint(self, name: str):
+        """Record the memory in use now and the top allocation sites since the last checkpoint."""
+        import tracemalloc
+
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            if not hasattr(tracemalloc, 'reset_peak'):
+                # The peak is the whole run's, so it only belongs to this stage if it rose since the last one
+                rose, self._traced_peak = peak > self._traced_peak, peak
+                if not rose:
+                    peak = max(current, self._current)
+            snapshot = self._take_snapshot()
+            differences = [stat for stat in snapshot.compare_to(self._snapshot, 'lineno') if stat.size_diff > 0]
+            top_sites = [AllocationSite(_location(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                         for stat in differences[:self.top]]
+            self.stages.append(StageMemory(name, current, peak, current - self._current, top_sites))
+            self._snapshot = snapshot
+            self._current = current
+            self._reset_peak()
+
+    @property
+    def peak(self) -> int:
+        """Highest traced bytes over the whole run."""
+        return max((stage.peak for stage in self.stages), default=0)
+
+    def stop(self):
+        import tracemalloc
+
+        tracemalloc.stop()
+
+
+def enable(top: int = 5) -> MemoryProfiler:
+    """Start tracing allocations; returns the profiler that checkpoints are recorded by."""
+    global _profiler
+    _profiler = MemoryProfiler(top)
+    return _profiler
+
+
+def disable():
+    global _profiler
+    if _profiler is not None:
+        _profiler.stop()
+    _profiler = None
+
+
+def checkpoint(name: str):
+    """Mark the end of a stage, or do nothing while memory profiling is off."""
+    if _profiler is not None:
+        _profiler.checkpoint(name)
+
+
+def checkpoint_after(name: str, iterable):
+    """Pass a stream through, marking the end of a stage once it is exhausted; the stream itself while off."""
+    if _profiler is None:
+        return iterable
+    return _checkpoint_after(name, iterable)
+
+
+def _checkpoint_after(name: str, iterable):
+    yield from iterable
+    checkpoint(name)
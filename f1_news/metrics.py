@@ -0,0 +1,229 @@
+import math
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# Seconds; covers a warm connection to a slow feed behind a 30 s timeout
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {', '.join(self.labelnames) or '(none)'}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[Tuple[str, str]], float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {_escape(self.help)}"]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+class Counter(_Metric):
+    """A count that only goes up, one per label combination."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}_total", list(zip(self.labelnames, key)), value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their count and sum."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            counts, _ = self._values.get(self._key(labels)) or ((), 0.0)
+            return sum(counts)
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in values:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + [('le', _number(float(bound)))], cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total
+
+
+class Registry:
+    """The metrics of one process, rendered together in OpenMetrics text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"{metric.name} is already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def clear(self):
+        """Forget every observation (metrics stay registered)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return ''.join(metric.render() for metric in metrics) + '# EOF\n'
+
+    def write_textfile(self, path: str):
+        """Write the metrics for a textfile collector, replacing the file atomically."""
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+REGISTRY = Registry()
+
+FEED_FETCH_SECONDS = REGISTRY.histogram(
+    'f1news_feed_fetch_seconds', "Time to download an RSS feed", ('source',))
+FEED_BYTES = REGISTRY.counter(
+    'f1news_feed_bytes', "Bytes of RSS feed documents downloaded", ('source',))
+FEED_ERRORS = REGISTRY.counter(
+    'f1news_feed_errors', "RSS feed downloads that failed", ('source',))
+CACHE_LOOKUPS = REGISTRY.counter(
+    'f1news_cache_lookups', "Cache reads by cache and outcome (hit, miss, expired)", ('cache', 'result'))
+OPENF1_REQUESTS = REGISTRY.counter(
+    'f1news_openf1_requests', "OpenF1 requests by endpoint and HTTP status ('error' if none came back)",
+    ('endpoint', 'status'))
+OPENF1_SECONDS = REGISTRY.histogram(
+    'f1news_openf1_request_seconds', "Time to answer an OpenF1 request", ('endpoint',))
+OPENF1_BYTES = REGISTRY.counter(
+    'f1news_openf1_bytes', "Bytes of OpenF1 responses downloaded", ('endpoint',))
+RESULTS_FALLBACKS = REGISTRY.counter(
+    'f1news_results_fallbacks', "Results replaced by mock data after an OpenF1 failure", ('session_type',))
+RESULTS_DEGRADED = REGISTRY.counter(
+    'f1news_results_degraded', "Results built without part of their data (laps, session_result)", ('part',))
+
+
+def response_size(response) -> int:
+    """Body size of an HTTP response, or 0 when it has no byte body."""
+    content = getattr(response, 'content', None)
+    return len(content) if isinstance(content, bytes) else 0
+
+
+def send_metrics(handler: 'BaseHTTPRequestHandler', registry: Registry = REGISTRY):
+    """Answer an HTTP request with the registry in OpenMetrics text format."""
+    body = registry.render().encode()
+    handler.send_response(200)
+    handler.send_header('Content-Type', CONTENT_TYPE)
+    handler.send_header('Content-Length', str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def serve_metrics(port: int, host: str = '127.0.0.1', registry: Optional[Registry] = None) -> 'ThreadingHTTPServer':
+    """Serve /metrics from a background thread for as long as the process runs."""
+    # Imported here: every fetch loads this module for its counters, few runs serve them
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        """Serve the registry at /metrics."""
+
+        server_version = "f1-news-metrics"
+
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+            send_metrics(self, self.server.registry)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    server.registry = registry or REGISTRY
+    threading.Thread(target=server.serve_forever, name="f1-news-metrics", daemon=True).start()
+    return server
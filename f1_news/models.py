@@ -1,33 +1,152 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .durations import format_duration, format_gap, parse_duration
+from .htmltext import html_to_text
+from .normalize import fold
 
+# __slots__ drops the per-instance __dict__; dataclass only generates them from 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class NewsItem:
-    """Represents a single F1 news item."""
+    """Represents a single F1 news item.
+    
+    Items are immutable. ``source`` is interned so every item from a feed
+    shares one string, and ``tags`` is a tuple that defaults to the shared
+    empty tuple instead of a fresh list per item.
+    """
     title: str
     content: str
     url: str
     source: str
     author: Optional[str] = None
     timestamp: Optional[datetime] = None
-    tags: Optional[list] = None
+    tags: Tuple[str, ...] = ()
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _folded_title: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _folded_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        if isinstance(self.source, str):
+            object.__setattr__(self, 'source', sys.intern(self.source))
         if self.tags is None:
-            self.tags = []
+            object.__setattr__(self, 'tags', ())
+        elif not isinstance(self.tags, tuple):
+            object.__setattr__(self, 'tags', tuple(self.tags))
+    
+    @property
+    def text(self) -> str:
+        """Plain-text content with HTML removed, computed once per item."""
+        if self._text is None:
+            object.__setattr__(self, '_text', html_to_text(self.content))
+        return self._text
+    
+    @property
+    def folded_title(self) -> str:
+        """Accent-free lowercase title, computed once per item."""
+        if self._folded_title is None:
+            object.__setattr__(self, '_folded_title', fold(self.title))
+        return self._folded_title
+    
+    @property
+    def folded_text(self) -> str:
+        """Accent-free lowercase title and content, computed once per item."""
+        if self._folded_text is None:
+            object.__setattr__(self, '_folded_text', self.folded_title + "\n" + fold(self.text))
+        return self._folded_text
+
+
+class NewsBatch:
+    """Compact, read-only container for many news items.
+    
+    Fields are stored column-wise in tuples, so a large archive costs a few
+    pointers per item instead of one object per item. Items are rebuilt on
+    access; derived text is not cached across accesses.
+    """
+    
+    __slots__ = ('titles', 'contents', 'urls', 'sources', 'authors', 'timestamps', 'tags')
+    
+    def __init__(self, news_items: Iterable[NewsItem] = ()):
+        news_items = list(news_items)
+        self.titles = tuple(item.title for item in news_items)
+        self.contents = tuple(item.content for item in news_items)
+        self.urls = tuple(item.url for item in news_items)
+        self.sources = tuple(sys.intern(item.source) for item in news_items)
+        self.authors = tuple(item.author for item in news_items)
+        self.timestamps = tuple(item.timestamp for item in news_items)
+        self.tags = tuple(item.tags for item in news_items)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def __getitem__(self, index: int) -> NewsItem:
+        return NewsItem(
+            title=self.titles[index],
+            content=self.contents[index],
+            url=self.urls[index],
+            source=self.sources[index],
+            author=self.authors[index],
+            timestamp=self.timestamps[index],
+            tags=self.tags[index],
+        )
+    
+    def __iter__(self) -> Iterator[NewsItem]:
+        for index in range(len(self)):
+            yield self[index]
 
 
 @dataclass
 class RaceResult:
-    """Represents a race result for a driver."""
+    """Represents a race result for a driver.
+    
+    Times are carried as seconds in the numeric fields and formatted only
+    when displayed. ``time`` and ``fastest_lap`` are optional display
+    strings; when given without numeric values they are parsed once here.
+    """
     position: int
     driver: str
     team: str
-    time: str
-    points: int
+    time: str = ""
+    points: int = 0
     fastest_lap: str = ""
+    total_time: Optional[float] = None
+    gap: Optional[float] = None
+    fastest_lap_time: Optional[float] = None
+    segment_times: Optional[List[Optional[float]]] = None
+    
+    def __post_init__(self):
+        if self.total_time is None and self.gap is None:
+            parsed = parse_duration(self.time)
+            if parsed is not None:
+                if self.time.strip().startswith('+'):
+                    self.gap = parsed
+                else:
+                    self.total_time = parsed
+        if self.fastest_lap_time is None:
+            self.fastest_lap_time = parse_duration(self.fastest_lap)
+    
+    @property
+    def time_display(self) -> str:
+        """Race time for display: total time for the leader, gap for the rest."""
+        if self.time:
+            return self.time
+        if self.gap is not None:
+            return format_gap(self.gap)
+        if self.total_time is not None:
+            return format_duration(self.total_time)
+        return ""
+    
+    @property
+    def fastest_lap_display(self) -> str:
+        """Fastest lap for display."""
+        if self.fastest_lap:
+            return self.fastest_lap
+        if self.fastest_lap_time is not None:
+            return format_duration(self.fastest_lap_time)
+        return ""
 
 
 @dataclass
@@ -36,4 +155,6 @@ class RaceResults:
     race_name: str
     date: datetime
     circuit: str
-    results: list[RaceResult]
\ No newline at end of file
+    results: list[RaceResult]
+    # True for the placeholder classification returned when OpenF1 could not be reached
+    fallback: bool = False
\ No newline at end of file
@@ -0,0 +1,110 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Pattern
+
+
+# Canonical driver name -> names and nicknames used for them in articles
+DRIVER_ALIASES: Dict[str, List[str]] = {
+    'verstappen': ['verstappen', 'max verstappen', 'mad max'],
+    'perez': ['perez', 'sergio perez', 'checo'],
+    'leclerc': ['leclerc', 'charles leclerc'],
+    'sainz': ['sainz', 'carlos sainz', 'smooth operator'],
+    'hamilton': ['hamilton', 'lewis hamilton', 'sir lewis'],
+    'russell': ['russell', 'george russell'],
+    'norris': ['norris', 'lando norris'],
+    'piastri': ['piastri', 'oscar piastri'],
+    'alonso': ['alonso', 'fernando alonso'],
+    'stroll': ['stroll', 'lance stroll'],
+    'gasly': ['gasly', 'pierre gasly'],
+    'ocon': ['ocon', 'esteban ocon'],
+    'albon': ['albon', 'alex albon', 'alexander albon'],
+    'sargeant': ['sargeant', 'logan sargeant'],
+    'tsunoda': ['tsunoda', 'yuki tsunoda'],
+    'ricciardo': ['ricciardo', 'daniel ricciardo', 'danny ric', 'honey badger'],
+    'bottas': ['bottas', 'valtteri bottas'],
+    'zhou': ['zhou', 'zhou guanyu', 'guanyu zhou'],
+    'magnussen': ['magnussen', 'kevin magnussen', 'kmag', 'k-mag'],
+    'hulkenberg': ['hulkenberg', 'hulkenburg', 'nico hulkenberg', 'hulk'],
+    'lawson': ['lawson', 'liam lawson'],
+    'bearman': ['bearman', 'oliver bearman', 'ollie bearman'],
+    'antonelli': ['antonelli', 'kimi antonelli', 'andrea kimi antonelli'],
+    'colapinto': ['colapinto', 'franco colapinto'],
+    'hadjar': ['hadjar', 'isack hadjar'],
+    'bortoleto': ['bortoleto', 'gabriel bortoleto'],
+    'doohan': ['doohan', 'jack doohan'],
+}
+
+# Canonical team name -> current, former and sponsor names for the entry. Car makers that
+# also sell road cars only count with an F1 qualifier, so 'audi' alone is not Sauber news
+TEAM_ALIASES: Dict[str, List[str]] = {
+    'red bull': ['red bull', 'red bull racing', 'redbull', 'rbr', 'oracle red bull racing'],
+    'ferrari': ['ferrari', 'scuderia ferrari', 'prancing horse'],
+    'mercedes': ['mercedes', 'mercedes-amg', 'silver arrows'],
+    'mclaren': ['mclaren', 'papaya'],
+    'aston martin': ['aston martin', 'aston'],
+    'alpine': ['alpine', 'bwt alpine', 'renault f1', 'renault sport f1'],
+    'williams': ['williams'],
+    'racing bulls': ['racing bulls', 'rb', 'vcarb', 'visa cash app rb', 'alphatauri', 'alpha tauri', 'toro rosso'],
+    'sauber': ['sauber', 'kick sauber', 'stake f1', 'alfa romeo f1', 'alfa romeo racing', 'audi f1'],
+    'haas': ['haas', 'moneygram haas'],
+}
+
+
+def fold(text: str) -> str:
+    """Lowercase text and strip accents so that 'Pérez' and 'perez' compare equal."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.casefold()
+
+
+def _build_alias_index(table: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map every folded alias (and canonical name) to its canonical name."""
+    index = {}
+    for canonical, aliases in table.items():
+        index[fold(canonical)] = canonical
+        for alias in aliases:
+            index[fold(alias)] = canonical
+    return index
+
+
+DRIVER_ALIAS_INDEX = _build_alias_index(DRIVER_ALIASES)
+TEAM_ALIAS_INDEX = _build_alias_index(TEAM_ALIASES)
+
+
+def resolve_driver(name: str) -> str:
+    """Return the canonical driver name for a name or nickname, or the folded name."""
+    folded = fold(name).strip()
+    return DRIVER_ALIAS_INDEX.get(folded, folded)
+
+
+def resolve_team(name: str) -> str:
+    """Return the canonical team name for a team alias, or the folded name."""
+    folded = fold(name).strip()
+    return TEAM_ALIAS_INDEX.get(folded, folded)
+
+
+def _alias_pattern(aliases: List[str]) -> Pattern:
+    """Compile a single word-bounded alternation matching any of the aliases."""
+    # Longest first so that 'red bull racing' wins over 'red bull'
+    ordered = sorted({fold(alias) for alias in aliases}, key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(re.escape(alias) for alias in ordered) + r')\b')
+
+
+@lru_cache(maxsize=256)
+def driver_pattern(name: str) -> Pattern:
+    """Compiled pattern matching a driver by any known alias."""
+    canonical = resolve_driver(name)
+    if canonical not in DRIVER_ALIASES:
+        # Unknown names keep plain substring matching
+        return re.compile(re.escape(canonical))
+    return _alias_pattern(DRIVER_ALIASES[canonical])
+
+
+@lru_cache(maxsize=256)
+def team_pattern(name: str) -> Pattern:
+    """Compiled pattern matching a team by any known alias."""
+    canonical = resolve_team(name)
+    if canonical not in TEAM_ALIASES:
+        return re.compile(re.escape(canonical))
+    return _alias_pattern(TEAM_ALIASES[canonical])
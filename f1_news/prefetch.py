@@ -0,0 +1,202 @@
+import hashlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from .cache import Cache
+from .metrics import FEED_BYTES, FEED_ERRORS, FEED_FETCH_SECONDS, response_size
+
+# Bounds for any feed's poll interval, in seconds
+MIN_INTERVAL = 120
+MAX_INTERVAL = 6 * 3600
+DEFAULT_INTERVAL = 900
+
+# Weight of the newest observed change interval in the running estimate
+SMOOTHING = 0.3
+
+# Growth factor applied to the interval each time a poll finds no change
+BACKOFF = 1.5
+
+# Seconds in each sy:updatePeriod unit
+UPDATE_PERIODS = {'hourly': 3600, 'daily': 86400, 'weekly': 604800, 'monthly': 2592000, 'yearly': 31536000}
+
+STATE_KEY = 'prefetch_state'
+
+# Cached feeds older than this are discarded even if a feed's interval is longer
+MAX_FEED_AGE = 7 * 86400
+
+
+class FeedCache:
+    """Raw feed documents kept warm by the prefetch scheduler.
+
+    Each entry remembers how long it may be served: the feed's learned
+    poll interval at the time it was written.
+    """
+
+    def __init__(self, cache: Optional[Cache] = None):
+        self.cache = cache or Cache()
+
+    def get(self, source_key: str) -> Optional[str]:
+        """The cached feed document, if it is still within its feed's interval."""
+        entry = self.cache.get(f"feed_{source_key}", max_age=MAX_FEED_AGE)
+        if not entry or time.time() - entry['fetched_at'] > entry['max_age']:
+            return None
+        return entry['content']
+
+    def put(self, source_key: str, content: str, max_age: float):
+        """Store a feed document to be served for ``max_age`` seconds."""
+        self.cache.set(f"feed_{source_key}", {'content': content, 'fetched_at': time.time(), 'max_age': max_age})
+
+    def has(self, source_key: str) -> bool:
+        """Whether a document is cached for the feed at all, even one past its interval."""
+        return bool(self.cache.get(f"feed_{source_key}", max_age=MAX_FEED_AGE))
+
+    def touch(self, source_key: str, max_age: float):
+        """Mark a cached document as fresh again after a poll found it unchanged."""
+        entry = self.cache.get(f"feed_{source_key}", max_age=MAX_FEED_AGE)
+        if entry:
+            self.put(source_key, entry['content'], max_age)
+
+
+@dataclass
+class FeedSchedule:
+    """What the scheduler has learned about one feed."""
+    interval: float = DEFAULT_INTERVAL
+    next_due: float = 0.0
+    last_changed: Optional[float] = None
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    # Publisher hint (RSS ttl): never poll more often than this
+    min_interval: float = MIN_INTERVAL
+
+    def clamp(self, interval: float) -> float:
+        return min(MAX_INTERVAL, max(self.min_interval, interval))
+
+    def record_change(self, now: float):
+        """Pull the interval towards the time since the previous change."""
+        if self.last_changed is not None:
+            observed = now - self.last_changed
+            self.interval = self.clamp(SMOOTHING * observed + (1 - SMOOTHING) * self.interval)
+        self.last_changed = now
+
+    def record_unchanged(self):
+        """Back off while the feed stays the same."""
+        self.interval = self.clamp(self.interval * BACKOFF)
+
+    def apply_hints(self, feed_info: dict):
+        """Use RSS ttl and sy:updatePeriod/updateFrequency as bounds and a starting estimate."""
+        ttl = feed_info.get('ttl')
+        if ttl and str(ttl).isdigit():
+            self.min_interval = max(MIN_INTERVAL, int(ttl) * 60)
+        period = UPDATE_PERIODS.get(str(feed_info.get('sy_updateperiod', '')).strip().lower())
+        if period:
+            frequency = str(feed_info.get('sy_updatefrequency', '1')).strip()
+            hinted = period / (int(frequency) if frequency.isdigit() and int(frequency) > 0 else 1)
+            if self.last_changed is None:
+                # Nothing observed yet, so the publisher's estimate is the best guess
+                self.interval = hinted
+        self.interval = self.clamp(self.interval)
+
+
+class PrefetchScheduler:
+    """Poll each feed on its own adaptive schedule and keep the feed cache warm.
+
+    A feed's interval shrinks towards the observed time between changes and
+    grows while polls find nothing new, within the bounds set by its RSS
+    hints. Polls are conditional (ETag / Last-Modified), so an unchanged feed
+    costs a 304.
+    """
+
+    def __init__(self, rss_source, feed_cache: Optional[FeedCache] = None, http=None):
+        self.rss_source = rss_source
+        self.feed_cache = feed_cache or FeedCache()
+        self.http = http or rss_source.http
+        self.schedules: Dict[str, FeedSchedule] = self._load_state()
+
+    def _load_state(self) -> Dict[str, FeedSchedule]:
+        state = self.feed_cache.cache.get(STATE_KEY, max_age=MAX_FEED_AGE) or {}
+        schedules = {}
+        for key in self.rss_source.rss_feeds:
+            try:
+                schedules[key] = FeedSchedule(**state[key]) if key in state else FeedSchedule()
+            except TypeError:
+                schedules[key] = FeedSchedule()
+        return schedules
+
+    def save_state(self):
+        self.feed_cache.cache.set(STATE_KEY, {key: asdict(schedule) for key, schedule in self.schedules.items()})
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Feeds whose next poll time has passed."""
+        now = time.time() if now is None else now
+        return [key for key, schedule in self.schedules.items() if schedule.next_due <= now]
+
+    def poll(self, source_key: str, now: Optional[float] = None) -> bool:
+        """Conditionally fetch one feed, update its schedule and the cache; return whether it changed."""
+        import feedparser
+        import requests
+
+        now = time.time() if now is None else now
+        schedule = self.schedules[source_key]
+        headers = {}
+        if self.feed_cache.has(source_key):
+            if schedule.etag:
+                headers['If-None-Match'] = schedule.etag
+            if schedule.modified:
+                headers['If-Modified-Since'] = schedule.modified
+        else:
+            # A 304 would leave nothing to serve, so fetch the whole feed again
+            schedule.etag = schedule.modified = None
+
+        start = time.perf_counter()
+        response = (self.http or requests).get(self.rss_source.rss_feeds[source_key], headers=headers, timeout=30)
+        FEED_FETCH_SECONDS.observe(time.perf_counter() - start, source=source_key)
+        FEED_BYTES.inc(response_size(response), source=source_key)
+        changed = False
+        if response.status_code == 304:
+            schedule.record_unchanged()
+            self.feed_cache.touch(source_key, schedule.interval)
+        else:
+            response.raise_for_status()
+            content = response.text
+            content_hash = hashlib.sha1(response.content).hexdigest()
+            schedule.apply_hints(feedparser.parse(content).get('feed', {}))
+            schedule.etag = response.headers.get('ETag')
+            schedule.modified = response.headers.get('Last-Modified')
+            if content_hash != schedule.content_hash:
+                changed = True
+                schedule.content_hash = content_hash
+                schedule.record_change(now)
+            else:
+                schedule.record_unchanged()
+            self.feed_cache.put(source_key, content, schedule.interval)
+        schedule.next_due = now + schedule.interval
+        return changed
+
+    def run_once(self, force: bool = False) -> Dict[str, bool]:
+        """Poll every due feed (every feed with ``force``) concurrently; return which changed."""
+        keys = list(self.schedules) if force else self.due()
+        results = {}
+        if keys:
+            with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+                futures = {key: executor.submit(self.poll, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    FEED_ERRORS.inc(source=key)
+                    # Retry after the shortest interval rather than hammering a failing feed
+                    self.schedules[key].next_due = time.time() + self.schedules[key].min_interval
+                    print(f"Warning: prefetch of {key} failed: {e}", file=sys.stderr)
+        self.save_state()
+        return results
+
+    def run_forever(self):
+        """Poll feeds as they fall due until interrupted."""
+        while True:
+            self.run_once()
+            next_due = min(schedule.next_due for schedule in self.schedules.values())
+            time.sleep(max(1.0, next_due - time.time()))
@@ -0,0 +1,87 @@
+import heapq
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from .models import NewsItem
+from .normalize import fold
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into accent-free lowercase word tokens."""
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+class BM25Ranker:
+    """Rank a batch of news items against a query using Okapi BM25.
+
+    Term statistics (weighted term frequencies, document lengths and
+    document frequencies) are computed once when the ranker is built, so
+    scoring several queries against the same batch stays cheap.
+    """
+
+    def __init__(self, news_items: Iterable[NewsItem], k1: float = 1.5, b: float = 0.75,
+                 title_boost: float = 2.0):
+        self.news_items = list(news_items)
+        self.k1 = k1
+        self.b = b
+        self.title_boost = title_boost
+
+        self._term_freqs: List[Dict[str, float]] = []
+        self._doc_lengths: List[float] = []
+        self._doc_freqs: Counter = Counter()
+
+        for item in self.news_items:
+            # The folded text already contains the title once
+            title_terms = TOKEN_PATTERN.findall(item.folded_title)
+            all_terms = TOKEN_PATTERN.findall(item.folded_text)
+
+            # Title terms count title_boost times as much as content terms
+            term_freqs: Dict[str, float] = dict(Counter(all_terms))
+            for term in title_terms:
+                term_freqs[term] += title_boost - 1
+
+            self._term_freqs.append(term_freqs)
+            self._doc_lengths.append(len(all_terms) + (title_boost - 1) * len(title_terms))
+            self._doc_freqs.update(term_freqs.keys())
+
+        self._avg_doc_length = (sum(self._doc_lengths) / len(self._doc_lengths)) if self._doc_lengths else 0.0
+
+    def idf(self, term: str) -> float:
+        """Inverse document frequency of a term within the batch."""
+        total = len(self.news_items)
+        doc_freq = self._doc_freqs.get(term, 0)
+        return math.log(1 + (total - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def score(self, index: int, query_terms: List[str]) -> float:
+        """BM25 score of the item at ``index`` for the given query terms."""
+        term_freqs = self._term_freqs[index]
+        if self._avg_doc_length:
+            length_norm = 1 - self.b + self.b * self._doc_lengths[index] / self._avg_doc_length
+        else:
+            length_norm = 1.0
+
+        total = 0.0
+        for term in query_terms:
+            tf = term_freqs.get(term)
+            if not tf:
+                continue
+            total += self.idf(term) * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+        return total
+
+    def top_k(self, query: str, k: int) -> List[NewsItem]:
+        """Return the ``k`` best matching items, ties broken by recency."""
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        scores = [self.score(i, query_terms) for i in range(len(self.news_items))]
+
+        # heapq.nlargest keeps a k-sized heap instead of sorting the whole batch
+        best = heapq.nlargest(
+            k,
+            range(len(self.news_items)),
+            key=lambda i: (scores[i], self.news_items[i].timestamp or datetime.min)
+        )
+        return [self.news_items[i] for i in best]
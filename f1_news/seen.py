@@ -0,0 +1,75 @@
+import hashlib
+import os
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .models import NewsItem
+
+# Entries remembered; at 8 bytes each the file stays under 1 MB
+DEFAULT_CAPACITY = 100_000
+
+
+def default_seen_path() -> Path:
+    """Seen-set file: $F1_NEWS_SEEN or ~/.f1-news/seen.bin."""
+    return Path(os.environ.get('F1_NEWS_SEEN') or Path.home() / '.f1-news' / 'seen.bin')
+
+
+def entry_hash(url: str) -> int:
+    """64-bit fingerprint of an entry URL."""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'little')
+
+
+class SeenSet:
+    """Fingerprints of feed entries already delivered, persisted between runs.
+
+    Each entry costs 8 bytes on disk. Once ``capacity`` is reached the
+    oldest fingerprints are forgotten; feeds only carry recent entries, so
+    anything that old has long since dropped out of them.
+    """
+
+    def __init__(self, path: Optional[Path] = None, capacity: int = DEFAULT_CAPACITY):
+        self.path = Path(path or default_seen_path())
+        self.capacity = capacity
+        # Fingerprints in the order they were added, so the oldest can be evicted
+        self._order = array('Q')
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                self._order.frombytes(f.read())
+        self._hashes = set(self._order)
+        self._added = array('Q')
+
+    def __contains__(self, url: str) -> bool:
+        return entry_hash(url) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def add(self, url: str):
+        fingerprint = entry_hash(url)
+        if fingerprint not in self._hashes:
+            self._hashes.add(fingerprint)
+            self._added.append(fingerprint)
+
+    def update(self, urls: Iterable[str]):
+        for url in urls:
+            self.add(url)
+
+    def save(self):
+        """Write the set back, dropping the oldest fingerprints beyond capacity."""
+        order = self._order + self._added
+        if len(order) > self.capacity:
+            order = order[len(order) - self.capacity:]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            order.tofile(f)
+        os.replace(tmp_path, self.path)
+        self._order, self._added = order, array('Q')
+        self._hashes = set(order)
+
+    def mark(self, news_items: Iterable[NewsItem]) -> Iterator[NewsItem]:
+        """Pass items through, adding each to the set as it is pulled."""
+        for item in news_items:
+            self.add(item.url)
+            yield item
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import queue
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .archive import open_archive
+from .metrics import send_metrics
+from .service import NewsService, news_item_to_dict, race_results_to_dict
+
+SESSION_TYPES = ('race', 'qualifying', 'practice')
+
+# Seconds between SSE comments that keep idle connections (and proxies) open
+KEEPALIVE_INTERVAL = 15
+
+
+def classification(race_results) -> list:
+    """The parts of a classification that subscribers are told about when they change."""
+    return [(r.position, r.driver, r.team, r.total_time, r.gap, r.fastest_lap_time) for r in race_results.results]
+
+
+class EventHub:
+    """Fan out events from the service's single poller to every SSE subscriber.
+
+    Each subscriber gets a bounded queue; one that stops reading is dropped
+    instead of holding up the others.
+    """
+
+    def __init__(self, max_queued: int = 1000):
+        self.max_queued = max_queued
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def subscribe(self) -> queue.Queue:
+        events = queue.Queue(self.max_queued)
+        with self._lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue):
+        with self._lock:
+            if events in self._subscribers:
+                self._subscribers.remove(events)
+
+    def publish(self, event: str, data):
+        """Queue an event for every subscriber."""
+        with self._lock:
+            message = (self._next_id, event, json.dumps(data))
+            self._next_id += 1
+            for events in list(self._subscribers):
+                try:
+                    events.put_nowait(message)
+                except queue.Full:
+                    self._subscribers.remove(events)
+
+    def on_refresh(self, kind, session_type, previous, current):
+        """NewsService listener turning refreshes into 'news' and 'results' events."""
+        if kind == 'news':
+            if previous is None:
+                return
+            seen = {item.url for item in previous}
+            # Oldest first, so subscribers can append in arrival order
+            for item in reversed(current):
+                if item.url not in seen:
+                    self.publish('news', news_item_to_dict(item))
+        elif kind == 'results':
+            # Placeholder results from an OpenF1 failure are not a change to the classification
+            if previous is None or previous.fallback or current.fallback:
+                return
+            if classification(previous) != classification(current):
+                self.publish('results', dict(race_results_to_dict(current), session=session_type))
+
+
+class NewsRequestHandler(BaseHTTPRequestHandler):
+    """Routes: /news, /results, /events, /metrics."""
+
+    server_version = "f1-news"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if url.path == '/news':
+                self.send_json([news_item_to_dict(item) for item in self.server.service.news(
+                    limit=int(params.get('limit', 10)),
+                    team=params.get('team'),
+                    driver=params.get('driver'),
+                    keyword=params.get('keyword'),
+                    sort=params.get('sort', 'time'),
+                )])
+            elif url.path == '/results':
+                session = params.get('session', 'race')
+                if session not in SESSION_TYPES:
+                    self.send_error(400, f"session must be one of {', '.join(SESSION_TYPES)}")
+                    return
+                self.send_json(race_results_to_dict(self.server.service.results(session)))
+            elif url.path == '/events':
+                self.stream_events()
+            elif url.path == '/metrics':
+                send_metrics(self)
+            else:
+                self.send_error(404)
+        # Details only go in the body, which send_error escapes; the reason phrase stays fixed
+        except ValueError as e:
+            self.send_error(400, "Bad request", str(e))
+        except Exception as e:
+            print(f"Upstream error serving {url.path}: {e}", file=sys.stderr)
+            self.send_error(502, "Upstream error", str(e))
+
+    def send_json(self, data):
+        """Send a JSON body with an ETag, or 304 when the client already has it."""
+        body = json.dumps(data).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        """Push events to this client until it disconnects or the server stops."""
+        # Subscribe before answering, so nothing published after the client sees the headers is lost
+        hub = self.server.hub
+        events = hub.subscribe()
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.flush()
+            while not self.server.stopping.is_set():
+                try:
+                    event_id, event, data = events.get(timeout=self.server.keepalive_interval)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(f"id: {event_id}\nevent: {event}\ndata: {data}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            hub.unsubscribe(events)
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} - {format % args}", file=sys.stderr)
+
+
+class NewsHTTPServer(ThreadingHTTPServer):
+    """HTTP JSON API and SSE fan-out over one NewsService."""
+
+    daemon_threads = True
+
+    def __init__(self, service: NewsService, address=('127.0.0.1', 8080),
+                 keepalive_interval: float = KEEPALIVE_INTERVAL):
+        self.service = service
+        self.hub = EventHub()
+        self.keepalive_interval = keepalive_interval
+        self.stopping = threading.Event()
+        service.subscribe(self.hub.on_refresh)
+        super().__init__(address, NewsRequestHandler)
+
+    def shutdown(self):
+        self.stopping.set()
+        super().shutdown()
+
+
+def run_server(host: str = '127.0.0.1', port: int = 8080, refresh_interval: Optional[float] = None,
+               max_age: Optional[float] = None):
+    """Serve the API in the foreground until interrupted."""
+    service = NewsService(max_age=max_age) if max_age else NewsService()
+    archive = open_archive()
+    if archive is not None:
+        service.subscribe(archive.on_refresh)
+    server = NewsHTTPServer(service, (host, port))
+    # Results for every session type are polled so 'results' events cover them all
+    for session_type in SESSION_TYPES:
+        try:
+            service.refresh_results(session_type)
+        except Exception as e:
+            print(f"Warning: {session_type} results unavailable: {e}", file=sys.stderr)
+    service.start(refresh_interval)
+    print(f"f1-news API listening on http://{host}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
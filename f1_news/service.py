@@ -0,0 +1,244 @@
+import sys
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set
+
+from .aggregator import Aggregator, NewsSource
+from .config import Config
+from .filters import NewsFilter
+from .models import NewsItem, RaceResult, RaceResults
+from .ranking import BM25Ranker
+from .sources import RaceResultSource
+
+# How long fetched news and results are served before they are fetched again
+DEFAULT_MAX_AGE = 300
+# How long placeholder results from a failed OpenF1 fetch are served before retrying
+FALLBACK_MAX_AGE = 30
+
+
+def rank_news(news_items, sort, limit, team, driver, keyword):
+    """Order a stream of news items by the requested sort mode and keep the top ``limit``.
+
+    Time order is the order the stream is already in, so only ``limit``
+    items are pulled from it; relevance ranking has to see every match.
+    """
+    query = " ".join(term for term in [team, driver, keyword] if term)
+    if sort == 'relevance' and query:
+        return BM25Ranker(news_items).top_k(query, limit)
+    return islice(news_items, limit)
+
+
+def news_item_to_dict(item: NewsItem) -> dict:
+    """Serialize a news item for the daemon and HTTP APIs."""
+    return {
+        "title": item.title,
+        "content": item.content,
+        "url": item.url,
+        "source": item.source,
+        "author": item.author,
+        "timestamp": item.timestamp.isoformat() if item.timestamp else None,
+        "tags": list(item.tags),
+    }
+
+
+def news_item_from_dict(data: dict) -> NewsItem:
+    """Rebuild a news item serialized by news_item_to_dict."""
+    timestamp = data.get("timestamp")
+    return NewsItem(
+        title=data["title"],
+        content=data["content"],
+        url=data["url"],
+        source=data["source"],
+        author=data.get("author"),
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        tags=data.get("tags") or (),
+    )
+
+
+def race_results_to_dict(race_results: RaceResults) -> dict:
+    """Serialize session results, keeping every RaceResult field."""
+    return {
+        "race_name": race_results.race_name,
+        "date": race_results.date.isoformat(),
+        "circuit": race_results.circuit,
+        "results": [asdict(result) for result in race_results.results],
+        "fallback": race_results.fallback,
+    }
+
+
+def race_results_from_dict(data: dict) -> RaceResults:
+    """Rebuild session results serialized by race_results_to_dict."""
+    return RaceResults(
+        race_name=data["race_name"],
+        date=datetime.fromisoformat(data["date"]),
+        circuit=data["circuit"],
+        results=[RaceResult(**result) for result in data["results"]],
+        fallback=data.get("fallback", False),
+    )
+
+
+class NewsService:
+    """Keeps fetched news and session results warm for long-lived processes.
+
+    The merged feed snapshot and each session type's results are fetched
+    once and reused until they are older than ``max_age``; ``start`` keeps
+    them refreshed from a background thread so requests never wait on the
+    network. Concurrent requests for missing data trigger a single fetch,
+    so upstream load does not grow with the number of clients. Sources
+    share one HTTP session so connections stay open.
+    
+    Listeners added with ``subscribe`` are called after every refresh as
+    ``listener(kind, session_type, previous, current)`` with kind 'news'
+    (session_type None) or 'results'.
+    """
+
+    def __init__(self, rss_source: Optional[NewsSource] = None,
+                 result_source: Optional[RaceResultSource] = None,
+                 max_age: float = DEFAULT_MAX_AGE):
+        if rss_source is None or result_source is None:
+            import requests
+            http = requests.Session()
+            # Every news source the config enables, merged into one newest-first stream
+            rss_source = rss_source or Aggregator.from_config(Config(), http)
+            result_source = result_source or RaceResultSource(http)
+        self.rss_source = rss_source
+        self.result_source = result_source
+        self.max_age = max_age
+        self._news: Optional[List[NewsItem]] = None
+        self._news_time = 0.0
+        self._results: Dict[str, RaceResults] = {}
+        self._results_time: Dict[str, float] = {}
+        # Placeholders from failed fetches, kept apart so they never replace real results
+        self._fallbacks: Dict[str, RaceResults] = {}
+        self._fallback_time: Dict[str, float] = {}
+        # Every session type asked for, including ones that have only ever failed
+        self._session_types: Set[str] = set()
+        self._lock = threading.Lock()
+        # Serialize upstream fetches so a cold cache is filled once; news and
+        # results have their own, so a slow OpenF1 does not hold up /news
+        self._news_fetch_lock = threading.Lock()
+        self._results_fetch_lock = threading.Lock()
+        self._listeners: List[Callable] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh_news(self) -> List[NewsItem]:
+        """Fetch every feed and replace the news snapshot."""
+        news = list(self.rss_source.iter_news())
+        with self._lock:
+            previous, self._news = self._news, news
+            self._news_time = time.monotonic()
+        self._notify('news', None, previous, news)
+        return news
+
+    def refresh_results(self, session_type: str) -> RaceResults:
+        """Fetch a session type's latest results and replace the cached copy.
+        
+        When OpenF1 fails the source returns placeholder results; those are
+        never published and never replace real results. They are remembered
+        for ``FALLBACK_MAX_AGE`` seconds so a failing upstream is not asked
+        again on every request.
+        """
+        results = self.result_source.fetch_latest_results(session_type=session_type)
+        if results.fallback:
+            with self._lock:
+                self._session_types.add(session_type)
+                self._fallbacks[session_type] = results
+                self._fallback_time[session_type] = time.monotonic()
+                return self._results.get(session_type, results)
+        with self._lock:
+            self._session_types.add(session_type)
+            previous = self._results.get(session_type)
+            self._results[session_type] = results
+            self._results_time[session_type] = time.monotonic()
+            self._fallbacks.pop(session_type, None)
+            self._fallback_time.pop(session_type, None)
+        self._notify('results', session_type, previous, results)
+        return results
+
+    def subscribe(self, listener: Callable):
+        """Call ``listener`` after every news or results refresh."""
+        self._listeners.append(listener)
+
+    def _notify(self, kind: str, session_type: Optional[str], previous, current):
+        for listener in list(self._listeners):
+            try:
+                listener(kind, session_type, previous, current)
+            except Exception as e:
+                print(f"Warning: refresh listener failed: {e}", file=sys.stderr)
+
+    def _stale(self, fetched_at: float, max_age: Optional[float] = None) -> bool:
+        # While the background thread runs it owns freshness; requests never refetch
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        return time.monotonic() - fetched_at > (self.max_age if max_age is None else max_age)
+
+    def _results_due(self, session_type: str) -> bool:
+        fetched_at = self._results_time.get(session_type)
+        if fetched_at is not None and not self._stale(fetched_at):
+            return False
+        # Missing or stale, unless a fetch failed recently
+        failed_at = self._fallback_time.get(session_type)
+        return failed_at is None or self._stale(failed_at, FALLBACK_MAX_AGE)
+
+    def snapshot(self) -> List[NewsItem]:
+        """All current news items, newest first, fetched only when missing or stale."""
+        news = self._news
+        if news is None or self._stale(self._news_time):
+            with self._news_fetch_lock:
+                # Another request may have fetched while this one waited
+                news = self._news
+                if news is None or self._stale(self._news_time):
+                    news = self.refresh_news()
+        return news
+
+    def news(self, limit: int = 10, team: Optional[str] = None, driver: Optional[str] = None,
+             keyword: Optional[str] = None, sort: str = 'time') -> List[NewsItem]:
+        """News with ``fetch``/``filter`` semantics, served from the snapshot."""
+        news_items = iter(self.snapshot())
+        if any([team, driver, keyword]):
+            news_items = NewsFilter().filter_stream(news_items, team, driver, keyword)
+        return list(rank_news(news_items, sort, limit, team, driver, keyword))
+
+    def results(self, session_type: str = 'race') -> RaceResults:
+        """Latest results for a session type, fetched only when missing or stale."""
+        if self._results_due(session_type):
+            with self._results_fetch_lock:
+                if self._results_due(session_type):
+                    return self.refresh_results(session_type)
+        with self._lock:
+            results = self._results.get(session_type)
+            return results if results is not None else self._fallbacks[session_type]
+
+    def refresh_all(self):
+        """Refresh the news snapshot and every session type that has been requested."""
+        try:
+            self.refresh_news()
+        except Exception as e:
+            print(f"Warning: news refresh failed: {e}", file=sys.stderr)
+        for session_type in list(self._session_types):
+            try:
+                self.refresh_results(session_type)
+            except Exception as e:
+                print(f"Warning: {session_type} results refresh failed: {e}", file=sys.stderr)
+
+    def start(self, interval: Optional[float] = None):
+        """Refresh everything now and then every ``interval`` seconds (default ``max_age``) in the background."""
+        interval = interval or self.max_age
+        self.refresh_all()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.refresh_all()
+
+        self._thread = threading.Thread(target=run, name="f1-news-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
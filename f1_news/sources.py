@@ -1,61 +1,176 @@
-import tweepy
-import praw
-import feedparser
-import requests
+import heapq
+import importlib
 import json
-from datetime import datetime
-from typing import List, Optional
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator, List, Optional
+from urllib.parse import urlencode
+from .memprofile import checkpoint
+from .metrics import (FEED_BYTES, FEED_ERRORS, FEED_FETCH_SECONDS, OPENF1_BYTES, OPENF1_REQUESTS, OPENF1_SECONDS,
+                      RESULTS_DEGRADED, RESULTS_FALLBACKS, response_size)
 from .models import NewsItem, RaceResults, RaceResult
+from .tracing import span
+from .transport import from_environment
+
+if TYPE_CHECKING:
+    from .laps import LapTable
+
+# Network and parsing libraries are imported on first use so that commands
+# which never fetch (--help, sources) start quickly. Twitter and Reddit are
+# read over their HTTP JSON APIs with the same transport as the feeds, so
+# record, replay and the stand-in server cover them too.
+_LAZY_MODULES = ('feedparser', 'requests')
+
+
+def __getattr__(name):
+    # Keeps f1_news.sources.requests / .feedparser resolvable, e.g. as patch targets
+    if name in _LAZY_MODULES:
+        return importlib.import_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _utc(timestamp: datetime) -> datetime:
+    """A timestamp as naive UTC, comparable with feed entry times."""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _headline(text: str, length: int = 100) -> str:
+    """First line of a post, shortened to a headline."""
+    line = text.strip().split('\n', 1)[0]
+    return line if len(line) <= length else line[:length - 3].rstrip() + '...'
 
 
 class TwitterSource:
-    """Fetch F1 news from Twitter/X."""
+    """Fetch F1 news from Twitter/X recent search (API v2).
     
-    def __init__(self):
-        # Twitter API credentials would be loaded from config
-        self.api = None
+    Needs a bearer token (``twitter.bearer_token`` in the config); without
+    one the source yields nothing.
+    """
+    
+    def __init__(self, bearer_token: str = '', query: str = 'formula1 OR #F1 -is:retweet', max_results: int = 50,
+                 http=None):
+        self.base_url = "https://api.twitter.com/2"
+        self.bearer_token = bearer_token
+        self.query = query
+        # Recent search returns 10 to 100 tweets per request
+        self.max_results = min(max(max_results, 10), 100)
+        self.http = from_environment(http)
         
     def fetch_news(self, limit: int = 10) -> List[NewsItem]:
         """Fetch F1 news from Twitter."""
-        # For now, return mock data
-        return [
-            NewsItem(
-                title="Mock Twitter F1 News",
-                content="This is a mock Twitter post about F1.",
-                url="https://twitter.com/mock",
-                source="twitter",
-                author="@f1",
-                timestamp=datetime.now()
-            )
-        ]
+        return list(islice(self.iter_news(), limit))
+    
+    def search_url(self, since: Optional[datetime] = None) -> str:
+        params = {
+            'query': self.query,
+            'max_results': self.max_results,
+            'tweet.fields': 'created_at,author_id',
+            'expansions': 'author_id',
+            'user.fields': 'username',
+        }
+        if since is not None:
+            params['start_time'] = _utc(since).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return f"{self.base_url}/tweets/search/recent?{urlencode(params)}"
+    
+    def iter_news(self, seen=None, since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Yield recent tweets matching the query, newest first."""
+        import requests
+        
+        if not self.bearer_token:
+            print("Warning: Twitter source has no bearer token (twitter.bearer_token)", file=sys.stderr)
+            return
+        with span('fetch_source', 'news', source='twitter'):
+            response = (self.http or requests).get(self.search_url(since), timeout=30,
+                                                   headers={'Authorization': f"Bearer {self.bearer_token}"})
+            response.raise_for_status()
+            payload = response.json()
+        
+        usernames = {user['id']: user['username'] for user in payload.get('includes', {}).get('users', [])}
+        items = []
+        for tweet in payload.get('data', []):
+            username = usernames.get(tweet.get('author_id'), 'i')
+            url = f"https://twitter.com/{username}/status/{tweet['id']}"
+            if seen is not None and url in seen:
+                continue
+            items.append(NewsItem(
+                title=_headline(tweet['text']),
+                content=tweet['text'],
+                url=url,
+                source="Twitter",
+                author=f"@{username}",
+                timestamp=_utc(datetime.fromisoformat(tweet['created_at'].replace('Z', '+00:00'))),
+            ))
+        yield from sorted(items, key=lambda item: item.timestamp, reverse=True)
 
 
 class RedditSource:
-    """Fetch F1 news from Reddit."""
+    """Fetch F1 news from a subreddit's newest posts (Reddit's public JSON listings)."""
     
-    def __init__(self):
-        # Reddit API credentials would be loaded from config
-        self.reddit = None
+    def __init__(self, subreddit: str = 'formula1', user_agent: str = 'F1NewsCLI/0.1.0', limit: int = 50,
+                 http=None):
+        self.base_url = "https://www.reddit.com"
+        self.subreddit = subreddit
+        # Reddit throttles requests without a descriptive User-Agent
+        self.user_agent = user_agent
+        self.limit = min(limit, 100)
+        self.http = from_environment(http)
         
     def fetch_news(self, limit: int = 10) -> List[NewsItem]:
         """Fetch F1 news from Reddit."""
-        # For now, return mock data
-        return [
-            NewsItem(
-                title="Mock Reddit F1 News",
-                content="This is a mock Reddit post about Formula 1.",
-                url="https://reddit.com/r/formula1/mock",
-                source="reddit",
-                author="u/f1fan",
-                timestamp=datetime.now()
-            )
-        ]
+        return list(islice(self.iter_news(), limit))
+    
+    def listing_url(self) -> str:
+        return f"{self.base_url}/r/{self.subreddit}/new.json?limit={self.limit}"
+    
+    def iter_news(self, seen=None, since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Yield the subreddit's newest posts, newest first."""
+        import requests
+        
+        with span('fetch_source', 'news', source='reddit'):
+            response = (self.http or requests).get(self.listing_url(), timeout=30,
+                                                   headers={'User-Agent': self.user_agent})
+            response.raise_for_status()
+            payload = response.json()
+        
+        items = []
+        for child in payload.get('data', {}).get('children', []):
+            post = child.get('data', {})
+            url = self.base_url + post['permalink']
+            timestamp = datetime.fromtimestamp(post['created_utc'], timezone.utc).replace(tzinfo=None)
+            if (seen is not None and url in seen) or (since is not None and timestamp < since):
+                continue
+            items.append(NewsItem(
+                title=post['title'],
+                content=post.get('selftext', ''),
+                url=url,
+                source=f"Reddit r/{self.subreddit}",
+                author=f"u/{post.get('author', '[deleted]')}",
+                timestamp=timestamp,
+            ))
+        yield from sorted(items, key=lambda item: item.timestamp, reverse=True)
 
 
 class RSSSource:
-    """Fetch F1 news from RSS feeds."""
+    """Fetch F1 news from RSS feeds.
+    
+    Feeds are downloaded by feedparser unless an ``http`` session (such as a
+    ``requests.Session`` kept by a long-lived process) is given to reuse, or
+    the environment selects a record, replay or stand-in transport.
+    With a ``feed_cache``, documents kept fresh by ``f1-news prefetch`` are
+    parsed from the cache instead of being downloaded. With an ``archive``
+    (an ArchiveWriter), every parsed feed is handed over whole, including
+    the entries ``seen`` and ``since`` skip and those the consumer never pulls.
+    """
     
-    def __init__(self):
+    def __init__(self, http=None, feed_cache=None, archive=None):
+        self.http = from_environment(http)
+        self.feed_cache = feed_cache
+        self.archive = archive
         self.rss_feeds = {
             "formula1_headlines": "https://www.formula1.com/en/latest/headlines.xml",
             "formula1_all": "https://www.formula1.com/en/latest/all.xml",
@@ -75,8 +190,21 @@ class RSSSource:
         
     def fetch_news(self, limit: int = 10, sources: Optional[list] = None) -> List[NewsItem]:
         """Fetch F1 news from RSS feeds."""
-        news_items = []
+        return list(islice(self.iter_news(sources), limit))
+    
+    def iter_news(self, sources: Optional[list] = None, seen=None,
+                  since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Lazily yield F1 news from RSS feeds, newest first across all feeds.
         
+        Each feed is parsed into a newest-first stream of entries and the
+        streams are merged, so entries are only turned into NewsItems as the
+        consumer pulls them. Feeds are downloaded concurrently; since the
+        merge needs the head of every feed, the first item is ready after the
+        slowest feed rather than after all feeds in turn.
+        
+        Entries whose link is in ``seen`` (a SeenSet) or published before
+        ``since`` are skipped before any NewsItem is built for them.
+        """
         # If no specific sources specified, use all sources
         if sources is None:
             sources = list(self.rss_feeds.keys())
@@ -84,41 +212,102 @@ class RSSSource:
         # Validate source names
         valid_sources = [s for s in sources if s in self.rss_feeds]
         if not valid_sources:
-            print(f"Warning: No valid sources found. Available sources: {list(self.rss_feeds.keys())}")
-            return []
+            print(f"Warning: No valid sources found. Available sources: {list(self.rss_feeds.keys())}", file=sys.stderr)
+            return iter([])
+        
+        with ThreadPoolExecutor(max_workers=len(valid_sources)) as executor:
+            downloads = {key: executor.submit(self._download_feed, key) for key in valid_sources}
+        checkpoint('parse_feeds')
         
-        for source_key in valid_sources:
-            feed_url = self.rss_feeds[source_key]
-            source_name = self.source_names[source_key]
+        feed_streams = [self._iter_feed(key, downloads[key], seen, since) for key in valid_sources]
+        return heapq.merge(*feed_streams, key=lambda x: x.timestamp or datetime.min, reverse=True)
+    
+    def _download_feed(self, source_key: str):
+        """Download and parse a single feed."""
+        import feedparser
+        
+        if self.feed_cache is not None:
+            content = self.feed_cache.get(source_key)
+            if content is not None:
+                with span('parse_feed', 'rss', source=source_key, cached=True):
+                    return feedparser.parse(content)
+        
+        print(f"Fetching from {self.source_names[source_key]}...", file=sys.stderr)
+        start = time.perf_counter()
+        try:
+            if self.http is not None:
+                with span('fetch_feed', 'rss', source=source_key):
+                    response = self.http.get(self.rss_feeds[source_key], timeout=30)
+                    response.raise_for_status()
+                FEED_FETCH_SECONDS.observe(time.perf_counter() - start, source=source_key)
+                FEED_BYTES.inc(response_size(response), source=source_key)
+                with span('parse_feed', 'rss', source=source_key):
+                    return feedparser.parse(response.content)
+            # feedparser downloads the URL itself, so fetching and parsing cannot be told apart
+            with span('fetch_feed', 'rss', source=source_key, parsed=True):
+                feed = feedparser.parse(self.rss_feeds[source_key])
+            FEED_FETCH_SECONDS.observe(time.perf_counter() - start, source=source_key)
+            # feedparser reports download failures as a malformed, empty feed rather than raising
+            if getattr(feed, 'bozo', False) and not getattr(feed, 'entries', None):
+                FEED_ERRORS.inc(source=source_key)
+            return feed
+        except Exception:
+            FEED_ERRORS.inc(source=source_key)
+            raise
+    
+    def _iter_feed(self, source_key: str, download: Future, seen=None,
+                   since: Optional[datetime] = None) -> Iterator[NewsItem]:
+        """Yield the entries of a downloaded feed as NewsItems, newest first."""
+        feed_url = self.rss_feeds[source_key]
+        source_name = self.source_names[source_key]
+        
+        try:
+            feed = download.result()
             
-            try:
-                print(f"Fetching from {source_name}...")
-                feed = feedparser.parse(feed_url)
-                
-                if not hasattr(feed, 'entries') or not feed.entries:
-                    print(f"Warning: No entries found for {source_name}")
-                    continue
-                
-                for entry in feed.entries[:limit]:
-                    # Skip entries without required fields
-                    if not hasattr(entry, 'title') or not hasattr(entry, 'link'):
-                        continue
-                        
-                    news_item = NewsItem(
-                        title=entry.title,
-                        content=getattr(entry, 'summary', getattr(entry, 'description', '')),
-                        url=entry.link,
-                        source=source_name,
-                        timestamp=datetime(*entry.published_parsed[:6]) if hasattr(entry, 'published_parsed') and entry.published_parsed else None
-                    )
-                    news_items.append(news_item)
-                    
-            except Exception as e:
-                print(f"Error fetching RSS feed {source_name} ({feed_url}): {e}")
+            if not hasattr(feed, 'entries') or not feed.entries:
+                print(f"Warning: No entries found for {source_name}", file=sys.stderr)
+                return
+            
+            with span('prepare_feed', 'rss', source=source_key):
+                # Skip entries without required fields
+                entries = [entry for entry in feed.entries if hasattr(entry, 'title') and hasattr(entry, 'link')]
+                timestamps = [self._entry_timestamp(entry) for entry in entries]
+                order = sorted(range(len(entries)), key=lambda i: timestamps[i] or datetime.min, reverse=True)
+        except Exception as e:
+            print(f"Error fetching RSS feed {source_name} ({feed_url}): {e}", file=sys.stderr)
+            return
+        
+        items = None
+        if self.archive is not None:
+            # Only archiving builds every item up front; otherwise they are built as they are pulled
+            items = [self._news_item(entries[i], source_name, timestamps[i]) for i in order]
+            self.archive.collect(items)
         
-        # Sort by timestamp (newest first) and limit results
-        news_items = sorted(news_items, key=lambda x: x.timestamp or datetime.min, reverse=True)
-        return news_items[:limit]
+        for position, i in enumerate(order):
+            entry = entries[i]
+            if since is not None and (timestamps[i] is None or timestamps[i] < since):
+                # Entries are newest first, so the rest are older still
+                break
+            if seen is not None and entry.link in seen:
+                continue
+            yield items[position] if items is not None else self._news_item(entry, source_name, timestamps[i])
+    
+    @staticmethod
+    def _news_item(entry, source_name: str, timestamp: Optional[datetime]) -> NewsItem:
+        return NewsItem(
+            title=entry.title,
+            content=getattr(entry, 'summary', getattr(entry, 'description', '')),
+            url=entry.link,
+            source=source_name,
+            timestamp=timestamp
+        )
+    
+    @staticmethod
+    def _entry_timestamp(entry) -> Optional[datetime]:
+        """Publication time of a feed entry, if it has one."""
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            return datetime(*entry.published_parsed[:6])
+        return None
     
     def get_available_sources(self) -> dict:
         """Get list of available news sources."""
@@ -128,46 +317,117 @@ class RSSSource:
 class RaceResultSource:
     """Fetch F1 race results from OpenF1 API."""
     
-    def __init__(self):
+    def __init__(self, http=None, cache=None):
         # Using OpenF1 API for F1 data (free and reliable)
         self.base_url = "https://api.openf1.org/v1"
+        # Optional requests.Session to reuse connections across calls
+        self.http = from_environment(http)
+        # Optional ResponseCache filled by the session warmer
+        self.cache = cache
+    
+    def _get(self, url: str):
+        """GET a URL, from the response cache when it holds it, else with the shared session if there is one."""
+        import requests
         
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+        endpoint = self._endpoint(url)
+        start = time.perf_counter()
+        with span('openf1_request', 'openf1', url=url.replace(self.base_url, '')):
+            try:
+                response = (self.http or requests).get(url, timeout=30)
+            except Exception:
+                OPENF1_REQUESTS.inc(endpoint=endpoint, status='error')
+                raise
+            finally:
+                OPENF1_SECONDS.observe(time.perf_counter() - start, endpoint=endpoint)
+        OPENF1_REQUESTS.inc(endpoint=endpoint, status=getattr(response, 'status_code', 'unknown'))
+        OPENF1_BYTES.inc(response_size(response), endpoint=endpoint)
+        return response
+    
+    def _get_json(self, url: str):
+        """GET a URL and decode its JSON payload, raising on HTTP errors."""
+        response = self._get(url)
+        response.raise_for_status()
+        data = response.json()
+        checkpoint(f"decode_{self._endpoint(url)}")
+        return data
+    
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        """OpenF1 endpoint a URL requests, e.g. 'laps'."""
+        return url.split('?', 1)[0].rsplit('/', 1)[-1]
+    
+    def sessions_url(self, year: int) -> str:
+        """URL of a season's session calendar."""
+        return f"{self.base_url}/sessions?year={year}"
+    
+    def session_urls(self, session_key) -> List[str]:
+        """Every per-session endpoint that results and lap analysis read."""
+        return [f"{self.base_url}/{endpoint}?session_key={session_key}"
+                for endpoint in ('position', 'drivers', 'laps', 'session_result')]
+        
+    def find_latest_session(self, session_type: Optional[str] = None) -> dict:
+        """Find the most recent session of this year matching the session type."""
+        current_year = datetime.now().year
+        
+        if session_type:
+            session_types = [session_type.capitalize()]
+        else:
+            session_types = ['Race', 'Qualifying', 'Sprint', 'Practice']
+        
+        # Get all sessions for current year only
+        year_sessions = self._get_json(self.sessions_url(current_year))
+        
+        # The calendar lists scheduled sessions too; only those already under way have data
+        now = datetime.now(timezone.utc)
+        for session in reversed(year_sessions):
+            if 'date_start' in session and datetime.fromisoformat(session['date_start'].replace('Z', '+00:00')) > now:
+                continue
+            if session['session_type'] in session_types:
+                print(f"Found latest session: {session['session_type']} on {session['session_key']}", file=sys.stderr)
+                return session
+        
+        raise Exception(f"No completed sessions found for {current_year}")
+    
+    def fetch_drivers(self, session_key) -> dict:
+        """Fetch driver information for a session, keyed by driver number."""
+        drivers = self._get_json(f"{self.base_url}/drivers?session_key={session_key}")
+        return {driver['driver_number']: driver for driver in drivers}
+    
+    def fetch_laps(self, session_key) -> 'LapTable':
+        """Fetch every lap of a session into a columnar table."""
+        from .laps import LapTable
+        
+        laps = self._get_json(f"{self.base_url}/laps?session_key={session_key}")
+        with span('build_lap_table', 'openf1'):
+            table = LapTable.from_laps(laps)
+        checkpoint('build_lap_table')
+        return table
+    
+    @staticmethod
+    def session_name(session: dict) -> str:
+        """Display name of a session, e.g. 'Hungary Grand Prix' or 'Hungary Sprint'."""
+        # Sprint races have session_type="Race" but session_name="Sprint"
+        if session['session_name'] == 'Sprint':
+            return f"{session['country_name']} Sprint"
+        elif session['session_type'] == 'Race':
+            return f"{session['country_name']} Grand Prix"
+        return f"{session['country_name']} {session['session_type']}"
+    
     def fetch_latest_results(self, session_type: str) -> RaceResults:
         """Fetch the most recent session results (Race, Qualifying, Sprint, etc.)."""
         try:
-            current_year = datetime.now().year
-            
-            if session_type:
-                session_types = [session_type.capitalize()]
-            else:
-                session_types = ['Race', 'Qualifying', 'Sprint', 'Practice']
-            
-            # Get all sessions for current year only
-            sessions_response = requests.get(f"{self.base_url}/sessions?year={current_year}")
-            sessions_response.raise_for_status()
-            year_sessions = sessions_response.json()
-            
-            latest_session = None
-            for session in reversed(year_sessions):
-                if session['session_type'] in session_types:
-                    latest_session = session
-                    print(f"Found latest session: {latest_session['session_type']} on {latest_session['session_key']}")
-                    break
-            
-            if not latest_session:
-                raise Exception(f"No completed sessions found for {current_year}")
-            
+            latest_session = self.find_latest_session(session_type)
             session_key = latest_session['session_key']
             
             # Get final positions (latest timestamp for each driver)
-            positions_response = requests.get(f"{self.base_url}/position?session_key={session_key}")
-            positions_response.raise_for_status()
-            positions_data = positions_response.json()
+            positions_data = self._get_json(f"{self.base_url}/position?session_key={session_key}")
             
             # Get driver information
-            drivers_response = requests.get(f"{self.base_url}/drivers?session_key={session_key}")
-            drivers_response.raise_for_status()
-            drivers_data = drivers_response.json()
+            driver_lookup = self.fetch_drivers(session_key)
             
             # Get lap data and calculate session-specific times
             race_times = {}
@@ -175,45 +435,25 @@ class RaceResultSource:
             winner_time = 0
             
             try:
-                laps_response = requests.get(f"{self.base_url}/laps?session_key={session_key}")
-                laps_response.raise_for_status()
-                laps_data = laps_response.json()
-                
-                # Calculate fastest lap for each driver first
-                for lap in laps_data:
-                    driver_num = lap['driver_number']
-                    lap_time = lap.get('lap_duration')
-                    if lap_time and lap_time > 0:  # Valid lap time
-                        if driver_num not in driver_fastest_laps or lap_time < driver_fastest_laps[driver_num]:
-                            driver_fastest_laps[driver_num] = lap_time
+                laps = self.fetch_laps(session_key)
+                driver_fastest_laps = laps.fastest_laps()
                 
-                # Session-specific calculations
+                # Qualifying is classified on fastest laps, races on summed lap times
                 if latest_session['session_type'] == 'Qualifying':
-                    # For qualifying, fastest lap times are the main times, no cumulative calculation needed
-                    race_times = driver_fastest_laps.copy()
-                    # Find fastest overall qualifying time
-                    winner_time = min(driver_fastest_laps.values()) if driver_fastest_laps else 0
+                    race_times = driver_fastest_laps
                 else:
-                    # For race sessions, calculate total race time for each driver
-                    for lap in laps_data:
-                        driver_num = lap['driver_number']
-                        if driver_num not in race_times:
-                            race_times[driver_num] = 0
-                        if lap.get('lap_duration'):
-                            race_times[driver_num] += lap['lap_duration']
-                    
-                    # Find winner's time for gap calculations
-                    winner_time = min(race_times.values()) if race_times else 0
+                    race_times = laps.total_times()
+                
+                # Fastest time for gap calculations
+                winner_time = min(race_times.values()) if race_times else 0
                 
             except Exception as e:
-                print(f"Warning: Could not fetch lap data: {e}")
+                print(f"Warning: Could not fetch lap data: {e}", file=sys.stderr)
+                RESULTS_DEGRADED.inc(part='laps')
                 race_times = {}
                 winner_time = 0
                 driver_fastest_laps = {}
             
-            # Create driver lookup
-            driver_lookup = {driver['driver_number']: driver for driver in drivers_data}
-            
             # Get final positions (group by driver and get latest position)
             final_positions = {}
             for pos in positions_data:
@@ -229,9 +469,7 @@ class RaceResultSource:
             if latest_session['session_type'] == 'Qualifying':
                 # For qualifying, use session_result API to get official positions and Q3 times
                 try:
-                    session_result_response = requests.get(f"{self.base_url}/session_result?session_key={session_key}")
-                    session_result_response.raise_for_status()
-                    session_results = session_result_response.json()
+                    session_results = self._get_json(f"{self.base_url}/session_result?session_key={session_key}")
                     
                     for result in session_results:
                         driver_num = result['driver_number']
@@ -239,35 +477,27 @@ class RaceResultSource:
                             driver_info = driver_lookup[driver_num]
                             position = result['position']
                             
-                            # Use Q3 time (third element in duration array) for the qualifying time
+                            # Use the time from the last segment reached (Q3, else Q2, else Q1)
+                            segment_times = result['duration'] if isinstance(result['duration'], list) else None
                             qualifying_time = None
-                            if result['duration'] and len(result['duration']) >= 3 and result['duration'][2] is not None:
-                                qualifying_time = result['duration'][2]  # Q3 time
-                            elif result['duration'] and len(result['duration']) >= 2 and result['duration'][1] is not None:
-                                qualifying_time = result['duration'][1]  # Q2 time if no Q3
-                            elif result['duration'] and len(result['duration']) >= 1 and result['duration'][0] is not None:
-                                qualifying_time = result['duration'][0]  # Q1 time if no Q2/Q3
-                            
-                            # Format qualifying time
-                            if qualifying_time:
-                                fl_minutes = int(qualifying_time // 60)
-                                fl_seconds = qualifying_time % 60
-                                fastest_lap_display = f"{fl_minutes}:{fl_seconds:06.3f}"
-                            else:
-                                fastest_lap_display = "No time"
+                            for segment_time in reversed(segment_times or []):
+                                if segment_time is not None:
+                                    qualifying_time = segment_time
+                                    break
                             
                             race_result = RaceResult(
                                 position=position,
                                 driver=driver_info['full_name'],
                                 team=driver_info['team_name'],
-                                time="",  # No race time for qualifying
                                 points=0,  # No points for qualifying
-                                fastest_lap=fastest_lap_display
+                                fastest_lap_time=qualifying_time,
+                                segment_times=segment_times
                             )
                             results.append(race_result)
                             
                 except Exception as e:
-                    print(f"Warning: Could not fetch session results: {e}")
+                    print(f"Warning: Could not fetch session results: {e}", file=sys.stderr)
+                    RESULTS_DEGRADED.inc(part='session_result')
                     # Fallback to previous method if session_result API fails
                     qualifying_results = []
                     for driver_num in driver_lookup:
@@ -279,17 +509,12 @@ class RaceResultSource:
                     for position, (driver_num, fastest_time) in enumerate(qualifying_results, 1):
                         driver_info = driver_lookup[driver_num]
                         
-                        fl_minutes = int(fastest_time // 60)
-                        fl_seconds = fastest_time % 60
-                        fastest_lap_display = f"{fl_minutes}:{fl_seconds:06.3f}"
-                        
                         race_result = RaceResult(
                             position=position,
                             driver=driver_info['full_name'],
                             team=driver_info['team_name'],
-                            time="",
                             points=0,
-                            fastest_lap=fastest_lap_display
+                            fastest_lap_time=fastest_time
                         )
                         results.append(race_result)
             else:
@@ -302,81 +527,53 @@ class RaceResultSource:
                         # Calculate points
                         points = points_table[position - 1] if position <= len(points_table) else 0
                         
-                        # Format race time display
-                        time_display = f"P{position}"  # Default fallback
+                        # Total time for everyone, gap to the winner for the rest of the field
+                        total_time = None
+                        gap = None
                         if driver_num in race_times and race_times[driver_num] > 0:
                             total_time = race_times[driver_num]
-                            
-                            if position == 1:
-                                # Winner gets total race time
-                                minutes = int(total_time // 60)
-                                seconds = total_time % 60
-                                time_display = f"{minutes}:{seconds:06.3f}"
-                            else:
-                                # Others get gap to winner
+                            if position != 1:
                                 gap = total_time - winner_time
-                                if gap >= 60:
-                                    gap_minutes = int(gap // 60)
-                                    gap_seconds = gap % 60
-                                    time_display = f"+{gap_minutes}:{gap_seconds:06.3f}"
-                                else:
-                                    time_display = f"+{gap:.3f}"
-                        
-                        # Format fastest lap time
-                        fastest_lap_display = ""
-                        if driver_num in driver_fastest_laps:
-                            fl_time = driver_fastest_laps[driver_num]
-                            fl_minutes = int(fl_time // 60)
-                            fl_seconds = fl_time % 60
-                            fastest_lap_display = f"{fl_minutes}:{fl_seconds:06.3f}"
                         
                         race_result = RaceResult(
                             position=position,
                             driver=driver_info['full_name'],
                             team=driver_info['team_name'],
-                            time=time_display,
+                            time="" if total_time is not None else f"P{position}",
                             points=points,
-                            fastest_lap=fastest_lap_display
+                            total_time=total_time,
+                            gap=gap,
+                            fastest_lap_time=driver_fastest_laps.get(driver_num)
                         )
                         results.append(race_result)
             
             # Sort by position
             results.sort(key=lambda x: x.position)
             
-            # Parse session info
-            session_type = latest_session['session_type']
-            session_name_api = latest_session['session_name']
-            
-            # Determine the actual session type (Sprint races have session_type="Race" but session_name="Sprint")
-            if session_name_api == 'Sprint':
-                session_name = f"{latest_session['country_name']} Sprint"
-            elif session_type == 'Race':
-                session_name = f"{latest_session['country_name']} Grand Prix"
-            else:
-                session_name = f"{latest_session['country_name']} {session_type}"
-            
             date = datetime.fromisoformat(latest_session['date_start'].replace('Z', '+00:00'))
             circuit = latest_session['location']
             
             return RaceResults(
-                race_name=session_name,
+                race_name=self.session_name(latest_session),
                 date=date,
                 circuit=circuit,
                 results=results
             )
             
         except Exception as e:
-            print(f"OpenF1 API Error: {e}")
+            print(f"OpenF1 API Error: {e}", file=sys.stderr)
+            RESULTS_FALLBACKS.inc(session_type=session_type)
             # Return mock data if API fails
             return RaceResults(
                 race_name="Mock Grand Prix (API Error)",
                 date=datetime.now(),
                 circuit="Mock Circuit",
                 results=[
-                    RaceResult(1, "Max Verstappen", "Red Bull Racing", "1:32:28.851", 25, True),
-                    RaceResult(2, "Sergio Pérez", "Red Bull Racing", "+22.896", 18, False),
-                    RaceResult(3, "Charles Leclerc", "Ferrari", "+34.808", 15, False),
-                    RaceResult(4, "Carlos Sainz", "Ferrari", "+47.036", 12, False),
-                    RaceResult(5, "Lando Norris", "McLaren", "+1:13.715", 10, False),
-                ]
+                    RaceResult(1, "Max Verstappen", "Red Bull Racing", "1:32:28.851", 25),
+                    RaceResult(2, "Sergio Pérez", "Red Bull Racing", "+22.896", 18),
+                    RaceResult(3, "Charles Leclerc", "Ferrari", "+34.808", 15),
+                    RaceResult(4, "Carlos Sainz", "Ferrari", "+47.036", 12),
+                    RaceResult(5, "Lando Norris", "McLaren", "+1:13.715", 10),
+                ],
+                fallback=True
             )
\ No newline at end of file
@@ -0,0 +1,166 @@
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .synthetic import openf1_session, reddit_listing, rss_feed, tweets
+from .transport import ReplaySession
+
+OPENF1_HOST = 'api.openf1.org'
+TWITTER_HOST = 'api.twitter.com'
+REDDIT_HOST = 'www.reddit.com'
+
+
+class SyntheticUpstream:
+    """Synthetic OpenF1 endpoints, RSS feeds, tweets and Reddit posts, the same on every run for the same parameters."""
+
+    def __init__(self, entries: int = 50, drivers: int = 20, laps: int = 70, seed: int = 0):
+        self.entries = entries
+        self.seed = seed
+        self.payloads = openf1_session(drivers, laps, seed)
+        self._feeds = {}
+
+    def respond(self, url: str) -> Optional[Tuple[int, str, bytes]]:
+        """(status, content type, body) for an upstream URL."""
+        host, _, path = url.split('://', 1)[1].partition('/')
+        path = path.split('?', 1)[0]
+        if host == OPENF1_HOST:
+            payload = self.payloads.get(path.rsplit('/', 1)[-1])
+            if payload is None:
+                return None
+            return 200, 'application/json', json.dumps(payload).encode()
+        if host == TWITTER_HOST:
+            return 200, 'application/json', json.dumps(tweets(self.entries, self.seed)).encode()
+        if host == REDDIT_HOST:
+            return 200, 'application/json', json.dumps(reddit_listing(self.entries, self.seed)).encode()
+        if url not in self._feeds:
+            # Each feed URL gets its own stable seed, so feeds differ but runs repeat
+            feed_seed = self.seed * 1000 + sum(url.encode()) % 1000
+            self._feeds[url] = rss_feed(self.entries, feed_seed).encode()
+        return 200, 'application/rss+xml', self._feeds[url]
+
+
+class RecordedUpstream:
+    """Serve responses recorded with F1NEWS_RECORD."""
+
+    def __init__(self, directory: Path):
+        self.replay = ReplaySession(directory)
+
+    def respond(self, url: str) -> Optional[Tuple[int, str, bytes]]:
+        response = self.replay.load(url)
+        if response is None:
+            return None
+        content_type = next((value for key, value in response.headers.items() if key.lower() == 'content-type'),
+                            'application/octet-stream')
+        return response.status_code, content_type, response.content
+
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    """Serve ``/<host><path>?<query>`` as the upstream would serve ``https://<host><path>?<query>``."""
+
+    server_version = "f1-news-standin"
+
+    def do_GET(self):
+        server = self.server
+        delay, fail = server.draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self.send_error(503, "Injected failure")
+            return
+        response = server.upstream.respond('https://' + self.path.lstrip('/'))
+        if response is None:
+            self.send_error(404, "Nothing recorded or generated for this URL")
+            return
+        status, content_type, body = response
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            print(f"{self.address_string()} - {format % args}", file=sys.stderr)
+
+
+class StandinServer(ThreadingHTTPServer):
+    """Local stand-in for OpenF1 and the RSS feeds, with injected latency and errors.
+
+    Point the sources at it with ``F1NEWS_STANDIN=http://host:port``. Each
+    request waits ``latency`` seconds plus up to ``jitter`` more and fails
+    with a 503 with probability ``error_rate``; draws come from a seeded
+    generator, so a sequential run sees the same delays and failures every
+    time.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, upstream, address=('127.0.0.1', 0), latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0, verbose: bool = False):
+        self.upstream = upstream
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self.requests_served = 0
+        super().__init__(address, StandinRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def draw(self) -> Tuple[float, bool]:
+        """This request's delay and whether it fails."""
+        with self._random_lock:
+            self.requests_served += 1
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            return delay, self._random.random() < self.error_rate
+
+    def start(self) -> threading.Thread:
+        """Serve from a background thread (for tests and load runs in one process)."""
+        thread = threading.Thread(target=self.serve_forever, name="f1-news-standin", daemon=True)
+        thread.start()
+        return thread
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve stand-in OpenF1, RSS, Twitter and Reddit endpoints locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replay", metavar="DIR", help="serve responses recorded with F1NEWS_RECORD=DIR")
+    parser.add_argument("--entries", type=int, default=50, help="entries per synthetic feed, tweet search and Reddit listing")
+    parser.add_argument("--drivers", type=int, default=20, help="drivers in the synthetic session")
+    parser.add_argument("--laps", type=int, default=70, help="laps per driver in the synthetic session")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many further random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quiet", action="store_true", help="do not log requests")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        upstream = RecordedUpstream(Path(args.replay))
+    else:
+        upstream = SyntheticUpstream(args.entries, args.drivers, args.laps, args.seed)
+    server = StandinServer(upstream, (args.host, args.port), args.latency, args.jitter, args.error_rate,
+                           args.seed, verbose=not args.quiet)
+    print(f"Stand-in listening; use F1NEWS_STANDIN={server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
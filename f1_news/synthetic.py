@@ -0,0 +1,148 @@
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+
+# Vocabulary for synthetic headlines and articles, seeded so every run generates the same feeds
+TEAMS = ["Ferrari", "McLaren", "Mercedes", "Red Bull", "Aston Martin", "Alpine", "Williams", "Haas",
+         "Sauber", "RB"]
+DRIVERS = ["Verstappen", "Leclerc", "Norris", "Hamilton", "Russell", "Piastri", "Sainz", "Alonso",
+           "Gasly", "Albon", "Hulkenberg", "Ocon", "Stroll", "Tsunoda", "Bottas", "Zhou", "Magnussen",
+           "Ricciardo", "Sargeant", "Perez"]
+WORDS = ["upgrade", "penalty", "strategy", "tyres", "qualifying", "pace", "podium", "crash", "contract",
+         "floor", "wing", "engine", "grid", "stewards", "championship", "pit", "stop", "sprint", "wet",
+         "safety", "car", "overtake", "degradation", "setup", "simulator", "rookie", "paddock", "team"]
+
+
+def rss_feed(entries: int, seed: int = 0) -> str:
+    """An RSS 2.0 document with ``entries`` items mentioning teams, drivers and common paddock words."""
+    rng = random.Random(seed)
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    items = []
+    for i in range(entries):
+        title = f"{rng.choice(DRIVERS)} {rng.choice(WORDS)} as {rng.choice(TEAMS)} {rng.choice(WORDS)} {i}"
+        body = " ".join(rng.choice(WORDS + DRIVERS + TEAMS) for _ in range(60))
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>https://example.com/news/{seed}/{i}</link>"
+            f"<description>{escape(f'<p>{body}.</p>')}</description>"
+            f"<pubDate>{format_datetime(start + timedelta(minutes=37 * i))}</pubDate>"
+            "</item>"
+        )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Synthetic feed {seed}</title>{''.join(items)}</channel></rss>")
+
+
+def tweets(entries: int, seed: int = 0) -> dict:
+    """A Twitter API v2 recent-search response with ``entries`` tweets, newest first."""
+    rng = random.Random(seed)
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    users = [{'id': str(100 + i), 'username': f"{team.replace(' ', '')}F1"} for i, team in enumerate(TEAMS)]
+    data = []
+    for i in reversed(range(entries)):
+        text = f"{rng.choice(DRIVERS)} {rng.choice(WORDS)} for {rng.choice(TEAMS)}: {rng.choice(WORDS)} #{i}"
+        data.append({
+            'id': str(seed * 100000 + i),
+            'text': text,
+            'author_id': rng.choice(users)['id'],
+            'created_at': (start + timedelta(minutes=23 * i)).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        })
+    return {'data': data, 'includes': {'users': users}, 'meta': {'result_count': entries}}
+
+
+def reddit_listing(entries: int, seed: int = 0) -> dict:
+    """A Reddit ``/new.json`` listing with ``entries`` posts, newest first."""
+    rng = random.Random(seed)
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    children = []
+    for i in reversed(range(entries)):
+        post_id = f"p{seed}x{i}"
+        children.append({'kind': 't3', 'data': {
+            'id': post_id,
+            'title': f"[{rng.choice(TEAMS)}] {rng.choice(DRIVERS)} on {rng.choice(WORDS)} and {rng.choice(WORDS)}",
+            'selftext': " ".join(rng.choice(WORDS + DRIVERS + TEAMS) for _ in range(30)),
+            'permalink': f"/r/formula1/comments/{post_id}/post_{i}/",
+            'author': f"fan{rng.randrange(1000)}",
+            'created_utc': (start + timedelta(minutes=29 * i)).timestamp(),
+        }})
+    return {'kind': 'Listing', 'data': {'children': children}}
+
+
+class FixedFeedCache:
+    """Stands in for the prefetch FeedCache, serving every feed from memory."""
+
+    def __init__(self, feeds: dict):
+        self.feeds = feeds
+
+    def get(self, source_key: str):
+        return self.feeds.get(source_key)
+
+
+def openf1_session(drivers: int = 20, laps: int = 70, seed: int = 0) -> dict:
+    """OpenF1 responses by endpoint for one race: sessions, drivers, position, laps and session_result."""
+    rng = random.Random(seed)
+    numbers = list(range(1, drivers + 1))
+    base_pace = {number: 90 + rng.uniform(0, 2) for number in numbers}
+    start = datetime(2024, 3, 2, 15, tzinfo=timezone.utc)
+
+    lap_rows = []
+    for number in numbers:
+        pit_laps = set(rng.sample(range(10, max(11, laps - 5)), k=min(2, max(0, laps - 15))))
+        for lap in range(1, laps + 1):
+            duration = base_pace[number] + 0.03 * (lap % 25) + rng.gauss(0, 0.3) + (20 if lap in pit_laps else 0)
+            lap_rows.append({
+                'driver_number': number,
+                'lap_number': lap,
+                'lap_duration': round(duration, 3),
+                'duration_sector_1': round(duration * 0.3, 3),
+                'duration_sector_2': round(duration * 0.4, 3),
+                'duration_sector_3': round(duration * 0.3, 3),
+                'is_pit_out_lap': lap - 1 in pit_laps,
+            })
+
+    # A position update for every driver roughly every lap, as OpenF1 reports them
+    position_rows = []
+    for lap in range(laps):
+        order = sorted(numbers, key=lambda number: base_pace[number] + rng.uniform(0, 1))
+        moment = start + timedelta(seconds=90 * lap)
+        for position, number in enumerate(order, 1):
+            position_rows.append({'driver_number': number, 'position': position, 'date': moment.isoformat()})
+
+    return {
+        'sessions': [{
+            'session_key': 9000 + seed, 'session_type': 'Race', 'session_name': 'Race',
+            'country_name': 'Synthetic', 'location': 'Benchmark Circuit',
+            'date_start': start.isoformat(), 'date_end': (start + timedelta(hours=2)).isoformat(),
+        }],
+        'drivers': [{'driver_number': number, 'full_name': f"Driver {number}",
+                     'team_name': TEAMS[(number - 1) // 2 % len(TEAMS)]} for number in numbers],
+        'position': position_rows,
+        'laps': lap_rows,
+        'session_result': [{'driver_number': number, 'position': position, 'duration': [80.1, 79.5, 79.0]}
+                           for position, number in enumerate(numbers, 1)],
+    }
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeOpenF1:
+    """An ``http`` object for RaceResultSource answering from a synthetic session."""
+
+    def __init__(self, payloads: dict):
+        self.payloads = payloads
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.payloads[urlparse(url).path.rsplit('/', 1)[-1]])
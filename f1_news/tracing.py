@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Returned by span() while tracing is off, so disabled spans cost one global lookup
+_DISABLED = nullcontext()
+
+_tracer: Optional['Tracer'] = None
+
+
+class SpanRecord(NamedTuple):
+    name: str
+    category: str
+    start: float
+    duration: float
+    # Duration minus the time spent in spans nested inside this one
+    self_time: float
+    thread_id: int
+    args: dict
+
+
+class StageSummary(NamedTuple):
+    name: str
+    calls: int
+    total: float
+    self_time: float
+    longest: float
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start', 'child_time')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.child_time = 0.0
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        stack = self.tracer._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+        self.tracer.records.append(SpanRecord(self.name, self.category, self.start, duration,
+                                              duration - self.child_time, threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    """Collects spans from every thread, for a summary table or a Chrome trace."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.records: List[SpanRecord] = []
+        self.thread_names: Dict[int, str] = {}
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+            self.thread_names[threading.get_ident()] = threading.current_thread().name
+        return stack
+
+    def elapsed(self) -> float:
+        """Seconds since tracing started."""
+        return time.perf_counter() - self.origin
+
+    def span(self, name: str, category: str = '', **args) -> _Span:
+        return _Span(self, name, category, args)
+
+    def summary(self) -> List[StageSummary]:
+        """Per-span-name totals, most self time first."""
+        stages: Dict[str, list] = {}
+        for record in self.records:
+            stage = stages.setdefault(record.name, [0, 0.0, 0.0, 0.0])
+            stage[0] += 1
+            stage[1] += record.duration
+            stage[2] += record.self_time
+            stage[3] = max(stage[3], record.duration)
+        summaries = [StageSummary(name, *totals) for name, totals in stages.items()]
+        return sorted(summaries, key=lambda stage: stage.self_time, reverse=True)
+
+    def chrome_trace(self) -> dict:
+        """The spans in Chrome trace event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': name}}
+                  for thread_id, name in self.thread_names.items()]
+        for record in self.records:
+            events.append({
+                'name': record.name,
+                'cat': record.category,
+                'ph': 'X',
+                'ts': (record.start - self.origin) * 1e6,
+                'dur': record.duration * 1e6,
+                'pid': pid,
+                'tid': record.thread_id,
+                'args': {key: str(value) for key, value in record.args.items()},
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def enable() -> Tracer:
+    """Start collecting spans; returns the tracer they are collected by."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable():
+    global _tracer
+    _tracer = None
+
+
+def span(name: str, category: str = '', **args):
+    """Context manager timing a block as a span, or doing nothing while tracing is off."""
+    if _tracer is None:
+        return _DISABLED
+    return _tracer.span(name, category, **args)
+
+
+def traced(name: str, iterable: Iterable, category: str = '') -> Iterable:
+    """Time each pull from a lazy stream as a span; the stream itself while tracing is off."""
+    if _tracer is None:
+        return iterable
+    return _traced(_tracer, name, iter(iterable), category)
+
+
+def _traced(tracer: Tracer, name: str, iterator: Iterator, category: str) -> Iterator:
+    while True:
+        with tracer.span(name, category):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
@@ -0,0 +1,132 @@
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+class ReplayMissError(ConnectionError):
+    """A replayed run requested a URL that was never recorded."""
+
+
+def recording_path(directory: Path, url: str) -> Path:
+    """File a response to ``url`` is recorded in."""
+    return Path(directory) / (hashlib.sha1(url.encode()).hexdigest() + '.json')
+
+
+class ReplayedResponse:
+    """The parts of requests.Response that the sources use, rebuilt from a recording."""
+
+    def __init__(self, url: str, status_code: int, headers: dict, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class ReplaySession:
+    """Answer every GET from responses recorded by RecordingSession, never touching the network."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def load(self, url: str) -> Optional[ReplayedResponse]:
+        """The recorded response for ``url``, or None if there is none."""
+        path = recording_path(self.directory, url)
+        if not path.exists():
+            return None
+        with open(path) as f:
+            recorded = json.load(f)
+        return ReplayedResponse(url, recorded['status_code'], recorded['headers'],
+                                base64.b64decode(recorded['body']))
+
+    def get(self, url: str, **kwargs) -> ReplayedResponse:
+        response = self.load(url)
+        if response is None:
+            raise ReplayMissError(f"No recorded response for {url} in {self.directory}")
+        return response
+
+
+class RecordingSession:
+    """Perform GETs and save each response, keyed by URL, for ReplaySession."""
+
+    def __init__(self, directory: Path, http=None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.http = http
+
+    def get(self, url: str, **kwargs):
+        import requests
+
+        response = (self.http or requests).get(url, **kwargs)
+        recorded = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'body': base64.b64encode(response.content).decode('ascii'),
+        }
+        path = recording_path(self.directory, url)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(recorded, f)
+        os.replace(tmp_path, path)
+        return response
+
+
+def standin_url(base_url: str, url: str) -> str:
+    """Where the stand-in server serves ``url``: ``<base>/<host><path>?<query>``."""
+    parts = urlsplit(url)
+    rewritten = f"{base_url.rstrip('/')}/{parts.netloc}{parts.path}"
+    return f"{rewritten}?{parts.query}" if parts.query else rewritten
+
+
+class StandinSession:
+    """Send every GET to a local stand-in server instead of the real host."""
+
+    def __init__(self, base_url: str, http=None):
+        self.base_url = base_url
+        self.http = http
+
+    def get(self, url: str, **kwargs):
+        import requests
+
+        return (self.http or requests).get(standin_url(self.base_url, url), **kwargs)
+
+
+def from_environment(http=None):
+    """Wrap ``http`` (None meaning plain requests) in the transport the environment selects.
+
+    F1NEWS_REPLAY=dir answers from recordings only; F1NEWS_STANDIN=url sends
+    requests to a stand-in server; F1NEWS_RECORD=dir saves every response
+    (from the stand-in too, when both are set). With none of them set,
+    ``http`` is returned unchanged.
+    """
+    replay = os.environ.get('F1NEWS_REPLAY')
+    if replay:
+        return ReplaySession(Path(replay))
+    standin = os.environ.get('F1NEWS_STANDIN')
+    if standin:
+        http = StandinSession(standin, http)
+    record = os.environ.get('F1NEWS_RECORD')
+    if record:
+        http = RecordingSession(Path(record), http)
+    return http
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from .cache import Cache
+
+# Wait this long after a session's scheduled end before its data is worth fetching
+SETTLE_DELAY = 120
+
+# Sessions that ended longer ago than this are left to ordinary queries
+WARM_WINDOW = 6 * 3600
+
+# Seconds between checks of a session whose data is still changing
+RECHECK_INTERVAL = 300
+
+# Identical consecutive fetches needed before a session's data counts as final
+STABLE_CHECKS = 2
+
+# How long final session data, and the season calendar, are served from the cache
+STABLE_TTL = 30 * 86400
+CALENDAR_TTL = 12 * 3600
+
+STATE_KEY = 'warming_state'
+
+
+def parse_time(value: str) -> datetime:
+    """Parse an OpenF1 timestamp into an aware datetime."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def session_end(session: dict) -> Optional[datetime]:
+    """When a session ends, or None when the calendar does not say yet."""
+    date_end = session.get('date_end')
+    return parse_time(date_end) if date_end else None
+
+
+class CachedResponse:
+    """The parts of a requests.Response that RaceResultSource uses, served from the cache."""
+
+    status_code = 200
+    ok = True
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+class ResponseCache:
+    """OpenF1 responses by URL, each kept for its own lifetime.
+
+    Written by the session warmer; RaceResultSource reads from it so the
+    first query after a session is answered without touching the API.
+    """
+
+    def __init__(self, cache: Optional[Cache] = None):
+        self.cache = cache or Cache()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return "openf1_" + hashlib.sha1(url.encode()).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        entry = self.cache.get(self._key(url), max_age=STABLE_TTL)
+        if not entry or time.time() > entry['expires']:
+            return None
+        return CachedResponse(entry['data'])
+
+    def put(self, url: str, data, ttl: float):
+        self.cache.set(self._key(url), {'url': url, 'data': data, 'expires': time.time() + ttl})
+
+
+class SessionWarmer:
+    """Fill the response cache for each session shortly after it ends.
+
+    The season calendar gives every session's scheduled end. Once a session
+    has ended, its positions, laps, drivers and classification are fetched
+    and cached, then fetched again every ``RECHECK_INTERVAL`` until they come
+    back unchanged ``STABLE_CHECKS`` times in a row, after which they are
+    kept for ``STABLE_TTL``.
+    """
+
+    def __init__(self, result_source, response_cache: Optional[ResponseCache] = None):
+        self.result_source = result_source
+        self.response_cache = response_cache or ResponseCache()
+        state = self.response_cache.cache.get(STATE_KEY, max_age=STABLE_TTL) or {}
+        # session_key -> {'digest': ..., 'checks': ..., 'stable': ...}
+        self.state: Dict[str, dict] = state
+
+    def _fetch(self, url: str, ttl: float):
+        """Fetch a URL from the API and cache the response for ``ttl`` seconds."""
+        import requests
+
+        response = (self.result_source.http or requests).get(url, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        self.response_cache.put(url, data, ttl)
+        return data
+
+    def calendar(self, now: Optional[datetime] = None) -> List[dict]:
+        """This season's sessions, from the cache when recently fetched."""
+        now = now or datetime.now(timezone.utc)
+        url = self.result_source.sessions_url(now.year)
+        cached = self.response_cache.get(url)
+        if cached is not None:
+            return cached.json()
+        return self._fetch(url, CALENDAR_TTL)
+
+    def pending(self, sessions: List[dict], now: Optional[datetime] = None) -> List[dict]:
+        """Sessions that ended recently and whose cached data is not yet final."""
+        now = now or datetime.now(timezone.utc)
+        due = []
+        for session in sessions:
+            end = session_end(session)
+            if end is None:
+                # No end time yet: the session has not finished, whatever else the calendar says
+                continue
+            ended = (now - end).total_seconds()
+            if SETTLE_DELAY <= ended <= WARM_WINDOW and not self.state.get(str(session['session_key']), {}).get('stable'):
+                due.append(session)
+        return due
+
+    def warm(self, session: dict) -> bool:
+        """Fetch and cache one session's data; return whether it is now stable."""
+        key = str(session['session_key'])
+        urls = self.result_source.session_urls(session['session_key'])
+        data = [self._fetch(url, RECHECK_INTERVAL * 2) for url in urls]
+        digest = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+        entry = self.state.setdefault(key, {'digest': None, 'checks': 0, 'stable': False})
+        entry['checks'] = entry['checks'] + 1 if digest == entry['digest'] else 1
+        entry['digest'] = digest
+        # Empty responses mean the data has not landed yet, however often they repeat
+        if entry['checks'] >= STABLE_CHECKS and all(data):
+            entry['stable'] = True
+            for url, response_data in zip(urls, data):
+                self.response_cache.put(url, response_data, STABLE_TTL)
+        return entry['stable']
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, bool]:
+        """Warm every pending session; return whether each one is stable."""
+        now = now or datetime.now(timezone.utc)
+        sessions = self.calendar(now)
+        pending = self.pending(sessions, now)
+        if pending:
+            # A newly ended session changes which one is "latest", so refresh the calendar too
+            self._fetch(self.result_source.sessions_url(now.year), CALENDAR_TTL)
+        results = {}
+        for session in pending:
+            name = self.result_source.session_name(session)
+            try:
+                results[name] = self.warm(session)
+            except Exception as e:
+                print(f"Warning: warming {name} failed: {e}", file=sys.stderr)
+        self.response_cache.cache.set(STATE_KEY, self.state)
+        return results
+
+    def next_wakeup(self, sessions: List[dict], now: Optional[datetime] = None) -> float:
+        """Seconds until there is something to do: a recheck, or the next session ending."""
+        now = now or datetime.now(timezone.utc)
+        if self.pending(sessions, now):
+            return RECHECK_INTERVAL
+        ends = [session_end(session) for session in sessions]
+        upcoming = [(end - now).total_seconds() + SETTLE_DELAY for end in ends if end is not None]
+        upcoming = [seconds for seconds in upcoming if seconds > 0]
+        return min(upcoming + [CALENDAR_TTL])
+
+    def run_forever(self):
+        """Warm sessions as they end until interrupted."""
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Warning: warming pass failed: {e}", file=sys.stderr)
+                time.sleep(RECHECK_INTERVAL)
+                continue
+            try:
+                sessions = self.calendar()
+            except Exception as e:
+                print(f"Warning: could not read the session calendar: {e}", file=sys.stderr)
+                sessions = []
+            time.sleep(max(1.0, self.next_wakeup(sessions)))
@@ -11,6 +11,7 @@ setup(
         "rich>=13.0.0",
         "requests>=2.28.0",
         "python-dateutil>=2.8.0",
+        "numpy>=1.20.0",
     ],
     entry_points={
         "console_scripts": [
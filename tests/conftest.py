@@ -0,0 +1,32 @@
+"""Shared test fixtures."""
+
+import pytest
+from datetime import datetime, timedelta
+from itertools import count
+from f1_news.models import NewsItem
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Keep commands from reading or writing the real config, archive and seen-set under ~/.f1-news."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('F1_NEWS_ARCHIVE', str(tmp_path / 'archive.db'))
+    monkeypatch.setenv('F1_NEWS_SEEN', str(tmp_path / 'seen.bin'))
+
+
+@pytest.fixture
+def make_item():
+    """Factory for news items.
+
+    Item ``i`` links to https://example.com/<i> and is published ``i`` hours
+    after 2024-03-01; ``i`` counts up from 0 when not given, so every item
+    gets its own URL and later items are newer.
+    """
+    numbers = count()
+
+    def make(title="Race report", content="", i=None, timestamp=None):
+        i = next(numbers) if i is None else i
+        return NewsItem(title=title, content=content, url=f"https://example.com/{i}", source="test",
+                        timestamp=timestamp or datetime(2024, 3, 1) + timedelta(hours=i))
+
+    return make
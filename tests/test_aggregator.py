@@ -0,0 +1,163 @@
+"""Tests for the source registry and concurrent multi-source aggregation."""
+
+import time
+import pytest
+from datetime import datetime, timedelta
+from f1_news.aggregator import Aggregator, SourceBudget, enabled_sources
+from f1_news.config import Config
+from f1_news.models import NewsItem
+from f1_news.sources import RedditSource, RSSSource, TwitterSource
+from f1_news.standin import StandinServer, SyntheticUpstream
+
+
+class FakeSource:
+    """A source yielding items at the given hours, newest first, after an optional delay."""
+
+    def __init__(self, name, hours, delay=0.0, error=None):
+        self.name = name
+        self.hours = sorted(hours, reverse=True)
+        self.delay = delay
+        self.error = error
+        self.pulled = 0
+
+    def iter_news(self, seen=None, since=None):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        for hour in self.hours:
+            self.pulled += 1
+            yield NewsItem(title=f"{self.name} {hour}", content="", url=f"https://{self.name}.example/{hour}",
+                           source=self.name, timestamp=datetime(2024, 3, 1) + timedelta(hours=hour))
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    server = StandinServer(SyntheticUpstream(entries=5))
+    server.start()
+    monkeypatch.setenv('F1NEWS_STANDIN', server.url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestAggregator:
+    """Tests for merging source streams."""
+
+    def test_merges_newest_first(self):
+        """Test items from every source come out in one newest-first order."""
+        aggregator = Aggregator({'a': FakeSource('a', [1, 4, 7]), 'b': FakeSource('b', [2, 3, 9])})
+
+        assert [item.title for item in aggregator.iter_news()] == ['b 9', 'a 7', 'a 4', 'b 3', 'b 2', 'a 1']
+
+    def test_stops_pulling_at_limit(self):
+        """Test each source is only read as far as the merge needs."""
+        sources = {'a': FakeSource('a', range(100)), 'b': FakeSource('b', range(100))}
+
+        news = Aggregator(sources).fetch_news(limit=3)
+
+        assert len(news) == 3
+        assert sources['a'].pulled + sources['b'].pulled <= 3 + len(sources)
+
+    def test_sources_run_concurrently(self):
+        """Test slow sources wait on the network at the same time, not one after another."""
+        sources = {name: FakeSource(name, [i], delay=0.3) for i, name in enumerate('abc')}
+
+        start = time.perf_counter()
+        news = Aggregator(sources).fetch_news(limit=10)
+
+        assert len(news) == 3
+        assert time.perf_counter() - start < 0.6
+
+    def test_timeout_budget(self, capsys):
+        """Test a source that misses its budget is left out instead of holding up the rest."""
+        aggregator = Aggregator({'fast': FakeSource('fast', [1, 2]), 'slow': FakeSource('slow', [3], delay=1.0)},
+                                {'slow': SourceBudget(timeout=0.1)})
+
+        start = time.perf_counter()
+        titles = [item.title for item in aggregator.iter_news()]
+
+        assert titles == ['fast 2', 'fast 1']
+        assert time.perf_counter() - start < 0.5
+        assert "slow delivered nothing within its 0.1s budget" in capsys.readouterr().err
+
+    def test_max_items_budget(self):
+        """Test a source contributes at most max_items items."""
+        aggregator = Aggregator({'a': FakeSource('a', [1, 2, 3, 4]), 'b': FakeSource('b', [5])},
+                                {'a': SourceBudget(max_items=2)})
+
+        assert [item.title for item in aggregator.iter_news()] == ['b 5', 'a 4', 'a 3']
+
+    def test_failing_source_is_skipped(self, capsys):
+        """Test one source failing leaves the others' news intact."""
+        aggregator = Aggregator({'a': FakeSource('a', [1]), 'b': FakeSource('b', [2], error=ConnectionError("down"))})
+
+        assert [item.title for item in aggregator.iter_news()] == ['a 1']
+        assert "news source b failed: down" in capsys.readouterr().err
+
+
+class TestRegistry:
+    """Tests for enabling sources through the config."""
+
+    def test_rss_only_by_default(self):
+        """Test a config that does not mention sources enables RSS alone."""
+        config = Config()
+        config.set('sources', {})
+
+        assert enabled_sources(config) == ['rss']
+        assert isinstance(Aggregator.from_config(config).sources['rss'], RSSSource)
+
+    def test_enabled_in_config(self):
+        """Test sources and their budgets come from the config."""
+        config = Config()
+        config.set('sources.rss.enabled', False)
+        config.set('sources.reddit', {'enabled': True, 'timeout': 5, 'max_items': 20})
+        config.set('reddit.subreddit', 'F1Technical')
+
+        aggregator = Aggregator.from_config(config)
+
+        assert list(aggregator.sources) == ['reddit']
+        assert aggregator.sources['reddit'].subreddit == 'F1Technical'
+        assert aggregator.budgets['reddit'] == SourceBudget(timeout=5, max_items=20)
+
+    def test_prebuilt_sources(self):
+        """Test a caller can supply its own instance of an enabled source."""
+        rss = RSSSource()
+
+        assert Aggregator.from_config(Config(), rss=rss).sources['rss'] is rss
+
+
+class TestSocialSources:
+    """Tests for Twitter and Reddit against the stand-in server."""
+
+    def test_twitter(self, standin):
+        """Test tweets become newest-first items linking to the tweet."""
+        news = TwitterSource('token').fetch_news(limit=10)
+
+        assert len(news) == 5
+        assert news[0].url.startswith("https://twitter.com/") and "/status/" in news[0].url
+        assert news[0].author.startswith("@")
+        assert [item.timestamp for item in news] == sorted((item.timestamp for item in news), reverse=True)
+
+    def test_twitter_needs_token(self, capsys):
+        """Test the Twitter source yields nothing without a bearer token."""
+        assert TwitterSource().fetch_news() == []
+        assert "bearer token" in capsys.readouterr().err
+
+    def test_reddit_seen_and_since(self, standin):
+        """Test Reddit posts skip seen links and posts older than since."""
+        posts = RedditSource().fetch_news(limit=10)
+        seen = {posts[0].url}
+
+        news = list(RedditSource().iter_news(seen=seen, since=posts[3].timestamp))
+
+        assert [item.url for item in news] == [post.url for post in posts[1:4]]
+
+    def test_all_sources_merged(self, standin):
+        """Test RSS, Twitter and Reddit news merge into one newest-first stream."""
+        aggregator = Aggregator({'rss': RSSSource(), 'twitter': TwitterSource('token'), 'reddit': RedditSource()})
+
+        news = list(aggregator.iter_news())
+
+        assert {item.source for item in news} >= {"Twitter", "Reddit r/formula1", "Autosport"}
+        assert len(news) == 5 * (len(RSSSource().rss_feeds) + 2)
+        assert [item.timestamp for item in news] == sorted((item.timestamp for item in news), reverse=True)
@@ -0,0 +1,263 @@
+"""Tests for the persistent news archive."""
+
+import sqlite3
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from f1_news.archive import ArchiveWriter, NewsArchive, match_expression
+from f1_news.cli import main
+from f1_news.models import NewsItem
+from f1_news.sources import RSSSource
+
+
+def make_item(i, title="Race report", content="", timestamp=None):
+    return NewsItem(title=title, content=content, url=f"https://example.com/{i}", source="test",
+                    timestamp=timestamp or datetime(2024, 3, 1) + timedelta(hours=i))
+
+
+def make_source(entries, **kwargs):
+    """An RSSSource whose single feed has ``entries`` entries published on consecutive days."""
+    feed = Mock()
+    feed.entries = []
+    for i in range(entries):
+        entry = Mock()
+        entry.title = f"Day {i + 1}"
+        entry.summary = ""
+        entry.link = f"https://example.com/{i}"
+        entry.published_parsed = (2024, 1, i + 1, 12, 0, 0, 0, 1, 0)
+        feed.entries.append(entry)
+    source = RSSSource(**kwargs)
+    source.rss_feeds = {"a": "https://a.example/rss"}
+    source.source_names = {"a": "A"}
+    source._download_feed = lambda key: feed
+    return source
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = NewsArchive(tmp_path / 'archive.db')
+    yield archive
+    archive.close()
+
+
+class TestNewsArchive:
+    """Tests for NewsArchive."""
+
+    def test_add_skips_known_urls(self, archive):
+        """Test archiving the same items twice stores them once."""
+        items = [make_item(i) for i in range(3)]
+
+        assert archive.add(items) == 3
+        assert archive.add(items + [make_item(3)]) == 1
+        assert len(archive) == 4
+
+    def test_add_does_not_scan_the_table(self, archive):
+        """Test counting new items does not run a query over every archived article."""
+        archive.add([make_item(i) for i in range(3)])
+        statements = []
+        archive._db.set_trace_callback(statements.append)
+
+        assert archive.add([make_item(i) for i in range(5)]) == 2
+        assert not any('COUNT' in statement for statement in statements)
+
+    def test_full_text_search(self, archive):
+        """Test every term must match, accents are folded and prefixes work."""
+        archive.add([
+            make_item(0, "Pérez on pole in Jeddah", "Red Bull lock out the front row"),
+            make_item(1, "Hamilton's Ferrari move confirmed", "Seven-time champion joins Maranello"),
+            make_item(2, "Ferrari upgrade", "New floor for Jeddah"),
+        ])
+
+        assert [item.url for item in archive.search("perez")[0]] == ["https://example.com/0"]
+        assert [item.url for item in archive.search("ferrari jeddah")[0]] == ["https://example.com/2"]
+        assert [item.url for item in archive.search("maran*")[0]] == ["https://example.com/1"]
+        assert archive.search('"unbalanced (syntax')[0] == []
+
+    def test_html_markup_not_indexed(self, archive):
+        """Test only the plain text of the content is searchable, not its tags and attributes."""
+        archive.add([make_item(0, "Upgrade",
+                               '<p class="lead">New <a href="https://example.com">floor</a> &amp; wing</p>')])
+
+        assert [item.url for item in archive.search("floor wing")[0]] == ["https://example.com/0"]
+        assert archive.search("href")[0] == []
+        assert archive.search("lead")[0] == []
+        assert archive.search("amp")[0] == []
+        assert archive.search("floor")[0][0].content.startswith("<p")
+
+    def test_html_index_migrated(self, tmp_path):
+        """Test an archive that indexed raw HTML is reindexed from plain text when opened."""
+        path = tmp_path / 'old.db'
+        db = sqlite3.connect(str(path))
+        db.executescript("""
+            CREATE TABLE articles (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, title TEXT NOT NULL,
+                content TEXT NOT NULL, source TEXT NOT NULL, author TEXT, timestamp TEXT, tags TEXT NOT NULL,
+                published REAL NOT NULL);
+            CREATE VIRTUAL TABLE articles_fts USING fts5(title, content, content='articles', content_rowid='id');
+            CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+            END;
+            INSERT INTO articles (url, title, content, source, tags, published)
+                VALUES ('https://example.com/0', 'Upgrade', '<a href="x">New floor</a>', 'test', '[]', 0);
+        """)
+        db.close()
+
+        archive = NewsArchive(path)
+        try:
+            assert [item.url for item in archive.search("floor")[0]] == ["https://example.com/0"]
+            assert archive.search("href")[0] == []
+            assert archive.add([make_item(1, "Ferrari", "<b>floor</b>")]) == 1
+            assert len(archive.search("floor")[0]) == 2
+        finally:
+            archive.close()
+
+    def test_round_trip(self, archive):
+        """Test archived items come back unchanged."""
+        item = NewsItem(title="News", content="Body", url="https://example.com/x", source="test",
+                        author="Writer", timestamp=datetime(2024, 3, 1, 12), tags=["f1"])
+        archive.add([item])
+
+        assert archive.search("news")[0] == [item]
+
+    def test_time_window(self, archive):
+        """Test since is inclusive and until exclusive."""
+        archive.add([make_item(i) for i in range(48)])
+
+        items, _ = archive.search(since=datetime(2024, 3, 2), until=datetime(2024, 3, 2, 3), limit=100)
+
+        assert [item.timestamp.hour for item in items] == [2, 1, 0]
+
+    def test_keyset_pagination(self, archive):
+        """Test pages cover every match once, newest first, even with tied timestamps."""
+        same_time = datetime(2024, 3, 5)
+        archive.add([make_item(i) for i in range(25)] + [make_item(100 + i, timestamp=same_time) for i in range(5)])
+
+        urls, cursor = [], None
+        while True:
+            items, cursor = archive.search("race", limit=7, cursor=cursor)
+            urls.extend(item.url for item in items)
+            if cursor is None:
+                break
+
+        assert len(urls) == len(set(urls)) == 30
+        assert urls[:5] == [f"https://example.com/{i}" for i in range(104, 99, -1)]
+
+    def test_season_search_is_fast(self, archive):
+        """Test a search over a season of articles stays in the millisecond range."""
+        words = ["verstappen", "hamilton", "ferrari", "mclaren", "upgrade", "penalty", "strategy"]
+        archive.add([make_item(i, f"{words[i % 7]} {words[i // 7 % 7]} news {i}", "Race weekend coverage " * 20,
+                               datetime(2024, 1, 1) + timedelta(minutes=30 * i)) for i in range(10000)])
+
+        start = time.perf_counter()
+        items, cursor = archive.search("ferrari penalty", since=datetime(2024, 3, 1), limit=20)
+        elapsed = time.perf_counter() - start
+
+        assert len(items) == 20 and cursor
+        assert elapsed < 0.05
+
+
+class TestArchiveWriter:
+    """Tests for archiving a lazy stream."""
+
+    def test_pulled_items_archived(self, archive):
+        """Test items are archived by finish without pulling the rest of the stream."""
+        pulled = []
+
+        def stream():
+            for i in range(10):
+                pulled.append(i)
+                yield make_item(i)
+
+        writer = ArchiveWriter(archive)
+        news_items = writer.tap(stream())
+        next(news_items)
+        next(news_items)
+
+        assert writer.finish() == 2
+        assert len(pulled) == 2
+
+    def test_collected_items_archived(self, archive):
+        """Test items handed over with collect are archived even if never pulled."""
+        writer = ArchiveWriter(archive)
+        writer.collect([make_item(i) for i in range(3)])
+        news_items = writer.tap(iter([make_item(0)]))
+        next(news_items)
+
+        assert writer.finish() == 3
+
+
+class TestFetchArchiving:
+    """Tests for archiving during fetch."""
+
+    @patch('f1_news.cli.RSSSource')
+    def test_whole_feed_archived_despite_limit(self, mock_rss_source):
+        """Test every parsed feed entry is archived, not only the ones --limit lets through."""
+        mock_rss_source.side_effect = lambda **kwargs: make_source(8, **kwargs)
+
+        result = CliRunner().invoke(main, ['fetch', '--limit', '2', '--format', 'ndjson'])
+
+        assert len(result.stdout.splitlines()) == 2
+        archive = NewsArchive()
+        try:
+            assert len(archive) == 8
+        finally:
+            archive.close()
+
+    @patch('f1_news.cli.RSSSource')
+    def test_entries_before_since_archived(self, mock_rss_source):
+        """Test entries --since skips are still archived."""
+        mock_rss_source.side_effect = lambda **kwargs: make_source(8, **kwargs)
+
+        result = CliRunner().invoke(main, ['fetch', '--since', '2024-01-07', '--format', 'ndjson'])
+
+        assert len(result.stdout.splitlines()) == 2
+        archive = NewsArchive()
+        try:
+            assert len(archive) == 8
+        finally:
+            archive.close()
+
+
+class TestSearchCommand:
+    """Tests for the search command."""
+
+    def test_search_pages(self, tmp_path, monkeypatch):
+        """Test search prints a cursor that continues to the next page."""
+        monkeypatch.setenv('F1_NEWS_ARCHIVE', str(tmp_path / 'cli.db'))
+        archive = NewsArchive()
+        archive.add([make_item(i, f"Ferrari story {i}") for i in range(3)])
+        archive.close()
+        runner = CliRunner()
+
+        first = runner.invoke(main, ['search', 'ferrari', '--limit', '2', '--format', 'ndjson'])
+        cursor = first.stderr.split('--cursor ')[1].split()[0]
+        second = runner.invoke(main, ['search', 'ferrari', '--limit', '2', '--format', 'ndjson', '--cursor', cursor])
+
+        assert first.exit_code == 0
+        assert len(first.stdout.splitlines()) == 2
+        assert len(second.stdout.splitlines()) == 1
+        assert '--cursor' not in second.stderr
+
+    def test_bad_cursor(self):
+        """Test a malformed cursor is a usage error."""
+        result = CliRunner().invoke(main, ['search', 'ferrari', '--cursor', 'nonsense'])
+
+        assert result.exit_code == 2
+
+    def test_archive_unavailable(self, monkeypatch):
+        """Test a SQLite build without FTS5 is reported instead of crashing."""
+        def no_fts5(*args, **kwargs):
+            raise sqlite3.OperationalError("no such module: fts5")
+
+        monkeypatch.setattr('f1_news.archive.NewsArchive', no_fts5)
+        result = CliRunner().invoke(main, ['search', 'ferrari'])
+
+        assert result.exception is None
+        assert "no such module: fts5" in result.stderr
+        assert "news archive is unavailable" in result.output
+
+
+def test_match_expression_quotes_terms():
+    """Test FTS operators in user input are treated as plain words."""
+    assert match_expression('red OR bull*') == '"red" "OR" "bull"*'
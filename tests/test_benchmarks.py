@@ -0,0 +1,41 @@
+"""Smoke tests keeping the benchmark suite runnable."""
+
+from benchmarks.suite import compare, main, run
+from f1_news.synthetic import openf1_session, rss_feed
+
+
+class TestBenchmarkSuite:
+    """Tests for the offline benchmark suite."""
+    
+    def test_synthetic_inputs(self):
+        """Test generators produce the requested sizes."""
+        payloads = openf1_session(drivers=20, laps=70)
+        
+        assert rss_feed(25).count("<item>") == 25
+        assert len(payloads['laps']) == 20 * 70
+        assert len(payloads['drivers']) == 20
+    
+    def test_every_stage_runs(self):
+        """Test every stage runs on tiny inputs and reports time and peak memory."""
+        results = run(entries=20, drivers=4, laps=20, repeat=1)
+        
+        assert {'parse_rss', 'filter_team', 'extract_keywords', 'render_json', 'fetch_latest_results'} <= set(results)
+        assert all(metrics['seconds'] > 0 and metrics['peak_bytes'] > 0 for metrics in results.values())
+    
+    def test_compare_flags_regressions(self):
+        """Test only stages beyond the threshold are reported."""
+        baseline = {'a': {'seconds': 1.0, 'peak_bytes': 100}, 'b': {'seconds': 1.0, 'peak_bytes': 100}}
+        current = {'a': {'seconds': 1.1, 'peak_bytes': 100}, 'b': {'seconds': 2.0, 'peak_bytes': 100}}
+        
+        regressions = compare(current, baseline, 1.25)
+        
+        assert len(regressions) == 1 and regressions[0].startswith('b: seconds')
+    
+    def test_baseline_round_trip(self, tmp_path, capsys):
+        """Test a saved baseline can be compared against."""
+        baseline = tmp_path / 'baseline.json'
+        args = ['--entries', '10', '--drivers', '2', '--laps', '12', '--repeat', '1', '--stage', 'lap_table']
+        
+        assert main(args + ['--save', str(baseline)]) == 0
+        assert main(args + ['--compare', str(baseline), '--threshold', '1000']) == 0
+        assert 'lap_table' in capsys.readouterr().out
@@ -1,9 +1,11 @@
 """Tests for F1 News CLI commands."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
 from f1_news.cli import main, fetch, result
+from f1_news.laps import LapTable
 from f1_news.models import NewsItem, RaceResults, RaceResult
 from datetime import datetime
 
@@ -33,7 +35,7 @@ class TestCLICommands:
         """Test fetch command with default parameters."""
         # Mock RSS source
         mock_source = Mock()
-        mock_source.fetch_news.return_value = [
+        mock_source.iter_news.return_value = iter([
             NewsItem(
                 title="Test News",
                 content="Test content",
@@ -41,7 +43,7 @@ class TestCLICommands:
                 source="test",
                 timestamp=datetime.now()
             )
-        ]
+        ])
         mock_rss_source.return_value = mock_source
         
         runner = CliRunner()
@@ -49,40 +51,70 @@ class TestCLICommands:
         
         assert result.exit_code == 0
         assert "Fetching F1 news from rss" in result.output
-        mock_source.fetch_news.assert_called_once()
+        mock_source.iter_news.assert_called_once()
     
     @patch('f1_news.cli.RSSSource')
     def test_fetch_command_json_format(self, mock_rss_source):
         """Test fetch command with JSON output format."""
         mock_source = Mock()
-        mock_source.fetch_news.return_value = [
+        mock_source.iter_news.return_value = iter([
             NewsItem(
                 title="Test News",
                 content="Test content", 
                 url="https://example.com",
                 source="test"
             )
-        ]
+        ])
         mock_rss_source.return_value = mock_source
         
         runner = CliRunner()
         result = runner.invoke(fetch, ['--format', 'json'])
         
         assert result.exit_code == 0
-        mock_source.fetch_news.assert_called_once()
+        mock_source.iter_news.assert_called_once()
     
     @patch('f1_news.cli.RSSSource')
     def test_fetch_command_with_limit(self, mock_rss_source):
         """Test fetch command with custom limit."""
         mock_source = Mock()
-        mock_source.fetch_news.return_value = []
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title=f"News {i}", content="", url=f"https://example.com/{i}", source="test")
+            for i in range(20)
+        ])
         mock_rss_source.return_value = mock_source
         
         runner = CliRunner()
-        result = runner.invoke(fetch, ['--limit', '5'])
+        result = runner.invoke(fetch, ['--limit', '5', '--format', 'markdown'])
         
         assert result.exit_code == 0
-        mock_source.fetch_news.assert_called_with(limit=5)
+        assert "## 5. [News 4]" in result.output
+        assert "News 5" not in result.output
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_fetch_command_stops_pulling_at_limit(self, mock_rss_source):
+        """Test filtered fetch only consumes the stream until limit matches are found."""
+        pulled = []
+        
+        def news_stream():
+            for i in range(100):
+                pulled.append(i)
+                yield NewsItem(
+                    title=f"Ferrari news {i}" if i % 2 == 0 else f"Other news {i}",
+                    content="",
+                    url=f"https://example.com/{i}",
+                    source="test"
+                )
+        
+        mock_source = Mock()
+        mock_source.iter_news.return_value = news_stream()
+        mock_rss_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--limit', '3', '--team', 'ferrari', '--format', 'markdown'])
+        
+        assert result.exit_code == 0
+        assert "## 3. [Ferrari news 4]" in result.output
+        assert len(pulled) == 5
     
     @patch('f1_news.cli.RaceResultSource')
     def test_result_command_success(self, mock_result_source):
@@ -119,6 +151,85 @@ class TestCLICommands:
         assert cli_result.exit_code == 0
         assert "Error fetching race results" in cli_result.output
     
+    @patch('f1_news.cli.RSSSource')
+    def test_digest_command_by_team(self, mock_rss_source, tmp_path):
+        """Test digest writes one document per team from a single fetch."""
+        mock_source = Mock()
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title="Ferrari news", content="", url="https://example.com/1", source="test"),
+            NewsItem(title="Haas news", content="", url="https://example.com/2", source="test"),
+        ])
+        mock_rss_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(main, ['digest', '--by', 'team', '--output-dir', str(tmp_path)])
+        
+        assert result.exit_code == 0
+        mock_source.iter_news.assert_called_once()
+        assert "Ferrari news" in (tmp_path / "ferrari.json").read_text()
+        assert "Haas news" in (tmp_path / "haas.json").read_text()
+        assert (tmp_path / "mclaren.json").read_text().strip() == "[]"
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_digest_command_by_and_queries(self, mock_rss_source, tmp_path):
+        """Test --by and --queries together are rejected rather than one silently winning."""
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("team=ferrari\n")
+        
+        runner = CliRunner()
+        result = runner.invoke(main, ['digest', '--by', 'team', '--queries', str(queries_file)])
+        
+        assert "--by and --queries cannot be used together" in result.output
+        mock_rss_source.return_value.iter_news.assert_not_called()
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_fetch_command_ndjson_fields(self, mock_rss_source):
+        """Test ndjson output with field projection keeps stdout machine-readable."""
+        mock_source = Mock()
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title="Test News", content="Test content", url="https://example.com", source="test")
+        ])
+        mock_rss_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--format', 'ndjson', '--fields', 'title,url'])
+        
+        assert result.exit_code == 0
+        assert '{"title":"Test News","url":"https://example.com"}' in result.output.splitlines()
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_fetch_command_parquet_needs_output(self, mock_rss_source):
+        """Test binary export formats are rejected before fetching without --output."""
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--format', 'parquet'])
+        
+        assert result.exit_code != 0
+        assert "--output" in result.output
+        mock_rss_source.assert_not_called()
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_fetch_command_plain_when_piped(self, mock_rss_source):
+        """Test terminal format uses the plain renderer when stdout is not a TTY."""
+        mock_source = Mock()
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title="Test News", content="Test content", url="https://example.com", source="test")
+        ])
+        mock_rss_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(fetch)
+        
+        assert result.exit_code == 0
+        assert "1. Test News" in result.output
+        assert "News Item #1" not in result.output
+    
+    def test_fetch_invalid_fields(self):
+        """Test unknown fields are rejected."""
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--format', 'ndjson', '--fields', 'title,colour'])
+        
+        assert result.exit_code != 0
+    
     def test_filter_command_placeholder(self):
         """Test filter command shows placeholder message."""
         runner = CliRunner()
@@ -134,6 +245,67 @@ class TestCLICommands:
         
         assert result.exit_code == 0
         assert "Filtering F1 news" in result.output
+    
+    @patch('f1_news.cli.RSSSource')
+    @patch('f1_news.cli.connect_daemon')
+    def test_fetch_forwards_to_daemon(self, mock_connect, mock_rss_source):
+        """Test fetch is served by a running daemon without touching the feeds."""
+        client = Mock()
+        client.news.return_value = [
+            NewsItem(title="Daemon News", content="Body", url="https://example.com", source="test")
+        ]
+        mock_connect.return_value = client
+        
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--format', 'ndjson', '--fields', 'title', '--team', 'Ferrari'])
+        
+        assert result.exit_code == 0
+        assert '{"title":"Daemon News"}' in result.output
+        client.news.assert_called_once_with(10, 'Ferrari', None, None, 'time')
+        mock_rss_source.assert_not_called()
+    
+    @patch('f1_news.cli.RSSSource')
+    @patch('f1_news.cli.connect_daemon')
+    def test_fetch_falls_back_when_daemon_gone(self, mock_connect, mock_rss_source):
+        """Test a dead daemon socket falls back to fetching directly."""
+        client = Mock()
+        client.news.side_effect = ConnectionRefusedError()
+        mock_connect.return_value = client
+        mock_source = Mock()
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title="Direct News", content="Body", url="https://example.com", source="test")
+        ])
+        mock_rss_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(fetch, ['--format', 'ndjson', '--fields', 'title'])
+        
+        assert result.exit_code == 0
+        assert '{"title":"Direct News"}' in result.output
+    
+    @patch('f1_news.cli.RaceResultSource')
+    def test_pace_command_json(self, mock_result_source):
+        """Test pace analytics are computed from the session's lap table."""
+        laps = [{'driver_number': number, 'lap_number': lap, 'lap_duration': 90.0 + offset + 0.1 * lap}
+                for number, offset in [(1, 0.0), (44, 0.5)] for lap in range(1, 11)]
+        mock_source = Mock()
+        mock_source.find_latest_session.return_value = {'session_key': 1}
+        mock_source.session_name.return_value = "Test Grand Prix"
+        mock_source.fetch_laps.return_value = LapTable.from_laps(laps)
+        mock_source.fetch_drivers.return_value = {
+            1: {'full_name': 'Driver One', 'team_name': 'Team 1'},
+            44: {'full_name': 'Driver Two', 'team_name': 'Team 2'},
+        }
+        mock_result_source.return_value = mock_source
+        
+        runner = CliRunner()
+        result = runner.invoke(main, ['pace', '--format', 'json', '--gap-every', '5'])
+        
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert [row["driver"] for row in data["drivers"]] == ["Driver One", "Driver Two"]
+        assert data["drivers"][0]["degradation"] == pytest.approx(0.1)
+        assert data["drivers"][1]["gaps"]["5"] == pytest.approx(2.5)
 
 
 class TestCLIIntegration:
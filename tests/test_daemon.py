@@ -0,0 +1,82 @@
+"""Tests for the resident daemon and its client."""
+
+import socket
+import tempfile
+import threading
+from pathlib import Path
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+from f1_news.daemon import DaemonClient, DaemonError, DaemonServer
+from f1_news.models import NewsItem, RaceResult, RaceResults
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix sockets are not available")
+
+
+@pytest.fixture
+def daemon():
+    """A daemon serving a mock service on a temporary socket."""
+    service = Mock()
+    service.news.return_value = [
+        NewsItem(title="News", content="Body", url="https://example.com", source="test",
+                 timestamp=datetime(2024, 1, 1))
+    ]
+    service.results.return_value = RaceResults(
+        race_name="Test Grand Prix", date=datetime(2024, 1, 1), circuit="Test Circuit",
+        results=[RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5400.0)]
+    )
+    # Short directory: Unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory() as directory:
+        server = DaemonServer(service, Path(directory) / "d.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server, DaemonClient(server.socket_path, timeout=5.0)
+        server.shutdown()
+        server.server_close()
+
+
+class TestDaemon:
+    """Tests for DaemonServer and DaemonClient."""
+    
+    def test_news_forwarded(self, daemon):
+        """Test news requests reach the service and items come back intact."""
+        server, client = daemon
+        
+        items = client.news(limit=5, team="ferrari")
+        
+        assert items[0].title == "News"
+        assert items[0].timestamp == datetime(2024, 1, 1)
+        server.service.news.assert_called_once_with(limit=5, team="ferrari", driver=None, keyword=None,
+                                                    sort='time')
+    
+    def test_results_forwarded(self, daemon):
+        """Test results come back with numeric times."""
+        server, client = daemon
+        
+        results = client.results('qualifying')
+        
+        assert results.results[0].total_time == 5400.0
+        server.service.results.assert_called_once_with(session_type='qualifying')
+    
+    def test_service_error_reported(self, daemon):
+        """Test a failing request raises DaemonError on the client."""
+        server, client = daemon
+        server.service.results.side_effect = RuntimeError("OpenF1 down")
+        
+        with pytest.raises(DaemonError, match="OpenF1 down"):
+            client.results()
+    
+    def test_second_daemon_refused(self, daemon):
+        """Test a live socket is not taken over by another daemon."""
+        server, client = daemon
+        
+        with pytest.raises(OSError):
+            DaemonServer(Mock(), server.socket_path)
+    
+    def test_socket_removed_on_close(self, daemon):
+        """Test closing the server removes its socket so clients fall back."""
+        server, client = daemon
+        server.shutdown()
+        server.server_close()
+        
+        assert not client.available()
@@ -0,0 +1,123 @@
+"""Tests for F1 News CLI digests."""
+
+import pytest
+from f1_news.digest import DigestQuery, DigestRouter, bucket_filename, load_queries, queries_by_team
+
+
+class CountingBucket(list):
+    """A bucket recording each time the router looks at its size."""
+
+    def __init__(self, checked, name):
+        super().__init__()
+        self.checked = checked
+        self.name = name
+
+    def __len__(self):
+        self.checked.append(self.name)
+        return super().__len__()
+
+
+class TestDigestRouter:
+    """Tests for routing items into digest buckets."""
+    
+    def test_route_by_team(self, make_item):
+        """Test items land in every team bucket they mention."""
+        items = [
+            make_item("Ferrari and McLaren close in Monza"),
+            make_item("Kick Sauber update"),
+            make_item("Weather forecast"),
+        ]
+        
+        buckets = DigestRouter(queries_by_team()).route(items)
+        
+        assert buckets["ferrari"] == [items[0]]
+        assert buckets["mclaren"] == [items[0]]
+        assert buckets["sauber"] == [items[1]]
+        assert buckets["haas"] == []
+    
+    def test_route_combined_query(self, make_item):
+        """Test queries require every filter to match."""
+        items = [
+            make_item("Checo leads Red Bull one-two"),
+            make_item("Red Bull upgrade", "Verstappen tests the new floor"),
+            make_item("Pérez praises the upgrade"),
+        ]
+        queries = [
+            DigestQuery(name="rbr-perez", team="red bull", driver="perez"),
+            DigestQuery(name="upgrades", keyword="upgrade"),
+        ]
+        
+        buckets = DigestRouter(queries).route(items)
+        
+        assert buckets["rbr-perez"] == [items[0]]
+        assert buckets["upgrades"] == [items[1], items[2]]
+    
+    def test_route_respects_limit_and_stops_early(self, make_item):
+        """Test buckets are capped and routing stops once all are full."""
+        pulled = []
+        
+        def stream():
+            for i in range(10):
+                pulled.append(i)
+                yield make_item(f"Ferrari news {i}")
+        
+        buckets = DigestRouter([DigestQuery(name="f", team="ferrari")], limit=2).route(stream())
+        
+        assert len(buckets["f"]) == 2
+        assert len(pulled) == 2
+    
+    def test_route_visits_only_mentioned_queries(self, make_item):
+        """Test an item is only checked against queries for the names it mentions and keyword-only ones."""
+        queries = queries_by_team() + [DigestQuery(name="norris", driver="norris"),
+                                       DigestQuery(name="pole", keyword="pole")]
+        router = DigestRouter(queries)
+        checked = []
+        router.buckets = {name: CountingBucket(checked, name) for name in router.buckets}
+        
+        matched = router.add(make_item("Norris takes McLaren pole"))
+        
+        assert matched == ["mclaren", "norris", "pole"]
+        assert set(checked) == {"mclaren", "norris", "pole"}
+    
+    def test_duplicate_names_rejected(self):
+        """Test two queries cannot share a bucket."""
+        with pytest.raises(ValueError):
+            DigestRouter([DigestQuery(name="f", team="ferrari"), DigestQuery(name="f", driver="leclerc")])
+
+
+class TestLoadQueries:
+    """Tests for reading digest queries from a file."""
+    
+    def test_load_queries(self, tmp_path):
+        """Test parsing query lines with quoting and comments."""
+        path = tmp_path / "queries.txt"
+        path.write_text('# digests\nname=rbr team="red bull"\n\ndriver=norris keyword=pole\n')
+        
+        queries = load_queries(path)
+        
+        assert queries == [
+            DigestQuery(name="rbr", team="red bull"),
+            DigestQuery(name="norris pole", driver="norris", keyword="pole"),
+        ]
+    
+    def test_load_queries_invalid_field(self, tmp_path):
+        """Test unknown fields are rejected."""
+        path = tmp_path / "queries.txt"
+        path.write_text("colour=red\n")
+        
+        with pytest.raises(ValueError):
+            load_queries(path)
+    
+    def test_load_queries_clashing_names(self, tmp_path):
+        """Test names that would overwrite each other's digest file are rejected."""
+        path = tmp_path / "queries.txt"
+        path.write_text('name="Red Bull" team="red bull"\nname=red-bull driver=verstappen\n')
+        
+        with pytest.raises(ValueError, match="line 1"):
+            load_queries(path)
+
+
+def test_bucket_filename():
+    """Test bucket names are turned into safe file names."""
+    assert bucket_filename("Red Bull", "json") == "red-bull.json"
+    assert bucket_filename("Pérez / Checo", "md") == "perez-checo.md"
@@ -0,0 +1,103 @@
+"""Tests for columnar export."""
+
+import csv
+import io
+import pytest
+from datetime import datetime
+from f1_news.export import ColumnarFormatter, news_columns, result_columns, write_columns, write_csv
+from f1_news.models import NewsItem, RaceResult, RaceResults
+
+
+def make_results():
+    return RaceResults(
+        race_name="Test Grand Prix",
+        date=datetime(2024, 1, 1),
+        circuit="Test Circuit",
+        results=[
+            RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5400.0, fastest_lap_time=90.5),
+            RaceResult(2, "Driver 2", "Team 2", points=18, gap=5.123),
+            RaceResult(3, "Driver 3", "Team 3", "DNF", 0),
+        ]
+    )
+
+
+class TestColumns:
+    """Tests for building columns."""
+    
+    def test_news_columns_projection(self):
+        """Test news columns follow the selected fields and keep datetimes."""
+        items = [NewsItem(title=f"News {i}", content="<p>Body</p>", url="https://example.com",
+                          source="test", timestamp=datetime(2024, 1, i + 1)) for i in range(2)]
+        
+        columns = news_columns(items, ["title", "content", "timestamp"])
+        
+        assert list(columns) == ["title", "content", "timestamp"]
+        assert columns["content"] == ["Body", "Body"]
+        assert columns["timestamp"][1] == datetime(2024, 1, 2)
+    
+    def test_result_columns(self):
+        """Test results become one row per driver with numeric times."""
+        columns = result_columns(make_results())
+        
+        assert columns["race_name"] == ["Test Grand Prix"] * 3
+        assert columns["total_time"] == [5400.0, None, None]
+        assert columns["gap"] == [None, 5.123, None]
+        assert columns["status"] == [None, None, "DNF"]
+
+
+class TestCSV:
+    """Tests for CSV output."""
+    
+    def test_write_csv(self):
+        """Test CSV has a header row and blanks for missing values."""
+        buffer = io.StringIO()
+        write_csv(result_columns(make_results()), buffer)
+        
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        assert len(rows) == 3
+        assert rows[0]["date"] == "2024-01-01T00:00:00"
+        assert rows[1]["gap"] == "5.123"
+        assert rows[2]["total_time"] == ""
+    
+    def test_csv_file_output(self, tmp_path):
+        """Test CSV news export to a file."""
+        path = tmp_path / "news.csv"
+        item = NewsItem(title="News", content="Body", url="https://example.com", source="test",
+                        tags=["f1", "race"])
+        
+        ColumnarFormatter("csv", str(path), ["title", "tags"]).format_news([item])
+        
+        assert path.read_text().splitlines() == ["title,tags", "News,f1;race"]
+    
+    def test_binary_format_needs_output(self):
+        """Test binary formats refuse to write to stdout."""
+        with pytest.raises(ValueError):
+            write_columns({"a": [1]}, "parquet")
+
+
+class TestArrow:
+    """Tests for Parquet and Arrow IPC output."""
+    
+    def test_parquet_roundtrip(self, tmp_path):
+        """Test results written to Parquet read back with numeric types."""
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        path = tmp_path / "results.parquet"
+        
+        ColumnarFormatter("parquet", str(path)).format_results(make_results())
+        
+        table = pq.read_table(path)
+        assert table.column("total_time").to_pylist() == [5400.0, None, None]
+    
+    def test_arrow_roundtrip(self, tmp_path):
+        """Test news written to an Arrow IPC file read back intact."""
+        pa = pytest.importorskip("pyarrow")
+        path = tmp_path / "news.arrow"
+        item = NewsItem(title="News", content="Body", url="https://example.com", source="test",
+                        timestamp=datetime(2024, 1, 1))
+        
+        ColumnarFormatter("arrow", str(path), ["title", "timestamp"]).format_news([item])
+        
+        table = pa.ipc.open_file(str(path)).read_all()
+        assert table.column("title").to_pylist() == ["News"]
+        assert table.schema.field("timestamp").type == pa.timestamp("us")
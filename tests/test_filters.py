@@ -0,0 +1,87 @@
+"""Tests for F1 News CLI filters."""
+
+import pytest
+from f1_news.filters import NewsFilter
+from f1_news.normalize import fold, resolve_driver, resolve_team
+
+
+class TestNormalize:
+    """Tests for text folding and alias resolution."""
+    
+    def test_fold_strips_accents(self):
+        """Test folding removes accents and case."""
+        assert fold("Sergio Pérez") == "sergio perez"
+        assert fold("HÜLKENBERG") == "hulkenberg"
+    
+    def test_resolve_aliases(self):
+        """Test nicknames and former names resolve to canonical names."""
+        assert resolve_driver("Checo") == "perez"
+        assert resolve_driver("Pérez") == "perez"
+        assert resolve_team("RB") == "racing bulls"
+        assert resolve_team("Kick Sauber") == "sauber"
+    
+    def test_resolve_unknown_name(self):
+        """Test unknown names fall back to their folded form."""
+        assert resolve_driver("Senna") == "senna"
+
+
+class TestNewsFilter:
+    """Tests for news filtering."""
+    
+    def test_filter_by_driver_accent_insensitive(self, make_item):
+        """Test driver filter matches accented names."""
+        items = [make_item("Pérez fastest in FP1"), make_item("Hülkenberg scores points")]
+        news_filter = NewsFilter()
+        
+        assert news_filter.filter_by_driver(items, "perez") == [items[0]]
+        assert news_filter.filter_by_driver(items, "hulkenberg") == [items[1]]
+    
+    def test_filter_by_driver_nickname(self, make_item):
+        """Test driver filter matches nicknames in the text."""
+        items = [make_item("Checo happy with the balance"), make_item("Norris on pole")]
+        
+        assert NewsFilter().filter_by_driver(items, "Perez") == [items[0]]
+    
+    def test_filter_by_team_alias(self, make_item):
+        """Test team filter matches any alias of the team."""
+        items = [
+            make_item("Kick Sauber confirm line-up"),
+            make_item("Alfa Romeo history", "The Sauber-run team"),
+            make_item("Herbal tea", "no team here"),
+            make_item("VCARB upgrade", "RB bring new floor"),
+        ]
+        news_filter = NewsFilter()
+        
+        assert news_filter.filter_by_team(items, "sauber") == items[:2]
+        assert news_filter.filter_by_team(items, "rb") == [items[3]]
+    
+    def test_filter_by_unknown_team_substring(self, make_item):
+        """Test unknown team names keep substring matching."""
+        items = [make_item("Andretti-Cadillac entry approved")]
+        
+        assert NewsFilter().filter_by_team(items, "cadillac") == items
+    
+    def test_filter_by_team_ignores_road_car_brands(self, make_item):
+        """Test car makers only match their F1 team when the text is about F1."""
+        items = [
+            make_item("Audi unveils the new A4"),
+            make_item("Renault recalls the Clio"),
+            make_item("Alfa Romeo F1 livery revealed"),
+            make_item("Renault F1 engine update"),
+        ]
+        news_filter = NewsFilter()
+        
+        assert news_filter.filter_by_team(items, "sauber") == [items[2]]
+        assert news_filter.filter_by_team(items, "alpine") == [items[3]]
+    
+    def test_filter_by_keyword(self, make_item):
+        """Test keyword filter is accent-insensitive."""
+        items = [make_item("Safety car at São Paulo"), make_item("Monaco preview")]
+        
+        assert NewsFilter().filter_by_keyword(items, "sao paulo") == [items[0]]
+    
+    def test_deduplicate_folded_titles(self, make_item):
+        """Test deduplication treats accent variants as the same title."""
+        items = [make_item("Pérez on pole"), make_item("perez on pole "), make_item("Other")]
+        
+        assert NewsFilter().deduplicate(items) == [items[0], items[2]]
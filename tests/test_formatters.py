@@ -1,9 +1,11 @@
 """Tests for F1 News CLI formatters."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
-from f1_news.formatters import TerminalFormatter, JSONFormatter, ResultFormatter, extract_keywords
+from f1_news.formatters import (TerminalFormatter, PlainFormatter, JSONFormatter, NDJSONFormatter,
+                                ResultFormatter, ResultJSONFormatter, extract_keywords)
 from f1_news.models import NewsItem, RaceResult, RaceResults
 
 
@@ -68,6 +70,56 @@ class TestTerminalFormatter:
         
         # Should print table and panel
         assert mock_print.call_count >= 2
+    
+    @patch('f1_news.formatters.console.print')
+    def test_format_news_progressive(self, mock_print):
+        """Test each panel is printed before the next item is pulled."""
+        prints_before_pull = []
+        
+        def stream():
+            for i in range(3):
+                prints_before_pull.append(mock_print.call_count)
+                yield NewsItem(title=f"News {i}", content="", url="https://example.com", source="test")
+        
+        TerminalFormatter().format_news(stream())
+        
+        assert prints_before_pull[0] == 0
+        assert prints_before_pull[1] > prints_before_pull[0] + 1
+        assert prints_before_pull[2] > prints_before_pull[1]
+    
+    @patch('f1_news.formatters.console.print')
+    def test_format_news_escapes_markup(self, mock_print):
+        """Test titles that look like Rich markup are printed literally."""
+        item = NewsItem(title="[red flag] drama", content="", url="https://example.com", source="test")
+        
+        TerminalFormatter().format_news([item])
+        
+        panels = [call[0][0] for call in mock_print.call_args_list if hasattr(call[0][0], 'renderable')]
+        assert "\\[red flag] drama" in panels[0].renderable
+
+
+class TestPlainFormatter:
+    """Tests for the plain-text formatter."""
+    
+    @patch('builtins.print')
+    def test_format_news_plain(self, mock_print):
+        """Test plain output contains the item details without markup."""
+        item = NewsItem(title="Test News", content="<p>Body</p>", url="https://example.com",
+                        source="test", timestamp=datetime(2024, 1, 1, 12, 0))
+        
+        PlainFormatter().format_news([item])
+        
+        text = mock_print.call_args[0][0]
+        assert text.startswith("1. Test News\n   2024-01-01 12:00 | test")
+        assert "Body" in text
+        assert "https://example.com" in text
+    
+    @patch('builtins.print')
+    def test_format_news_plain_empty(self, mock_print):
+        """Test plain output for an empty stream."""
+        PlainFormatter().format_news([])
+        
+        assert "No news items found" in mock_print.call_args[0][0]
 
 
 class TestJSONFormatter:
@@ -183,4 +235,80 @@ class TestResultFormatter:
                 table_printed = True
                 break
         
-        assert table_printed
\ No newline at end of file
+        assert table_printed
+    
+    @patch('f1_news.formatters.console.print')
+    def test_qualifying_gaps_from_numeric_times(self, mock_print):
+        """Test qualifying gaps are computed from numeric lap times."""
+        race_results = RaceResults(
+            race_name="Test Qualifying",
+            date=datetime(2024, 1, 1),
+            circuit="Test Circuit",
+            results=[
+                RaceResult(1, "Driver 1", "Team 1", fastest_lap_time=75.5, segment_times=[77.0, 76.0, 75.5]),
+                RaceResult(2, "Driver 2", "Team 2", fastest_lap_time=75.75, segment_times=[77.1, 76.1, 75.75]),
+                RaceResult(3, "Driver 3", "Team 3", segment_times=[None, None, None]),
+            ]
+        )
+        
+        ResultFormatter().format_results(race_results)
+        
+        table = next(call[0][0] for call in mock_print.call_args_list if 'Table' in str(call[0][0].__class__))
+        assert list(table.columns[3].cells) == ["[purple]1:15.500[/purple]", "1:15.750", "No time"]
+        assert list(table.columns[4].cells) == ["Pole", "+0.250s", ""]
+
+
+class TestResultJSONFormatter:
+    """Tests for the result JSON formatter."""
+    
+    @patch('builtins.print')
+    def test_format_results_numeric(self, mock_print):
+        """Test JSON results carry times as seconds."""
+        race_results = RaceResults(
+            race_name="Test Grand Prix",
+            date=datetime(2024, 1, 1),
+            circuit="Test Circuit",
+            results=[
+                RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5400.0, fastest_lap_time=90.5),
+                RaceResult(2, "Driver 2", "Team 2", "DNF", 0),
+            ]
+        )
+        
+        ResultJSONFormatter().format_results(race_results)
+        
+        data = json.loads(mock_print.call_args[0][0])
+        assert data["results"][0]["total_time"] == 5400.0
+        assert data["results"][0]["fastest_lap_time"] == 90.5
+        assert data["results"][1]["status"] == "DNF"
+
+
+class TestNDJSONFormatter:
+    """Tests for NDJSON formatter."""
+    
+    @patch('builtins.print')
+    def test_format_news_one_line_per_item(self, mock_print):
+        """Test each item is written as its own compact JSON line."""
+        news_items = [
+            NewsItem(title=f"News {i}", content="<p>Body</p>", url=f"https://example.com/{i}", source="test")
+            for i in range(3)
+        ]
+        
+        NDJSONFormatter().format_news(news_items)
+        
+        assert mock_print.call_count == 3
+        first = json.loads(mock_print.call_args_list[0][0][0])
+        assert first["title"] == "News 0"
+        assert first["content"] == "Body"
+        assert "keywords" in first
+    
+    @patch('f1_news.formatters.KeywordExtractor')
+    @patch('builtins.print')
+    def test_field_projection_skips_keywords(self, mock_print, mock_extractor):
+        """Test projected output only contains the requested fields."""
+        item = NewsItem(title="News", content="Body", url="https://example.com", source="test",
+                        timestamp=datetime(2024, 1, 1))
+        
+        NDJSONFormatter(fields=["title", "timestamp"]).format_news([item])
+        
+        assert json.loads(mock_print.call_args[0][0]) == {"title": "News", "timestamp": "2024-01-01T00:00:00"}
+        mock_extractor.assert_not_called()
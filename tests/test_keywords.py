@@ -0,0 +1,86 @@
+"""Tests for F1 News CLI keyword extraction."""
+
+import pytest
+from unittest.mock import patch
+from f1_news.keywords import KeywordExtractor, StreamingKeywordExtractor
+
+
+class TestKeywordExtractor:
+    """Tests for the batch keyword extractor."""
+    
+    def test_multi_word_phrases(self):
+        """Test multi-word vocabulary entries are matched as phrases."""
+        keywords = KeywordExtractor().extract_text("Safety car out as Red Bull pit; virtual safety car later")
+        
+        assert keywords[:3] == ["safety car", "red bull", "virtual safety car"]
+    
+    def test_phrase_with_punctuation(self):
+        """Test phrases match across punctuation and accents."""
+        keywords = KeywordExtractor().extract_text("Red-Bull's Pérez takes pole")
+        
+        assert "red bull" in keywords
+        assert "perez" in keywords
+    
+    def test_tf_idf_fallback(self, make_item):
+        """Test fallback terms prefer words that are distinctive in the batch."""
+        items = [
+            make_item("Monaco preview", "Monaco harbour crowds expected"),
+            make_item("Silverstone preview", "Silverstone crowds expected"),
+            make_item("Suzuka preview", "Suzuka crowds expected"),
+        ]
+        extractor = KeywordExtractor(items)
+        
+        assert extractor.extract(items[0], 1) == ["monaco"]
+        assert extractor.extract(items[1], 1) == ["silverstone"]
+    
+    def test_vocabulary_before_fallback(self, make_item):
+        """Test vocabulary phrases come before fallback terms."""
+        item = make_item("Marvellous overtake", "Norris passes for the podium")
+        
+        assert KeywordExtractor([item]).extract(item, 3)[:2] == ["norris", "podium"]
+    
+    def test_extract_memoized_per_item(self, make_item):
+        """Test each item is analyzed only once."""
+        item = make_item("Ferrari news")
+        extractor = KeywordExtractor([item])
+        
+        with patch('f1_news.keywords._analyze') as mock_analyze:
+            first = extractor.extract(item)
+            second = extractor.extract(item)
+        
+        mock_analyze.assert_not_called()
+        assert first is second
+    
+    def test_cache_is_bounded(self, make_item):
+        """Test a long-lived extractor only keeps the most recently used items."""
+        items = [make_item(f"Story {i}") for i in range(10)]
+        extractor = KeywordExtractor(items, cache_size=3)
+        for item in items:
+            extractor.extract(item)
+        
+        assert len(extractor._analyses) == 3
+        assert extractor.extract(items[0]) == ["story"]
+    
+    def test_fit_rescores_memoized_keywords(self, make_item):
+        """Test keywords memoized before a fit are scored again with the new statistics."""
+        item = make_item("Monaco preview", "Monaco harbour crowds")
+        extractor = KeywordExtractor([item])
+        extractor.extract(item, 1)
+        
+        extractor.fit([make_item("Monaco again", "Monaco Monaco")] * 5)
+        
+        assert extractor.extract(item, 1) == ["preview"]
+
+
+class TestStreamingKeywordExtractor:
+    """Tests for scoring keywords while items stream in."""
+    
+    def test_scored_against_items_so_far(self, make_item):
+        """Test fallback terms are ranked by TF-IDF over the items already seen."""
+        extractor = StreamingKeywordExtractor()
+        for venue in ["Monaco", "Silverstone", "Monza", "Spa"]:
+            extractor.extract(make_item(f"{venue} crowds"))
+        item = make_item("Suzuka crowds", "crowds")
+        
+        assert KeywordExtractor().extract(item, 1) == ["crowds"]
+        assert extractor.extract(item, 1) == ["suzuka"]
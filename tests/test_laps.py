@@ -0,0 +1,94 @@
+"""Tests for the columnar lap table."""
+
+import numpy as np
+import pytest
+from f1_news.laps import LapTable
+
+
+def make_laps():
+    """Two drivers over 20 laps with one stop on lap 11 and linear tyre wear."""
+    laps = []
+    for driver, base, wear in [(1, 90.0, 0.1), (44, 90.5, 0.05)]:
+        for lap in range(1, 21):
+            duration = base + wear * ((lap - 1) % 10)
+            if lap == 1:
+                duration += 5
+            if lap == 11:
+                duration += 20
+            laps.append({
+                'driver_number': driver,
+                'lap_number': lap,
+                'lap_duration': duration,
+                'duration_sector_1': duration / 3,
+                'is_pit_out_lap': lap == 11,
+            })
+    return laps
+
+
+class TestLapTable:
+    """Tests for LapTable."""
+    
+    def test_from_laps_sorts_by_driver_and_lap(self):
+        """Test rows are grouped by driver regardless of payload order."""
+        table = LapTable.from_laps(list(reversed(make_laps())))
+        
+        assert len(table) == 40
+        assert list(table.drivers) == [1, 44]
+        assert list(table.lap_number[:3]) == [1, 2, 3]
+        assert np.isnan(table.sector_2).all()
+    
+    def test_fastest_and_total_times(self):
+        """Test fastest laps skip missing times and totals sum every timed lap."""
+        laps = make_laps() + [{'driver_number': 16, 'lap_number': 1, 'lap_duration': None}]
+        table = LapTable.from_laps(laps)
+        
+        fastest = table.fastest_laps()
+        totals = table.total_times()
+        
+        assert fastest == pytest.approx({1: 90.1, 44: 90.55})
+        assert totals[1] == pytest.approx(sum(lap['lap_duration'] for lap in make_laps()[:20]))
+        assert 16 not in fastest and 16 not in totals
+    
+    def test_median_pace_excludes_opening_and_pit_laps(self):
+        """Test median pace ignores the opening lap and pit-out laps."""
+        table = LapTable.from_laps(make_laps())
+        
+        assert table.median_pace() == pytest.approx({1: 90.5, 44: 90.75})
+    
+    def test_stints_and_degradation(self):
+        """Test stints split at pit-out laps with the per-lap wear as slope."""
+        table = LapTable.from_laps(make_laps())
+        
+        stints = table.stints()
+        
+        assert [(s.driver_number, s.stint, s.first_lap, s.last_lap) for s in stints] == [
+            (1, 1, 1, 10), (1, 2, 11, 20), (44, 1, 1, 10), (44, 2, 11, 20)
+        ]
+        assert stints[0].degradation == pytest.approx(0.1)
+        assert table.degradation() == pytest.approx({1: 0.1, 44: 0.05})
+    
+    def test_pit_lane_start_is_one_stint(self):
+        """Test a pit-out on the first lap does not open a new stint."""
+        laps = [{'driver_number': 1, 'lap_number': n, 'lap_duration': 90.0, 'is_pit_out_lap': n == 1}
+                for n in range(1, 4)]
+        
+        assert list(LapTable.from_laps(laps).stint_numbers()) == [1, 1, 1]
+    
+    def test_gap_evolution(self):
+        """Test gaps to the leader accumulate lap by lap."""
+        table = LapTable.from_laps(make_laps())
+        
+        gaps = table.gap_evolution()
+        
+        assert gaps.shape == (2, 20)
+        assert gaps[0, :3] == pytest.approx([0, 0, 0])
+        assert gaps[1, :3] == pytest.approx([0.5, 0.95, 1.35])
+    
+    def test_empty_table(self):
+        """Test an empty payload gives empty analytics."""
+        table = LapTable.from_laps([])
+        
+        assert table.fastest_laps() == {}
+        assert table.total_times() == {}
+        assert table.stints() == []
+        assert table.gap_evolution().shape == (0, 0)
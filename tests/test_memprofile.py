@@ -0,0 +1,107 @@
+"""Tests for the memory profiling mode."""
+
+import tracemalloc
+import pytest
+import requests  # noqa: F401 - imported while tracing, the lazy imports would take seconds
+import rich.table  # noqa: F401
+from click.testing import CliRunner
+from f1_news import laps, memprofile  # noqa: F401
+from f1_news.cli import main
+from f1_news.sources import RaceResultSource
+from f1_news.synthetic import FakeOpenF1, openf1_session
+
+
+@pytest.fixture
+def profiler():
+    profiler = memprofile.enable()
+    yield profiler
+    memprofile.disable()
+
+
+class TestMemoryProfiler:
+    """Tests for checkpoints and what they record."""
+
+    def test_disabled_checkpoints_do_nothing(self):
+        """Test checkpoints and wrapped streams are pass-throughs while profiling is off."""
+        stream = iter([1, 2])
+
+        assert memprofile.checkpoint_after('stage', stream) is stream
+        memprofile.checkpoint('stage')
+        assert not tracemalloc.is_tracing()
+
+    def test_stage_growth_and_sites(self, profiler):
+        """Test a stage records its growth, peak and the line that allocated."""
+        memprofile.checkpoint('start')
+        kept = [bytes(1024) for _ in range(1000)]
+        memprofile.checkpoint('allocate')
+
+        stage = profiler.stages[-1]
+
+        assert stage.name == 'allocate'
+        assert stage.growth >= 1000 * 1024
+        assert stage.peak >= stage.current
+        assert stage.top_sites[0].location.startswith('tests/test_memprofile.py:')
+        assert stage.top_sites[0].count >= 1000
+        del kept
+
+    def test_peak_between_checkpoints(self, profiler):
+        """Test memory freed within a stage still shows in its peak but not its growth."""
+        memprofile.checkpoint('start')
+        temporary = bytes(10 * 1024 * 1024)
+        del temporary
+        memprofile.checkpoint('spike')
+
+        stage = profiler.stages[-1]
+
+        assert stage.peak >= 10 * 1024 * 1024
+        assert stage.growth < 1024 * 1024
+        assert profiler.peak >= stage.peak
+
+    def test_peaks_without_reset_peak(self, monkeypatch):
+        """Test stage peaks stay separate on Pythons whose tracemalloc cannot reset the peak."""
+        monkeypatch.delattr(tracemalloc, 'reset_peak')
+        profiler = memprofile.enable()
+        try:
+            memprofile.checkpoint('start')
+            temporary = bytes(10 * 1024 * 1024)
+            del temporary
+            memprofile.checkpoint('spike')
+            memprofile.checkpoint('quiet')
+        finally:
+            memprofile.disable()
+
+        spike, quiet = profiler.stages[-2:]
+
+        assert spike.peak >= 10 * 1024 * 1024
+        assert quiet.peak < 10 * 1024 * 1024
+        assert quiet.peak >= quiet.current
+
+    def test_checkpoint_after_stream(self, profiler):
+        """Test a wrapped stream checkpoints once it has been read to the end."""
+        stream = memprofile.checkpoint_after('read', iter([1, 2]))
+
+        assert next(stream) == 1
+        assert profiler.stages == []
+        assert list(stream) == [2]
+        assert [stage.name for stage in profiler.stages] == ['read']
+
+    def test_openf1_decode_stages(self, profiler):
+        """Test each OpenF1 payload decode and the lap table build are stages."""
+        RaceResultSource(FakeOpenF1(openf1_session(drivers=4, laps=10))).fetch_latest_results('race')
+
+        assert [stage.name for stage in profiler.stages] == [
+            'decode_sessions', 'decode_position', 'decode_drivers', 'decode_laps', 'build_lap_table']
+
+    def test_memprofile_option(self, monkeypatch):
+        """Test --memprofile reports every stage of a results run and stops tracing afterwards."""
+        http = FakeOpenF1(openf1_session(drivers=4, laps=10))
+        monkeypatch.setenv('F1_NEWS_NO_DAEMON', '1')
+        monkeypatch.setattr('f1_news.cli.RaceResultSource', lambda **kwargs: RaceResultSource(http, **kwargs))
+
+        result = CliRunner().invoke(main, ['--memprofile', 'result', '--format', 'json'])
+
+        assert result.exit_code == 0
+        assert 'Memory (peak' in result.stderr
+        for stage in ('decode_laps', 'build_results', 'format'):
+            assert stage in result.stderr
+        assert not tracemalloc.is_tracing()
@@ -0,0 +1,167 @@
+"""Tests for the OpenMetrics registry and what the sources record in it."""
+
+import urllib.request
+import pytest
+from unittest.mock import Mock
+from click.testing import CliRunner
+from f1_news import metrics
+from f1_news.cache import Cache
+from f1_news.cli import main
+from f1_news.metrics import Registry, serve_metrics
+from f1_news.sources import RaceResultSource, RSSSource
+from f1_news.standin import StandinServer, SyntheticUpstream
+
+
+class MissingFeedUpstream(SyntheticUpstream):
+    def respond(self, url):
+        return None if url.endswith('/missing') else super().respond(url)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    metrics.REGISTRY.clear()
+    yield
+    metrics.REGISTRY.clear()
+
+
+class TestRegistry:
+    """Tests for rendering counters and histograms."""
+
+    def test_render(self):
+        """Test samples follow the OpenMetrics text format."""
+        registry = Registry()
+        requests = registry.counter('app_requests', "Requests served", ('path',))
+        latency = registry.histogram('app_seconds', "Latency", buckets=(0.1, 1.0))
+        requests.inc(path='/a')
+        requests.inc(2, path='/b "quoted"')
+        latency.observe(0.05)
+        latency.observe(0.5)
+
+        assert registry.render() == (
+            '# TYPE app_requests counter\n'
+            '# HELP app_requests Requests served\n'
+            'app_requests_total{path="/a"} 1\n'
+            'app_requests_total{path="/b \\"quoted\\""} 2\n'
+            '# TYPE app_seconds histogram\n'
+            '# HELP app_seconds Latency\n'
+            'app_seconds_bucket{le="0.1"} 1\n'
+            'app_seconds_bucket{le="1.0"} 2\n'
+            'app_seconds_bucket{le="+Inf"} 2\n'
+            'app_seconds_count 2\n'
+            'app_seconds_sum 0.55\n'
+            '# EOF\n'
+        )
+
+    def test_labels_must_match(self):
+        """Test a sample with the wrong label names is refused."""
+        counter = Registry().counter('app_requests', "Requests", ('path',))
+
+        with pytest.raises(ValueError):
+            counter.inc(method='GET')
+
+    def test_register_twice(self):
+        """Test registering a name again returns the same metric, unless it differs."""
+        registry = Registry()
+        counter = registry.counter('app_requests', "Requests")
+
+        assert registry.counter('app_requests', "Requests") is counter
+        with pytest.raises(ValueError):
+            registry.histogram('app_requests', "Requests")
+
+    def test_write_textfile(self, tmp_path):
+        """Test the textfile is replaced whole and leaves no temporary file behind."""
+        registry = Registry()
+        registry.counter('app_runs', "Runs").inc()
+        path = tmp_path / 'f1_news.prom'
+
+        registry.write_textfile(path)
+
+        assert path.read_text() == registry.render()
+        assert [p.name for p in tmp_path.iterdir()] == ['f1_news.prom']
+
+    def test_http_endpoint(self):
+        """Test /metrics serves the registry with the OpenMetrics content type."""
+        registry = Registry()
+        registry.counter('app_runs', "Runs").inc()
+        server = serve_metrics(0, registry=registry)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+                assert response.headers['Content-Type'] == metrics.CONTENT_TYPE
+                assert response.read().decode() == registry.render()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestInstrumentation:
+    """Tests for the counters the cache and sources update."""
+
+    def test_cache_outcomes(self, tmp_path):
+        """Test cache reads are counted as hits, misses and expiries."""
+        cache = Cache(tmp_path)
+        cache.get('openf1_x')
+        cache.set('openf1_x', 1)
+        cache.get('openf1_x')
+        cache.get('openf1_x', max_age=-1)
+
+        for result in ('hit', 'miss', 'expired'):
+            assert metrics.CACHE_LOOKUPS.value(cache='openf1', result=result) == 1
+
+    def test_feed_fetches(self, monkeypatch):
+        """Test each feed download records its latency and size, and failures are counted."""
+        server = StandinServer(MissingFeedUpstream(entries=3))
+        server.start()
+        try:
+            monkeypatch.setenv('F1NEWS_STANDIN', server.url)
+            source = RSSSource()
+            source.rss_feeds['broken'] = 'https://example.invalid/missing'
+            source.source_names['broken'] = 'Broken'
+            source.fetch_news(limit=10)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert metrics.FEED_FETCH_SECONDS.count(source='autosport') == 1
+        assert metrics.FEED_BYTES.value(source='autosport') > 0
+        assert metrics.FEED_ERRORS.value(source='autosport') == 0
+        assert metrics.FEED_ERRORS.value(source='broken') == 1
+
+    def test_openf1_requests(self, monkeypatch):
+        """Test OpenF1 requests are counted by endpoint and status."""
+        server = StandinServer(SyntheticUpstream(entries=3, drivers=3, laps=5))
+        server.start()
+        try:
+            monkeypatch.setenv('F1NEWS_STANDIN', server.url)
+            RaceResultSource().fetch_latest_results('race')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert metrics.OPENF1_REQUESTS.value(endpoint='laps', status=200) == 1
+        assert metrics.OPENF1_SECONDS.count(endpoint='position') == 1
+        assert metrics.OPENF1_BYTES.value(endpoint='drivers') > 0
+        assert metrics.RESULTS_FALLBACKS.value(session_type='race') == 0
+
+    def test_fallback_to_mock(self):
+        """Test failed requests and the resulting mock results are counted."""
+        http = Mock()
+        http.get.side_effect = ConnectionError("offline")
+
+        results = RaceResultSource(http).fetch_latest_results('race')
+
+        assert "Mock" in results.race_name
+        assert metrics.OPENF1_REQUESTS.value(endpoint='sessions', status='error') == 1
+        assert metrics.RESULTS_FALLBACKS.value(session_type='race') == 1
+
+    def test_metrics_file_option(self, tmp_path, monkeypatch):
+        """Test --metrics-file writes the run's metrics when the command finishes."""
+        path = tmp_path / 'run.prom'
+        http = Mock()
+        http.get.side_effect = ConnectionError("offline")
+
+        monkeypatch.setattr('f1_news.cli.RaceResultSource', lambda **kwargs: RaceResultSource(http, **kwargs))
+        result = CliRunner().invoke(main, ['--metrics-file', str(path), 'result'])
+
+        assert result.exit_code == 0
+        assert 'f1news_results_fallbacks_total{session_type="race"} 1\n' in path.read_text()
+        assert path.read_text().endswith('# EOF\n')
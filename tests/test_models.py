@@ -2,7 +2,8 @@
 
 import pytest
 from datetime import datetime
-from f1_news.models import NewsItem, RaceResult, RaceResults
+import dataclasses
+from f1_news.models import NewsBatch, NewsItem, RaceResult, RaceResults
 
 
 class TestNewsItem:
@@ -21,7 +22,7 @@ class TestNewsItem:
         assert item.content == "This is test content"
         assert item.url == "https://example.com"
         assert item.source == "test"
-        assert item.tags == []
+        assert item.tags == ()
     
     def test_news_item_with_optional_fields(self):
         """Test NewsItem with optional fields."""
@@ -38,7 +39,82 @@ class TestNewsItem:
         
         assert item.author == "Test Author"
         assert item.timestamp == timestamp
-        assert item.tags == ["F1", "Racing"]
+        assert item.tags == ("F1", "Racing")
+    
+    def test_news_item_folded_text(self):
+        """Test folded text is accent-free and computed once."""
+        item = NewsItem(
+            title="Pérez",
+            content="Hülkenberg",
+            url="https://example.com",
+            source="test"
+        )
+        
+        assert item.folded_title == "perez"
+        assert item.folded_text == "perez\nhulkenberg"
+        assert item.folded_text is item.folded_text
+    
+    def test_news_item_text_strips_html(self):
+        """Test plain-text content drops tags and decodes entities once."""
+        item = NewsItem(
+            title="Test",
+            content='<p>Leclerc &amp; Sainz</p><p>on the <a href="https://ferrari.com">front row</a>'
+                    '</p><script>var x = 1;</script>',
+            url="https://example.com",
+            source="test"
+        )
+        
+        assert item.text == "Leclerc & Sainz on the front row"
+        assert item.text is item.text
+        assert "ferrari" not in item.folded_text
+    
+    def test_news_item_text_plain_content(self):
+        """Test plain content only has its whitespace collapsed."""
+        item = NewsItem(title="Test", content="  Plain\n text ", url="https://example.com", source="test")
+        
+        assert item.text == "Plain text"
+    
+    def test_news_item_is_frozen(self):
+        """Test items are immutable but still cache derived text."""
+        item = NewsItem(title="Test", content="<b>Body</b>", url="https://example.com", source="test")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.title = "Changed"
+        assert item.text == "Body"
+    
+    def test_news_item_interns_source(self):
+        """Test items from the same source share one source string."""
+        source = "".join(["Auto", "sport"])
+        first = NewsItem(title="A", content="", url="https://example.com/a", source=source)
+        second = NewsItem(title="B", content="", url="https://example.com/b", source="Autosport")
+        
+        assert first.source is second.source
+    
+    @pytest.mark.skipif(not hasattr(NewsItem, "__slots__"), reason="slotted dataclasses need Python 3.10+")
+    def test_news_item_has_no_dict(self):
+        """Test slotted items carry no per-instance __dict__."""
+        item = NewsItem(title="Test", content="", url="https://example.com", source="test")
+        
+        assert not hasattr(item, "__dict__")
+
+
+class TestNewsBatch:
+    """Tests for the tuple-backed news batch."""
+    
+    def test_batch_round_trip(self):
+        """Test items read back from a batch equal the originals."""
+        items = [
+            NewsItem(title=f"News {i}", content="Body", url=f"https://example.com/{i}", source="test",
+                     timestamp=datetime(2024, 1, i + 1), tags=["f1"])
+            for i in range(3)
+        ]
+        
+        batch = NewsBatch(items)
+        
+        assert len(batch) == 3
+        assert batch[1] == items[1]
+        assert list(batch) == items
+        assert batch.tags[0] == ("f1",)
 
 
 class TestRaceResult:
@@ -73,6 +149,36 @@ class TestRaceResult:
         )
         
         assert result.fastest_lap == ""
+    
+    def test_race_result_parses_legacy_strings(self):
+        """Test display strings given without numbers are parsed once into seconds."""
+        leader = RaceResult(1, "Driver 1", "Team 1", "1:32:28.851", 25, "1:45.123")
+        chaser = RaceResult(2, "Driver 2", "Team 2", "+1:13.715", 18)
+        
+        assert leader.total_time == pytest.approx(5548.851)
+        assert leader.gap is None
+        assert leader.fastest_lap_time == pytest.approx(105.123)
+        assert chaser.gap == pytest.approx(73.715)
+        assert chaser.total_time is None
+    
+    def test_race_result_numeric_display(self):
+        """Test numeric times are formatted only for display."""
+        leader = RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5548.851, fastest_lap_time=105.1234)
+        chaser = RaceResult(2, "Driver 2", "Team 2", points=18, total_time=5571.747, gap=22.896)
+        lapped = RaceResult(3, "Driver 3", "Team 3", points=15, total_time=5620.0, gap=71.149)
+        
+        assert leader.time_display == "1:32:28.851"
+        assert leader.fastest_lap_display == "1:45.123"
+        assert chaser.time_display == "+22.896"
+        assert lapped.time_display == "+1:11.149"
+    
+    def test_race_result_status_string(self):
+        """Test non-time strings are kept for display and not parsed."""
+        result = RaceResult(20, "Driver", "Team", "DNF", 0)
+        
+        assert result.total_time is None
+        assert result.gap is None
+        assert result.time_display == "DNF"
 
 
 class TestRaceResults:
@@ -0,0 +1,150 @@
+"""Tests for the adaptive prefetch scheduler."""
+
+import pytest
+from unittest.mock import Mock, patch
+from f1_news.cache import Cache
+from f1_news.prefetch import (BACKOFF, DEFAULT_INTERVAL, MAX_INTERVAL, MIN_INTERVAL, FeedCache, FeedSchedule,
+                              PrefetchScheduler)
+from f1_news.sources import RSSSource
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0" xmlns:sy="http://purl.org/rss/1.0/modules/syndication/">
+<channel><title>Test</title><ttl>{ttl}</ttl>
+<sy:updatePeriod>hourly</sy:updatePeriod><sy:updateFrequency>2</sy:updateFrequency>
+<item><title>{title}</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+
+
+def make_response(status_code=200, text="", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.content = text.encode()
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def feed_cache(tmp_path):
+    return FeedCache(Cache(tmp_path))
+
+
+class TestFeedSchedule:
+    """Tests for FeedSchedule."""
+
+    def test_change_pulls_interval_towards_observed(self):
+        """Test the interval moves towards the time between changes."""
+        schedule = FeedSchedule(interval=1000)
+        schedule.record_change(0)
+        schedule.record_change(400)
+
+        assert 400 < schedule.interval < 1000
+
+    def test_unchanged_backs_off_within_bounds(self):
+        """Test polls finding nothing new lengthen the interval up to the maximum."""
+        schedule = FeedSchedule()
+        schedule.record_unchanged()
+
+        assert schedule.interval == DEFAULT_INTERVAL * BACKOFF
+
+        for _ in range(50):
+            schedule.record_unchanged()
+
+        assert schedule.interval == MAX_INTERVAL
+
+    def test_hints(self):
+        """Test ttl bounds the interval and sy:updatePeriod seeds it."""
+        schedule = FeedSchedule()
+        schedule.apply_hints({'ttl': '60', 'sy_updateperiod': 'hourly', 'sy_updatefrequency': '2'})
+
+        assert schedule.min_interval == 3600
+        assert schedule.interval == 3600
+
+        schedule = FeedSchedule()
+        schedule.apply_hints({'sy_updateperiod': 'hourly', 'sy_updatefrequency': '2'})
+
+        assert schedule.interval == 1800
+        assert schedule.min_interval == MIN_INTERVAL
+
+
+class TestPrefetchScheduler:
+    """Tests for PrefetchScheduler."""
+
+    def test_poll_caches_feed_and_sends_validators(self, feed_cache):
+        """Test a poll stores the feed and the next poll is conditional."""
+        http = Mock()
+        http.get.return_value = make_response(text=FEED.format(ttl=5, title="News"), headers={'ETag': '"abc"'})
+        scheduler = PrefetchScheduler(RSSSource(), feed_cache, http)
+
+        assert scheduler.poll('autosport', now=1000) is True
+        assert 'News' in feed_cache.get('autosport')
+        assert scheduler.schedules['autosport'].next_due == 1000 + scheduler.schedules['autosport'].interval
+
+        http.get.return_value = make_response(304)
+        interval = scheduler.schedules['autosport'].interval
+
+        assert scheduler.poll('autosport', now=2000) is False
+        assert http.get.call_args[1]['headers'] == {'If-None-Match': '"abc"'}
+        assert scheduler.schedules['autosport'].interval == interval * BACKOFF
+
+    def test_poll_without_cached_body_is_unconditional(self, feed_cache):
+        """Test validators are dropped when the cache no longer holds the feed they describe."""
+        http = Mock()
+        http.get.return_value = make_response(text=FEED.format(ttl=5, title="News"),
+                                              headers={'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        scheduler = PrefetchScheduler(RSSSource(), feed_cache, http)
+        scheduler.poll('autosport', now=1000)
+        feed_cache.cache.clear()
+
+        scheduler.poll('autosport', now=2000)
+
+        assert http.get.call_args[1]['headers'] == {}
+        assert 'News' in feed_cache.get('autosport')
+
+    def test_run_once_polls_due_feeds_and_persists(self, feed_cache):
+        """Test only due feeds are polled and learned schedules survive a restart."""
+        http = Mock()
+        http.get.return_value = make_response(text=FEED.format(ttl=5, title="News"))
+        scheduler = PrefetchScheduler(RSSSource(), feed_cache, http)
+
+        changed = scheduler.run_once()
+
+        assert set(changed) == set(RSSSource().rss_feeds)
+        assert scheduler.run_once() == {}
+
+        restarted = PrefetchScheduler(RSSSource(), feed_cache, http)
+
+        assert restarted.schedules == scheduler.schedules
+
+    def test_failed_poll_is_retried_later(self, feed_cache):
+        """Test a failing feed does not stop the others and is retried after the minimum interval."""
+        http = Mock()
+        http.get.side_effect = Exception("boom")
+        scheduler = PrefetchScheduler(RSSSource(), feed_cache, http)
+
+        assert scheduler.run_once() == {}
+        assert scheduler.due() == []
+
+
+class TestFeedCache:
+    """Tests for serving feeds from the prefetch cache."""
+
+    def test_entry_expires_with_its_interval(self, feed_cache):
+        """Test a cached feed is only served within its interval."""
+        feed_cache.put('autosport', 'content', max_age=60)
+
+        assert feed_cache.get('autosport') == 'content'
+
+        with patch('f1_news.prefetch.time.time', return_value=10 ** 10):
+            assert feed_cache.get('autosport') is None
+
+    def test_rss_source_reads_cache(self, feed_cache):
+        """Test RSSSource parses a warm cached feed instead of downloading it."""
+        feed_cache.put('autosport', FEED.format(ttl=5, title="Cached headline"), max_age=600)
+        source = RSSSource(feed_cache=feed_cache)
+
+        with patch('feedparser.parse', wraps=__import__('feedparser').parse) as parse:
+            feed = source._download_feed('autosport')
+
+        assert feed.entries[0].title == "Cached headline"
+        assert parse.call_args[0][0].startswith('<?xml')
@@ -0,0 +1,49 @@
+"""Tests for F1 News CLI relevance ranking."""
+
+from f1_news.ranking import BM25Ranker, tokenize
+
+
+class TestBM25Ranker:
+    """Tests for BM25 ranking."""
+
+    def test_tokenize(self):
+        """Test tokenizing text into lowercase words."""
+        assert tokenize("Red Bull's RB20!") == ["red", "bull", "s", "rb20"]
+
+    def test_focused_article_ranks_first(self, make_item):
+        """Test an article focused on the query outranks a passing mention."""
+        items = [
+            make_item("Hamilton wins in Silverstone", "Mercedes driver delighted, Ferrari fifth.", i=3),
+            make_item("Ferrari unveil upgrade", "Ferrari bring a new floor; Ferrari expect gains.", i=1),
+            make_item("Weather update", "Rain expected for qualifying.", i=2),
+        ]
+
+        ranked = BM25Ranker(items).top_k("ferrari", 2)
+
+        assert [item.title for item in ranked] == ["Ferrari unveil upgrade", "Hamilton wins in Silverstone"]
+
+    def test_title_boost(self, make_item):
+        """Test a title match outweighs the same match in content."""
+        items = [
+            make_item("Race report", "Norris takes the win", i=2),
+            make_item("Norris takes the win", "Race report", i=1),
+        ]
+
+        ranked = BM25Ranker(items).top_k("norris", 1)
+
+        assert ranked[0].title == "Norris takes the win"
+
+    def test_ties_broken_by_recency(self, make_item):
+        """Test equally relevant items are ordered newest first."""
+        items = [make_item("Update", "No match", i=hour) for hour in (1, 3, 2)]
+
+        ranked = BM25Ranker(items).top_k("ferrari", 3)
+
+        assert [item.timestamp.hour for item in ranked] == [3, 2, 1]
+
+    def test_top_k_limit(self, make_item):
+        """Test top_k returns at most k items."""
+        items = [make_item(f"Ferrari news {i}", "Ferrari", i=i) for i in range(1, 6)]
+
+        assert len(BM25Ranker(items).top_k("ferrari", 3)) == 3
+        assert BM25Ranker([]).top_k("ferrari", 3) == []
@@ -0,0 +1,131 @@
+"""Tests for incremental ingestion with a persisted seen-set."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from f1_news.cli import fetch
+from f1_news.models import NewsItem
+from f1_news.seen import SeenSet
+from f1_news.sources import RSSSource
+
+
+def make_feed(days, titles=None):
+    feed = Mock()
+    feed.entries = []
+    for day in days:
+        entry = Mock()
+        entry.title = (titles or {}).get(day, f"Day {day}")
+        entry.summary = ""
+        entry.link = f"https://example.com/{day}"
+        entry.published_parsed = (2024, 1, day, 12, 0, 0, 0, 1, 0)
+        feed.entries.append(entry)
+    return feed
+
+
+def make_source(days, titles=None):
+    source = RSSSource()
+    source.rss_feeds = {"a": "https://a.example/rss"}
+    source.source_names = {"a": "A"}
+    source._download_feed = lambda key: make_feed(days, titles)
+    return source
+
+
+class TestSeenSet:
+    """Tests for SeenSet."""
+
+    def test_persists_between_runs(self, tmp_path):
+        """Test URLs added and saved are known to the next run."""
+        seen = SeenSet(tmp_path / 'seen.bin')
+        seen.update(["https://example.com/1", "https://example.com/2"])
+        seen.save()
+
+        reloaded = SeenSet(tmp_path / 'seen.bin')
+
+        assert "https://example.com/1" in reloaded
+        assert "https://example.com/3" not in reloaded
+        assert (tmp_path / 'seen.bin').stat().st_size == 16
+
+    def test_capacity_evicts_oldest(self, tmp_path):
+        """Test the file never grows past capacity and forgets the oldest URLs first."""
+        seen = SeenSet(tmp_path / 'seen.bin', capacity=3)
+        seen.update(f"https://example.com/{i}" for i in range(5))
+        seen.save()
+
+        reloaded = SeenSet(tmp_path / 'seen.bin', capacity=3)
+
+        assert len(reloaded) == 3
+        assert "https://example.com/0" not in reloaded
+        assert "https://example.com/4" in reloaded
+
+    def test_unsaved_additions_are_not_persisted(self, tmp_path):
+        """Test a run that fails before saving delivers its entries again next time."""
+        seen = SeenSet(tmp_path / 'seen.bin')
+        seen.add("https://example.com/1")
+
+        assert "https://example.com/1" not in SeenSet(tmp_path / 'seen.bin')
+
+
+class TestIncrementalIngestion:
+    """Tests for skipping seen and old entries while parsing feeds."""
+
+    def test_seen_entries_never_become_news_items(self, tmp_path):
+        """Test entries in the seen-set are skipped before a NewsItem is built."""
+        seen = SeenSet(tmp_path / 'seen.bin')
+        seen.update(["https://example.com/5", "https://example.com/3"])
+        source = make_source([1, 5, 3])
+
+        with patch('f1_news.sources.NewsItem', wraps=NewsItem) as news_item:
+            titles = [item.title for item in source.iter_news(seen=seen)]
+
+        assert titles == ["Day 1"]
+        assert news_item.call_count == 1
+
+    def test_since_stops_at_older_entries(self):
+        """Test entries published before --since are skipped."""
+        source = make_source([1, 5, 3])
+
+        titles = [item.title for item in source.iter_news(since=datetime(2024, 1, 3))]
+
+        assert titles == ["Day 5", "Day 3"]
+
+
+class TestNewOnlyCommand:
+    """Tests for fetch --new-only."""
+
+    @patch('f1_news.cli.RSSSource')
+    def test_second_run_only_shows_new_entries(self, mock_rss_source):
+        """Test a repeated --new-only run delivers only entries it has not delivered before."""
+        mock_rss_source.return_value = make_source([1, 2])
+        runner = CliRunner()
+
+        first = runner.invoke(fetch, ['--new-only', '--format', 'ndjson'])
+        mock_rss_source.return_value = make_source([1, 2, 3])
+        second = runner.invoke(fetch, ['--new-only', '--format', 'ndjson'])
+        third = runner.invoke(fetch, ['--new-only', '--format', 'ndjson'])
+
+        assert len(first.stdout.splitlines()) == 2
+        assert len(second.stdout.splitlines()) == 1
+        assert 'Day 3' in second.stdout
+        assert third.stdout == ""
+        assert "No new news items" in third.stderr
+
+    @patch('f1_news.cli.RSSSource')
+    def test_only_delivered_entries_are_remembered(self, mock_rss_source):
+        """Test entries dropped by a filter or left out of a relevance-ranked page stay new."""
+        titles = {1: "Ferrari upgrade", 2: "Mercedes upgrade", 3: "Ferrari pace", 4: "Ferrari pit stop",
+                  5: "Mercedes pace", 6: "Ferrari strategy"}
+        mock_rss_source.return_value = make_source(range(1, 7), titles)
+        runner = CliRunner()
+
+        ferrari = runner.invoke(fetch, ['--new-only', '--team', 'ferrari', '--sort', 'relevance',
+                                        '--limit', '2', '--format', 'ndjson'])
+        remembered = len(SeenSet())
+        mercedes = runner.invoke(fetch, ['--new-only', '--team', 'mercedes', '--format', 'ndjson'])
+        rest = runner.invoke(fetch, ['--new-only', '--format', 'ndjson'])
+
+        assert len(ferrari.stdout.splitlines()) == 2
+        assert remembered == 2
+        assert len(mercedes.stdout.splitlines()) == 2
+        assert len(rest.stdout.splitlines()) == 2
+        assert all("Ferrari" in line for line in rest.stdout.splitlines())
@@ -0,0 +1,164 @@
+"""Tests for the local HTTP API."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+from f1_news.models import NewsItem, RaceResult, RaceResults
+from f1_news.server import EventHub, NewsHTTPServer
+from f1_news.service import NewsService
+
+
+def make_item(i):
+    return NewsItem(title=f"News {i}", content="Ferrari news", url=f"https://example.com/{i}", source="test",
+                    timestamp=datetime(2024, 1, 1, 12, i))
+
+
+def make_results(gap):
+    return RaceResults(
+        race_name="Test Grand Prix", date=datetime(2024, 1, 1), circuit="Test Circuit",
+        results=[RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5400.0),
+                 RaceResult(2, "Driver 2", "Team 2", points=18, total_time=5400.0 + gap, gap=gap)]
+    )
+
+
+@pytest.fixture
+def server():
+    """An API server on a free port over a service with mock sources."""
+    rss_source = Mock()
+    rss_source.iter_news.side_effect = lambda: iter([make_item(2), make_item(1)])
+    result_source = Mock()
+    result_source.fetch_latest_results.return_value = make_results(5.0)
+    service = NewsService(rss_source, result_source)
+    
+    server = NewsHTTPServer(service, ('127.0.0.1', 0), keepalive_interval=0.1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path, headers=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{server.server_address[1]}{path}", headers=headers or {})
+    return urllib.request.urlopen(request, timeout=5)
+
+
+class TestHTTPAPI:
+    """Tests for the JSON endpoints."""
+    
+    def test_news_endpoint(self, server):
+        """Test /news applies fetch/filter parameters."""
+        with get(server, "/news?limit=1&team=ferrari") as response:
+            data = json.loads(response.read())
+        
+        assert [item["title"] for item in data] == ["News 2"]
+    
+    def test_etag_not_modified(self, server):
+        """Test a matching If-None-Match gets 304 without a body."""
+        with get(server, "/results?session=race") as response:
+            etag = response.headers["ETag"]
+            assert json.loads(response.read())["results"][1]["gap"] == 5.0
+        
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get(server, "/results?session=race", {"If-None-Match": etag})
+        
+        assert error.value.code == 304
+    
+    def test_upstream_fetched_once_for_many_clients(self, server):
+        """Test repeated client requests do not reach the upstream sources again."""
+        for _ in range(5):
+            get(server, "/news").read()
+        
+        assert server.service.rss_source.iter_news.call_count == 1
+    
+    def test_bad_session(self, server):
+        """Test an unknown session type is rejected."""
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get(server, "/results?session=sprint-shootout")
+        
+        assert error.value.code == 400
+    
+    def test_upstream_error(self, server, capsys):
+        """Test an upstream failure gets a fixed reason phrase, an escaped body and a log line."""
+        server.service.rss_source.iter_news.side_effect = RuntimeError("<b>feed down</b>\r\nX-Injected: 1")
+        
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get(server, "/news")
+        
+        assert error.value.code == 502
+        assert error.value.reason == "Upstream error"
+        assert "X-Injected" not in error.value.headers
+        assert "&lt;b&gt;feed down&lt;/b&gt;" in error.value.read().decode()
+        assert "feed down" in capsys.readouterr().err
+
+    def test_metrics_endpoint(self, server):
+        """Test /metrics serves the process's metrics in OpenMetrics format."""
+        with get(server, "/metrics") as response:
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+            body = response.read().decode()
+
+        assert "# TYPE f1news_feed_fetch_seconds histogram" in body
+        assert body.endswith("# EOF\n")
+
+
+class TestEvents:
+    """Tests for Server-Sent Events."""
+    
+    def test_hub_publishes_only_new_items(self):
+        """Test a refresh publishes items whose URLs were not in the previous snapshot."""
+        hub = EventHub()
+        events = hub.subscribe()
+        
+        hub.on_refresh('news', None, [make_item(1)], [make_item(3), make_item(2), make_item(1)])
+        
+        published = [json.loads(events.get_nowait()[2])["title"] for _ in range(events.qsize())]
+        assert published == ["News 2", "News 3"]
+    
+    def test_hub_publishes_classification_changes(self):
+        """Test results events are sent only when the classification changes."""
+        hub = EventHub()
+        events = hub.subscribe()
+        
+        hub.on_refresh('results', 'race', make_results(5.0), make_results(5.0))
+        hub.on_refresh('results', 'race', make_results(5.0), make_results(3.0))
+        
+        assert events.qsize() == 1
+        assert events.get_nowait()[1] == 'results'
+    
+    def test_hub_ignores_fallback_results(self):
+        """Test placeholder results after an OpenF1 failure are not published as a change."""
+        hub = EventHub()
+        events = hub.subscribe()
+        fallback = make_results(3.0)
+        fallback.fallback = True
+        
+        hub.on_refresh('results', 'race', make_results(5.0), fallback)
+        
+        assert events.qsize() == 0
+    
+    def test_events_stream(self, server):
+        """Test a refresh is pushed to a connected SSE client."""
+        server.service.news()
+        response = get(server, "/events")
+        assert response.headers["Content-Type"] == "text/event-stream"
+        
+        server.service.rss_source.iter_news.side_effect = lambda: iter([make_item(3), make_item(2), make_item(1)])
+        server.service.refresh_news()
+        
+        lines = []
+        for _ in range(100):
+            line = response.readline().decode().rstrip("\n")
+            if line.startswith(":") or (not lines and not line):
+                continue  # keepalive comments
+            if not line:
+                break
+            lines.append(line)
+        response.close()
+        
+        assert lines[0].startswith("id: ")
+        assert lines[1] == "event: news"
+        assert json.loads(lines[2][len("data: "):])["title"] == "News 3"
@@ -0,0 +1,172 @@
+"""Tests for the shared news service."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime
+from f1_news.models import NewsItem, RaceResult, RaceResults
+from f1_news.service import (NewsService, news_item_from_dict, news_item_to_dict, race_results_from_dict,
+                             race_results_to_dict)
+
+
+def make_service(max_age=300):
+    rss_source = Mock()
+    rss_source.iter_news.side_effect = lambda: iter([
+        NewsItem(title="Hamilton wins", content="Mercedes celebrates", url="https://example.com/1",
+                 source="test", timestamp=datetime(2024, 1, 2)),
+        NewsItem(title="Verstappen second", content="Red Bull", url="https://example.com/2",
+                 source="test", timestamp=datetime(2024, 1, 1)),
+    ])
+    result_source = Mock()
+    result_source.fetch_latest_results.return_value = RaceResults(
+        race_name="Test Grand Prix", date=datetime(2024, 1, 1), circuit="Test Circuit",
+        results=[RaceResult(1, "Driver 1", "Team 1", points=25, total_time=5400.0)]
+    )
+    return NewsService(rss_source, result_source, max_age=max_age)
+
+
+class TestNewsService:
+    """Tests for NewsService."""
+    
+    def test_news_fetches_once(self):
+        """Test repeated requests are served from the snapshot."""
+        service = make_service()
+        
+        assert [item.title for item in service.news(limit=5)] == ["Hamilton wins", "Verstappen second"]
+        assert [item.title for item in service.news(limit=1, driver="verstappen")] == ["Verstappen second"]
+        assert service.rss_source.iter_news.call_count == 1
+    
+    def test_concurrent_cold_requests_fetch_once(self):
+        """Test many clients hitting a cold cache cause a single upstream fetch."""
+        service = make_service()
+        fetch = service.rss_source.iter_news.side_effect
+        service.rss_source.iter_news.side_effect = lambda: (time.sleep(0.1), fetch())[1]
+        
+        threads = [threading.Thread(target=service.news) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert service.rss_source.iter_news.call_count == 1
+    
+    def test_slow_results_do_not_block_news(self):
+        """Test a cold news request is not held up by a results fetch in progress."""
+        service = make_service()
+        release = threading.Event()
+        results = service.result_source.fetch_latest_results.return_value
+        service.result_source.fetch_latest_results.side_effect = lambda **kwargs: (release.wait(5), results)[1]
+        thread = threading.Thread(target=service.results)
+        thread.start()
+        
+        try:
+            assert len(service.news()) == 2
+            assert thread.is_alive()
+        finally:
+            release.set()
+            thread.join()
+    
+    def test_subscribers_notified(self):
+        """Test listeners receive the previous and current snapshots."""
+        service = make_service()
+        calls = []
+        service.subscribe(lambda *args: calls.append(args))
+        
+        service.refresh_news()
+        service.refresh_news()
+        
+        assert calls[0][0] == 'news' and calls[0][2] is None
+        assert calls[1][2] == calls[0][3]
+    
+    def test_stale_snapshot_is_refetched(self):
+        """Test a snapshot older than max_age is fetched again."""
+        service = make_service(max_age=60)
+        service.news()
+        
+        with patch('f1_news.service.time.monotonic', return_value=10 ** 9):
+            service.news()
+        
+        assert service.rss_source.iter_news.call_count == 2
+    
+    def test_results_cached_per_session_type(self):
+        """Test results are cached per session type and refreshed together."""
+        service = make_service()
+        service.results('race')
+        service.results('race')
+        service.results('qualifying')
+        
+        assert service.result_source.fetch_latest_results.call_count == 2
+        
+        service.refresh_all()
+        
+        assert service.result_source.fetch_latest_results.call_count == 4
+    
+    def test_fallback_results_keep_previous(self):
+        """Test placeholder results from an OpenF1 failure neither replace nor announce anything."""
+        service = make_service()
+        real = service.results('race')
+        calls = []
+        service.subscribe(lambda *args: calls.append(args))
+        service.result_source.fetch_latest_results.return_value = RaceResults(
+            race_name="Mock Grand Prix (API Error)", date=datetime(2024, 1, 1), circuit="Mock Circuit",
+            results=[], fallback=True
+        )
+        
+        assert service.refresh_results('race') is real
+        assert service.results('race') is real
+        assert calls == []
+    
+    def test_fallback_results_are_cached_briefly(self):
+        """Test a session type that has only failed is served from memory, then retried."""
+        service = make_service()
+        service.result_source.fetch_latest_results.return_value = RaceResults(
+            race_name="Mock Grand Prix (API Error)", date=datetime(2024, 1, 1), circuit="Mock Circuit",
+            results=[], fallback=True
+        )
+        
+        assert service.results('race').fallback
+        assert service.results('race').fallback
+        assert service.result_source.fetch_latest_results.call_count == 1
+        
+        with patch('f1_news.service.time.monotonic', return_value=10 ** 9):
+            service.results('race')
+        
+        assert service.result_source.fetch_latest_results.call_count == 2
+    
+    def test_refresh_all_retries_failed_session_types(self):
+        """Test the background refresh retries session types that have only failed."""
+        service = make_service()
+        real = service.result_source.fetch_latest_results.return_value
+        service.result_source.fetch_latest_results.return_value = RaceResults(
+            race_name="Mock Grand Prix (API Error)", date=datetime(2024, 1, 1), circuit="Mock Circuit",
+            results=[], fallback=True
+        )
+        service.results('qualifying')
+        service.result_source.fetch_latest_results.return_value = real
+        
+        service.refresh_all()
+        
+        assert service.results('qualifying') is real
+
+
+class TestSerialization:
+    """Tests for the wire format shared by the daemon and HTTP API."""
+    
+    def test_news_item_round_trip(self):
+        """Test a news item survives serialization."""
+        item = NewsItem(title="News", content="Body", url="https://example.com", source="test",
+                        timestamp=datetime(2024, 1, 1, 12, 0), tags=["f1"])
+        
+        assert news_item_from_dict(news_item_to_dict(item)) == item
+    
+    def test_race_results_round_trip(self):
+        """Test session results keep their numeric fields."""
+        race_results = RaceResults(
+            race_name="Test Qualifying", date=datetime(2024, 1, 1), circuit="Test Circuit",
+            results=[RaceResult(1, "Driver 1", "Team 1", fastest_lap_time=75.5, segment_times=[77.0, 76.0, 75.5])]
+        )
+        
+        restored = race_results_from_dict(race_results_to_dict(race_results))
+        
+        assert restored == race_results
@@ -41,6 +41,36 @@ class TestRSSSource:
         assert news_items[0].content == "Test summary"
         assert news_items[0].url == "https://example.com"
     
+    @patch('f1_news.sources.feedparser.parse')
+    def test_iter_news_merges_feeds_newest_first(self, mock_parse):
+        """Test the merged stream is ordered newest first across feeds."""
+        def make_feed(days):
+            feed = Mock()
+            feed.entries = []
+            for day in days:
+                entry = Mock()
+                entry.title = f"Day {day}"
+                entry.summary = ""
+                entry.link = f"https://example.com/{day}"
+                entry.published_parsed = (2024, 1, day, 12, 0, 0, 0, 1, 0)
+                feed.entries.append(entry)
+            return feed
+        
+        feeds = {
+            "https://a.example/rss": make_feed([1, 5, 3]),
+            "https://b.example/rss": make_feed([4, 2]),
+        }
+        mock_parse.side_effect = lambda url: feeds[url]
+        
+        source = RSSSource()
+        source.rss_feeds = {"a": "https://a.example/rss", "b": "https://b.example/rss"}
+        source.source_names = {"a": "A", "b": "B"}
+        
+        titles = [item.title for item in source.iter_news()]
+        
+        assert titles == ["Day 5", "Day 4", "Day 3", "Day 2", "Day 1"]
+        assert [item.title for item in source.fetch_news(limit=2)] == ["Day 5", "Day 4"]
+    
     @patch('f1_news.sources.feedparser.parse')
     def test_fetch_news_with_error(self, mock_parse):
         """Test RSS fetching with error handling."""
@@ -0,0 +1,61 @@
+"""Startup-time guards: heavy dependencies must only load when a command needs them."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that are slow to import and only needed once data is fetched or rendered
+HEAVY_MODULES = {'tweepy', 'praw', 'feedparser', 'requests', 'numpy', 'rich'}
+# Standard-library modules only the archive, server, daemon and --memprofile need
+SUBCOMMAND_MODULES = {'sqlite3', 'http.server', 'socketserver', 'tracemalloc'}
+
+
+def imported_modules(code):
+    """Modules and their top-level packages imported while running ``code``, as reported by ``python -X importtime``."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            modules.add(name)
+            modules.add(name.split('.')[0])
+    return modules
+
+
+class TestStartup:
+    """Tests for lazy imports."""
+    
+    def test_import_cli_is_light(self):
+        """Test importing the CLI loads none of the heavy dependencies."""
+        modules = imported_modules("import f1_news.cli")
+        
+        assert 'f1_news' in modules
+        assert not modules & HEAVY_MODULES
+    
+    def test_import_cli_skips_subcommand_modules(self):
+        """Test importing the CLI loads neither the archive, server nor daemon machinery."""
+        modules = imported_modules("import f1_news.cli")
+        
+        assert 'f1_news.cli' in modules
+        assert not modules & SUBCOMMAND_MODULES
+    
+    def test_help_is_light(self):
+        """Test --help does not load any heavy dependency."""
+        modules = imported_modules("from f1_news.cli import main; main(['--help'], standalone_mode=False)")
+        
+        assert not modules & HEAVY_MODULES
+        assert not modules & SUBCOMMAND_MODULES
+    
+    def test_sources_command_skips_network_libraries(self):
+        """Test listing sources only loads Rich for rendering."""
+        modules = imported_modules("from f1_news.cli import main; main(['sources'], standalone_mode=False)")
+        
+        assert 'rich' in modules
+        assert not modules & (HEAVY_MODULES - {'rich'})
@@ -0,0 +1,103 @@
+"""Tests for per-stage timing and trace export."""
+
+import json
+import time
+import pytest
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from f1_news import tracing
+from f1_news.cli import main
+from f1_news.models import NewsItem
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.enable()
+    yield tracer
+    tracing.disable()
+
+
+class TestTracing:
+    """Tests for spans and their summaries."""
+    
+    def test_disabled_spans_do_nothing(self):
+        """Test spans and traced streams are pass-throughs while tracing is off."""
+        stream = iter([1, 2])
+        
+        assert tracing.traced('stage', stream) is stream
+        with tracing.span('stage'):
+            pass
+    
+    def test_self_time_excludes_nested_spans(self, tracer):
+        """Test a parent's self time leaves out time spent in its children."""
+        with tracing.span('outer'):
+            time.sleep(0.02)
+            with tracing.span('inner'):
+                time.sleep(0.05)
+        
+        stages = {stage.name: stage for stage in tracer.summary()}
+        
+        assert stages['outer'].total >= 0.07
+        assert 0.015 <= stages['outer'].self_time < 0.05
+        assert stages['inner'].self_time >= 0.05
+    
+    def test_traced_stream_times_each_pull(self, tracer):
+        """Test every pull from a traced stream is a span nested under its consumer."""
+        def slow_stream():
+            for i in range(3):
+                time.sleep(0.01)
+                yield i
+        
+        with tracing.span('consume'):
+            assert list(tracing.traced('produce', slow_stream())) == [0, 1, 2]
+        
+        stages = {stage.name: stage for stage in tracer.summary()}
+        
+        assert stages['produce'].calls == 4
+        assert stages['produce'].self_time >= 0.03
+        assert stages['consume'].self_time < stages['produce'].self_time
+    
+    def test_chrome_trace(self, tracer):
+        """Test spans export as complete events with thread names."""
+        with tracing.span('fetch_feed', 'rss', source='autosport'):
+            pass
+        
+        events = tracer.chrome_trace()['traceEvents']
+        complete = [event for event in events if event['ph'] == 'X']
+        
+        assert complete[0]['name'] == 'fetch_feed'
+        assert complete[0]['cat'] == 'rss'
+        assert complete[0]['args'] == {'source': 'autosport'}
+        assert any(event['ph'] == 'M' and event['name'] == 'thread_name' for event in events)
+    
+    def test_disabled_overhead_is_negligible(self):
+        """Test a disabled span costs well under a microsecond or two."""
+        start = time.perf_counter()
+        for _ in range(100000):
+            with tracing.span('stage', 'cat', key=1):
+                pass
+        
+        assert (time.perf_counter() - start) / 100000 < 2e-6
+
+
+class TestTimingsOption:
+    """Tests for --timings and --trace-file."""
+    
+    @patch('f1_news.cli.RSSSource')
+    def test_timings_and_trace_file(self, mock_rss_source, tmp_path):
+        """Test a traced fetch prints stage timings, writes a trace and switches tracing off."""
+        mock_source = Mock()
+        mock_source.iter_news.return_value = iter([
+            NewsItem(title="Ferrari news", content="", url="https://example.com/1", source="test"),
+        ])
+        mock_rss_source.return_value = mock_source
+        trace_file = tmp_path / 'trace.json'
+        
+        result = CliRunner().invoke(main, ['--timings', '--trace-file', str(trace_file), '--format', 'ndjson'])
+        
+        assert result.exit_code == 0
+        assert 'Timings' in result.stderr
+        assert 'format' in result.stderr
+        names = {event['name'] for event in json.loads(trace_file.read_text())['traceEvents']}
+        assert {'read_feeds', 'rank', 'format'} <= names
+        assert tracing._tracer is None
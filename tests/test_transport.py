@@ -0,0 +1,134 @@
+"""Tests for the record/replay transport and the stand-in server."""
+
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from f1_news.sources import RaceResultSource, RSSSource
+from f1_news.standin import RecordedUpstream, StandinServer, SyntheticUpstream
+from f1_news.transport import ReplayMissError, from_environment, standin_url
+
+
+@pytest.fixture
+def standin():
+    server = StandinServer(SyntheticUpstream(entries=5, drivers=4, laps=20))
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def fetch_everything():
+    news = RSSSource().fetch_news(limit=100)
+    results = RaceResultSource().fetch_latest_results('race')
+    return [item.url for item in news], [(r.position, r.driver, r.total_time) for r in results.results]
+
+
+class TestTransport:
+    """Tests for selecting a transport from the environment."""
+
+    def test_default_is_unchanged(self, monkeypatch):
+        """Test no variables leaves the given session alone."""
+        for name in ('F1NEWS_REPLAY', 'F1NEWS_RECORD', 'F1NEWS_STANDIN'):
+            monkeypatch.delenv(name, raising=False)
+        session = object()
+
+        assert from_environment() is None
+        assert from_environment(session) is session
+
+    def test_standin_url(self):
+        """Test upstream URLs map to host-prefixed paths on the stand-in."""
+        assert (standin_url('http://127.0.0.1:8765/', 'https://api.openf1.org/v1/laps?session_key=1')
+                == 'http://127.0.0.1:8765/api.openf1.org/v1/laps?session_key=1')
+
+    def test_replay_miss(self, tmp_path, monkeypatch):
+        """Test a replayed run fails loudly on a URL that was never recorded."""
+        monkeypatch.setenv('F1NEWS_REPLAY', str(tmp_path))
+
+        with pytest.raises(ReplayMissError):
+            RaceResultSource().find_latest_session('race')
+
+
+class TestStandin:
+    """End-to-end tests against the stand-in server, with no network."""
+
+    def test_sources_use_standin(self, standin, monkeypatch):
+        """Test both sources fetch from the stand-in when F1NEWS_STANDIN is set."""
+        monkeypatch.setenv('F1NEWS_STANDIN', standin.url)
+
+        urls, results = fetch_everything()
+
+        assert len(urls) == 5 * len(RSSSource().rss_feeds)
+        assert len(results) == 4 and results[0][0] == 1
+        assert RaceResultSource().fetch_latest_results('race').race_name == "Synthetic Grand Prix"
+
+    def test_record_then_replay(self, standin, tmp_path, monkeypatch):
+        """Test a recorded run replays identically once the stand-in is gone."""
+        monkeypatch.setenv('F1NEWS_STANDIN', standin.url)
+        monkeypatch.setenv('F1NEWS_RECORD', str(tmp_path))
+        recorded = fetch_everything()
+        standin.shutdown()
+
+        monkeypatch.delenv('F1NEWS_STANDIN')
+        monkeypatch.delenv('F1NEWS_RECORD')
+        monkeypatch.setenv('F1NEWS_REPLAY', str(tmp_path))
+
+        assert fetch_everything() == recorded
+
+    def test_serves_recordings(self, standin, tmp_path, monkeypatch):
+        """Test a stand-in can serve a recorded directory."""
+        monkeypatch.setenv('F1NEWS_STANDIN', standin.url)
+        monkeypatch.setenv('F1NEWS_RECORD', str(tmp_path))
+        recorded = fetch_everything()
+        monkeypatch.delenv('F1NEWS_RECORD')
+
+        replaying = StandinServer(RecordedUpstream(tmp_path))
+        replaying.start()
+        try:
+            monkeypatch.setenv('F1NEWS_STANDIN', replaying.url)
+            assert fetch_everything() == recorded
+        finally:
+            replaying.shutdown()
+            replaying.server_close()
+
+    def test_injected_errors(self, monkeypatch):
+        """Test failing upstreams exercise the sources' error handling."""
+        server = StandinServer(SyntheticUpstream(entries=5), error_rate=1.0)
+        server.start()
+        try:
+            monkeypatch.setenv('F1NEWS_STANDIN', server.url)
+
+            assert RSSSource().fetch_news(limit=10) == []
+            assert "API Error" in RaceResultSource().fetch_latest_results('race').race_name
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_draws_are_deterministic(self):
+        """Test the same seed gives the same delays and failures."""
+        def draws(seed):
+            server = StandinServer(SyntheticUpstream(entries=1), latency=0.01, jitter=0.05, error_rate=0.3, seed=seed)
+            server.server_close()
+            return [server.draw() for _ in range(20)]
+
+        assert draws(1) == draws(1)
+        assert draws(1) != draws(2)
+        assert any(fail for _, fail in draws(1)) and not all(fail for _, fail in draws(1))
+
+    def test_concurrent_requests_overlap(self, monkeypatch):
+        """Test slow responses are served concurrently, as needed for load tests."""
+        server = StandinServer(SyntheticUpstream(entries=1), latency=0.2)
+        server.start()
+        try:
+            monkeypatch.setenv('F1NEWS_STANDIN', server.url)
+            source = RaceResultSource()
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                list(executor.map(lambda _: source.fetch_drivers(1), range(10)))
+            elapsed = time.perf_counter() - start
+
+            assert server.requests_served == 10
+            assert elapsed < 1.0
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,172 @@
+"""Tests for calendar-driven session cache warming."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from f1_news.cache import Cache
+from f1_news.sources import RaceResultSource
+from f1_news.warming import CALENDAR_TTL, RECHECK_INTERVAL, SETTLE_DELAY, ResponseCache, SessionWarmer
+
+NOW = datetime(2024, 7, 21, 16, 0, tzinfo=timezone.utc)
+
+
+def make_session(key, session_type, ended_ago):
+    end = NOW - timedelta(seconds=ended_ago)
+    return {
+        'session_key': key,
+        'session_type': session_type,
+        'session_name': session_type,
+        'country_name': 'Hungary',
+        'location': 'Budapest',
+        'date_start': (end - timedelta(hours=2)).isoformat(),
+        'date_end': end.isoformat(),
+    }
+
+
+def make_http(sessions, payloads):
+    """A fake HTTP session answering the calendar and per-session endpoints."""
+    def get(url, **kwargs):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        if '/sessions' in url:
+            response.json.return_value = sessions
+        else:
+            response.json.return_value = payloads(url)
+        return response
+    http = Mock()
+    http.get.side_effect = get
+    return http
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    return ResponseCache(Cache(tmp_path))
+
+
+class TestSessionWarmer:
+    """Tests for SessionWarmer."""
+
+    def test_pending_sessions(self, response_cache):
+        """Test only sessions that ended recently, after the settle delay, are warmed."""
+        sessions = [
+            make_session(1, 'Practice', ended_ago=86400),
+            make_session(2, 'Qualifying', ended_ago=SETTLE_DELAY + 60),
+            make_session(3, 'Race', ended_ago=-7200),
+            make_session(4, 'Race', ended_ago=10),
+        ]
+        warmer = SessionWarmer(RaceResultSource(), response_cache)
+
+        assert [session['session_key'] for session in warmer.pending(sessions, NOW)] == [2]
+        assert warmer.next_wakeup(sessions, NOW) == RECHECK_INTERVAL
+
+    def test_next_wakeup_is_next_session_end(self, response_cache):
+        """Test an idle warmer sleeps until shortly after the next session ends."""
+        sessions = [make_session(1, 'Race', ended_ago=-3600)]
+        warmer = SessionWarmer(RaceResultSource(), response_cache)
+
+        assert warmer.next_wakeup(sessions, NOW) == 3600 + SETTLE_DELAY
+
+    def test_sessions_without_end_time_are_not_finished(self, response_cache):
+        """Test sessions whose date_end is null or missing are neither warmed nor scheduled."""
+        sessions = [make_session(1, 'Race', ended_ago=SETTLE_DELAY + 60), make_session(2, 'Race', ended_ago=-3600)]
+        sessions[0]['date_end'] = None
+        del sessions[1]['date_end']
+        http = make_http(sessions, lambda url: [{'position': 1}])
+        warmer = SessionWarmer(RaceResultSource(http), response_cache)
+
+        assert warmer.pending(sessions, NOW) == []
+        assert warmer.run_once(NOW) == {}
+        assert warmer.next_wakeup(sessions, NOW) == CALENDAR_TTL
+
+    def test_rechecks_until_stable(self, response_cache):
+        """Test a session is fetched until two passes agree, then served from the cache."""
+        sessions = [make_session(9, 'Race', ended_ago=600)]
+        payload = {'value': 1}
+        http = make_http(sessions, lambda url: [dict(payload, url=url)])
+        warmer = SessionWarmer(RaceResultSource(http), response_cache)
+
+        assert warmer.run_once(NOW) == {'Hungary Grand Prix': False}
+
+        payload['value'] = 2
+        assert warmer.run_once(NOW) == {'Hungary Grand Prix': False}
+        assert warmer.run_once(NOW) == {'Hungary Grand Prix': True}
+        assert warmer.run_once(NOW) == {}
+
+        source = RaceResultSource(Mock(), cache=response_cache)
+        laps_url = f"{source.base_url}/laps?session_key=9"
+
+        assert source._get(laps_url).json() == [{'value': 2, 'url': laps_url}]
+        assert not source.http.get.called
+
+    def test_empty_data_is_never_stable(self, response_cache):
+        """Test a session whose data has not landed keeps being rechecked."""
+        sessions = [make_session(9, 'Race', ended_ago=600)]
+        warmer = SessionWarmer(RaceResultSource(make_http(sessions, lambda url: [])), response_cache)
+
+        for _ in range(3):
+            assert warmer.run_once(NOW) == {'Hungary Grand Prix': False}
+
+    def test_state_survives_restart(self, response_cache):
+        """Test a stable session is not fetched again by a new warmer."""
+        sessions = [make_session(9, 'Race', ended_ago=600)]
+        http = make_http(sessions, lambda url: [{'url': url}])
+        warmer = SessionWarmer(RaceResultSource(http), response_cache)
+        warmer.run_once(NOW)
+        warmer.run_once(NOW)
+
+        assert SessionWarmer(RaceResultSource(http), response_cache).run_once(NOW) == {}
+
+    def test_requests_time_out(self, response_cache):
+        """Test neither the warmer nor the source waits on a stalled OpenF1 connection forever."""
+        sessions = [make_session(9, 'Race', ended_ago=600)]
+        http = make_http(sessions, lambda url: [{'url': url}])
+        SessionWarmer(RaceResultSource(http), response_cache).run_once(NOW)
+        RaceResultSource(http).find_latest_session('race')
+
+        assert all(call.kwargs.get('timeout') == 30 for call in http.get.call_args_list)
+
+    def test_loop_survives_calendar_errors(self, response_cache, monkeypatch, capsys):
+        """Test a failed calendar fetch is retried after RECHECK_INTERVAL instead of ending the loop."""
+        sessions = [make_session(9, 'Race', ended_ago=600)]
+        http = make_http(sessions, lambda url: [{'url': url}])
+        get = http.get.side_effect
+        calls = []
+
+        def flaky_get(url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                raise ConnectionError("calendar down")
+            return get(url, **kwargs)
+
+        http.get.side_effect = flaky_get
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr('f1_news.warming.time.sleep', sleep)
+        warmer = SessionWarmer(RaceResultSource(http), response_cache)
+
+        with pytest.raises(KeyboardInterrupt):
+            warmer.run_forever()
+
+        assert sleeps[0] == RECHECK_INTERVAL
+        assert "calendar down" in capsys.readouterr().err
+        assert len(calls) == 2 and '/sessions' in calls[1]
+
+
+class TestLatestSession:
+    """Tests for choosing the latest session from the calendar."""
+
+    def test_scheduled_sessions_skipped(self):
+        """Test sessions that have not started yet are not treated as the latest."""
+        now = datetime.now(timezone.utc)
+        sessions = [
+            {'session_key': 1, 'session_type': 'Race', 'date_start': (now - timedelta(days=7)).isoformat()},
+            {'session_key': 2, 'session_type': 'Race', 'date_start': (now + timedelta(days=7)).isoformat()},
+        ]
+        source = RaceResultSource(make_http(sessions, lambda url: []))
+
+        assert source.find_latest_session('race')['session_key'] == 1